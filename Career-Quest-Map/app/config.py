@@ -3,6 +3,8 @@ import os
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from core.catalog_engine import DEFAULT_CATALOG_PATH
+
 load_dotenv()
 
 
@@ -19,5 +21,34 @@ class AppConfig:
         "AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
     azure_deployment: str | None = os.getenv("AZURE_OPENAI_DEPLOYMENT")
 
+    # Shared HTTP connection pool for LLM calls
+    llm_max_connections: int = 8
+    llm_keepalive_s: float = 60.0
+
+    # LLM retries (jittered exponential backoff) and circuit breaker
+    llm_retry_attempts: int = 3
+    llm_retry_base_s: float = 0.5
+    llm_retry_max_s: float = 8.0
+    llm_retry_budget_s: float = 20.0
+    llm_breaker_failures: int = 4
+    llm_breaker_cooldown_s: float = 30.0
+
+    # HTTP timeout per LLM request, and the latency SLO of each stage: a
+    # generate_* call that runs past its SLO returns cached / fallback content.
+    llm_timeout_s: float = 30.0
+    slo_part1_s: float = 15.0
+    slo_part2_s: float = 25.0
+    slo_analysis_s: float = 25.0
+    slo_gate_s: float = 35.0
+
     # Save file
     save_dir: str = os.path.join(os.getcwd(), "Output")
+
+    # On-disk LLM response cache (under save_dir)
+    cache_enabled: bool = True
+    cache_ttl_s: float = 7 * 24 * 3600
+    cache_max_bytes: int = 16 * 1024 * 1024
+
+    # Deterministic gate scenes / option ranking from data/options_catalog.json
+    catalog_enabled: bool = True
+    catalog_path: str = DEFAULT_CATALOG_PATH
@@ -0,0 +1,141 @@
+"""
+Micro-benchmark: LLM client constructions and HTTP connection setups
+across one full playthrough (Part 1, Part 2, analysis, 3 gate scenes).
+
+Runs against a local fake Azure chat-completions server, so no credentials
+or network are needed. Compares the old per-call engine construction with
+the shared engine from core.engine_registry.
+
+Usage (from the Career-Quest-Map directory):
+    python -m benchmarks.bench_engine_registry
+"""
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict
+
+from app.config import AppConfig
+from core import engine_registry
+from core.content_engine import ContentEngine
+from core.fallback_content import fallback_analysis, fallback_gate, fallback_part1, fallback_part2
+from integrations import llm_client
+from integrations.llm_client import LLMClient
+
+
+EDUCATION = "Secondary School"
+
+
+# ------------------------------------------------------------
+# Fake Azure endpoint
+# ------------------------------------------------------------
+class _Counters:
+    connections = 0
+    requests = 0
+    llm_clients = 0
+
+
+def _content_for(prompt: str) -> Dict[str, Any]:
+    if "Schema A JSON" in prompt:
+        return fallback_part1(EDUCATION)
+    if "Schema B JSON" in prompt:
+        return fallback_part2(EDUCATION, [])
+    if "Schema C JSON" in prompt:
+        return fallback_analysis(EDUCATION, None, [], [])
+    return fallback_gate("Bench Option", work_path=False)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def setup(self) -> None:
+        super().setup()
+        _Counters.connections += 1
+
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        prompt = " ".join(str(m.get("content", "")) for m in body.get("messages", []))
+        _Counters.requests += 1
+        out = json.dumps({
+            "id": "bench",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "bench",
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": json.dumps(_content_for(prompt))},
+            }],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(out)))
+        self.end_headers()
+        self.wfile.write(out)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+# ------------------------------------------------------------
+# Playthrough
+# ------------------------------------------------------------
+def _playthrough(engine_for_call: Callable[[], ContentEngine]) -> None:
+    engine_for_call().gen_part1(EDUCATION, None)
+    engine_for_call().gen_part2(EDUCATION, [])
+    analysis = engine_for_call().gen_analysis(EDUCATION, None, ["Technology", "Business", "Design"], [])
+    for option in analysis.get("suggested_options", []):
+        engine_for_call().gen_gate_scene(option, work_path=False, education_status=EDUCATION)
+
+
+def _run(label: str, engine_for_call: Callable[[], ContentEngine]) -> None:
+    _Counters.connections = _Counters.requests = _Counters.llm_clients = 0
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):  # engine debug prints
+        _playthrough(engine_for_call)
+    ms = (time.perf_counter() - t0) * 1000
+    print(
+        f"{label:<12} requests={_Counters.requests:<3} llm_clients_built={_Counters.llm_clients:<3} "
+        f"connections_opened={_Counters.connections:<3} wall={ms:7.1f} ms"
+    )
+
+
+def main() -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cfg = AppConfig(
+        azure_endpoint=f"http://127.0.0.1:{server.server_address[1]}",
+        azure_api_key="bench",
+        azure_api_version="2024-02-15-preview",
+        azure_deployment="bench",
+    )
+
+    # Count every LLMClient construction, whichever path builds it.
+    original_init = llm_client.LLMClient.__init__
+
+    def counting_init(self: LLMClient, *args: Any, **kwargs: Any) -> None:
+        _Counters.llm_clients += 1
+        original_init(self, *args, **kwargs)
+
+    llm_client.LLMClient.__init__ = counting_init  # type: ignore[method-assign]
+    try:
+        def per_call() -> ContentEngine:
+            return ContentEngine(LLMClient(cfg.azure_endpoint, cfg.azure_api_key, cfg.azure_api_version, cfg.azure_deployment))
+
+        _run("per-call", per_call)
+        _run("registry", lambda: engine_registry.get_engine(cfg))
+        _run("registry x2", lambda: engine_registry.get_engine(cfg))
+        print(f"registry stats: {engine_registry.registry_stats()}")
+    finally:
+        llm_client.LLMClient.__init__ = original_init  # type: ignore[method-assign]
+        engine_registry.shutdown_engines()
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "options_catalog.json")
+
+POLY_COURSE = "poly_course"
+UNI_COURSE = "uni_course"
+CAREER = "career"
+
+_KIND_SECTIONS = {
+    POLY_COURSE: "courses_poly",
+    UNI_COURSE: "uni_courses",
+    CAREER: "careers_poly_work",
+}
+
+# Loose words the LLM uses for inferred fields -> catalog fields_vocab.
+_FIELD_ALIASES = {
+    "software": "Technology",
+    "computing": "Technology",
+    "it": "Technology",
+    "tech": "Technology",
+    "programming": "Technology",
+    "analytics": "Data",
+    "science": "Data",
+    "finance": "Business",
+    "accounting": "Business",
+    "marketing": "Business",
+    "management": "Business",
+    "art": "Design",
+    "arts": "Design",
+    "creative": "Design",
+    "health": "Healthcare",
+    "medicine": "Healthcare",
+    "medical": "Healthcare",
+    "teaching": "Education",
+    "architecture": "Built Environment",
+    "construction": "Built Environment",
+    "communication": "Media",
+    "communications": "Media",
+    "journalism": "Media",
+    "cyber": "Security",
+    "cybersecurity": "Security",
+}
+
+_WORD_SYNONYMS = {"app": "application", "apps": "application", "mgmt": "management"}
+
+_NAME_PREFIXES = ("diploma in ", "bachelor of ", "bachelors in ", "degree in ", "bsc in ", "ba in ")
+
+
+def _normalize_name(name: str) -> str:
+    s = re.sub(r"\(.*?\)", " ", str(name).lower())
+    s = re.sub(r"[^a-z0-9]+", " ", s).strip()
+    for p in _NAME_PREFIXES:
+        if s.startswith(p):
+            s = s[len(p):]
+    words = [_WORD_SYNONYMS.get(w, w) for w in s.split() if w != "junior"]
+    return " ".join(words)
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    name: str
+    kind: str
+    fields: Tuple[str, ...]
+    subjects: Tuple[str, ...]
+    employment_outlook_line: str
+    impact_lines: Tuple[str, ...]
+    work_style_line: Optional[str] = None
+    salary_outlook_line: Optional[str] = None
+
+
+def options_kind_for(education_status: Optional[str], poly_path_choice: Optional[str]) -> str:
+    """
+    Which catalog section suggested_options come from for this player.
+    """
+    if education_status == "Poly":
+        return CAREER if poly_path_choice == "Work" else UNI_COURSE
+    if education_status == "JC":
+        return UNI_COURSE
+    return POLY_COURSE
+
+
+class CatalogEngine:
+    """
+    Deterministic content tier built on data/options_catalog.json.
+
+    The catalog is indexed once (by normalized name and by field) and then
+    answers gate scenes and option ranking with zero LLM calls.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.fields_vocab: List[str] = [str(f) for f in data.get("fields_vocab", [])]
+        self.common_resources: List[str] = [str(r) for r in data.get("common_resources", [])]
+        self.entries: List[CatalogEntry] = []
+        self.by_name: Dict[str, List[CatalogEntry]] = {}
+        self.by_field: Dict[str, List[CatalogEntry]] = {f: [] for f in self.fields_vocab}
+        self._vocab_lower = {f.lower(): f for f in self.fields_vocab}
+
+        for kind, section in _KIND_SECTIONS.items():
+            for raw in data.get(section, []):
+                if not isinstance(raw, dict) or not raw.get("name"):
+                    continue
+                entry = CatalogEntry(
+                    name=str(raw["name"]),
+                    kind=kind,
+                    fields=tuple(str(f) for f in raw.get("fields", [])),
+                    subjects=tuple(str(s) for s in raw.get("subjects_to_study", raw.get("subjects_or_skills", []))),
+                    employment_outlook_line=str(raw.get("employment_outlook_line", "")),
+                    impact_lines=tuple(str(s) for s in raw.get("impact_lines", [])),
+                    work_style_line=raw.get("work_style_line"),
+                    salary_outlook_line=raw.get("salary_outlook_line"),
+                )
+                self.entries.append(entry)
+                self.by_name.setdefault(_normalize_name(entry.name), []).append(entry)
+                for f in entry.fields:
+                    self.by_field.setdefault(f, []).append(entry)
+
+    # ---------------- Lookup ----------------
+    def find(self, option_name: str, kind: Optional[str] = None) -> Optional[CatalogEntry]:
+        matches = self.by_name.get(_normalize_name(option_name))
+        if not matches:
+            return None
+        if kind is not None:
+            for e in matches:
+                if e.kind == kind:
+                    return e
+        return matches[0]
+
+    def map_field(self, field: str) -> Optional[str]:
+        """
+        Map a free-form inferred field ("Software", "Health Science") to fields_vocab.
+        """
+        s = str(field).strip().lower()
+        if s in self._vocab_lower:
+            return self._vocab_lower[s]
+        for word in re.findall(r"[a-z]+", s):
+            if word in self._vocab_lower:
+                return self._vocab_lower[word]
+            if word in _FIELD_ALIASES:
+                return _FIELD_ALIASES[word]
+        return None
+
+    # ---------------- Ranking ----------------
+    def rank_options(self, fields: List[str], kind: str, k: int = 3) -> List[str]:
+        """
+        Rank catalog entries of `kind` by overlap with `fields` (earlier fields weigh more).
+        """
+        weights: Dict[str, float] = {}
+        for i, f in enumerate(fields):
+            mapped = self.map_field(f)
+            if mapped is not None and mapped not in weights:
+                weights[mapped] = float(len(fields) - i)
+
+        scored: List[Tuple[float, int, str]] = []
+        for idx, e in enumerate(self.entries):
+            if e.kind != kind:
+                continue
+            score = sum(weights.get(f, 0.0) for f in e.fields)
+            scored.append((-score, idx, e.name))
+        scored.sort()
+        return [name for _, _, name in scored[:k]]
+
+    # ---------------- Gate scene (Schema D) ----------------
+    def gate_payload(self, option_name: str, work_path: bool, kind: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        entry = self.find(option_name, kind=kind)
+        if entry is None:
+            return None
+        if work_path and not (entry.salary_outlook_line and entry.work_style_line):
+            return None
+
+        subjects = list(entry.subjects) or ["the core basics"]
+        verb = "you will build skills in" if entry.kind == CAREER else "you will study"
+        info = [f"For {entry.name}, {verb}: {', '.join(subjects)}."]
+        if entry.employment_outlook_line:
+            info.append(entry.employment_outlook_line)
+        info.extend(f"Impact: {ln}" for ln in entry.impact_lines)
+        if len(info) < 3:
+            info.append("Start small, build a portfolio piece, and ask for feedback early.")
+
+        payload: Dict[str, Any] = {"info_dialog_lines": info[:7]}
+        if work_path:
+            payload["work_style_line"] = entry.work_style_line
+            payload["salary_outlook_line"] = entry.salary_outlook_line
+
+        first = subjects[0]
+        second = subjects[1] if len(subjects) > 1 else first
+        payload["dragon"] = {
+            "micro_quest_1_week": (
+                f"1-week micro quest: do 5 short sessions (under 60 minutes each) on {first} "
+                f"using a free beginner course, then write a one-page summary of what you made."
+            ),
+            "mini_project_1_month": (
+                f"1-month mini project: Plan a small {entry.name} project that uses {second}, "
+                f"Build it over two weeks, then Review it and present it to a friend or mentor."
+            ),
+            "resources": list(self.common_resources) or [
+                "Official documentation basics",
+                "Free online course intro",
+                "Beginner example project",
+                "Community forum Q&A",
+            ],
+        }
+        return payload
+
+
+@lru_cache(maxsize=None)
+def load_catalog(path: str = DEFAULT_CATALOG_PATH) -> CatalogEngine:
+    """
+    Parse and index the catalog once per process.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return CatalogEngine(json.load(f))
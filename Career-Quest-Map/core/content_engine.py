@@ -2,9 +2,19 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from core.schema import Errors, Node, SchemaError, array, error_keys, obj, render_hint, render_variants
 from core.validation import (
+    PART1,
+    QUESTION,
+    analysis_schema,
+    check_analysis,
+    check_gate,
+    check_part1,
+    check_part2,
+    gate_schema,
+    part2_schema,
     validate_part1,
     validate_part2,
     validate_analysis,
@@ -16,7 +26,13 @@ from core.fallback_content import (
     fallback_analysis,
     fallback_gate,
 )
+from core.catalog_engine import CatalogEngine, options_kind_for
+from core.json_repair import merge_questions, normalize_questions, question_prompts, salvage_json
+from core.json_stream import StringArrayStreamer
+from core.scoring_engine import ScoringEngine
+from core.response_cache import ResponseCache
 from integrations.llm_client import LLMClient
+from integrations.retry_policy import Deadline, LLMCallError, LLMUnavailableError
 
 
 # ------------------------------------------------------------
@@ -53,107 +69,26 @@ def _build_prompt(task: str, context_lines: List[str], schema_hint: str, hard_ru
 
 
 # ------------------------------------------------------------
-# Schema hints
+# Schema hints (rendered from the declarations in core.validation)
 # ------------------------------------------------------------
 def _schema_question() -> str:
-    return (
-        "Question schema (use only one per question depending on type):\n"
-        "- MCQ:\n"
-        '  {"id":"q1","type":"mcq","prompt":"...","options":["...","...","...","..."]}\n'
-        "- Slider:\n"
-        '  {"id":"q2","type":"slider","prompt":"...","scale":{"min":0,"max":10,"min_label":"...","max_label":"..."}}\n'
-        "- Rating:\n"
-        '  {"id":"q3","type":"rating","prompt":"...","scale":{"min":1,"max":5}}\n'
-        "- Text:\n"
-        '  {"id":"q4","type":"text","prompt":"...","placeholder":"..."}\n'
-        "Notes:\n"
-        "- Do not add extra keys.\n"
-        "- Prompts must be sequential (q1..qN)."
-    )
+    return render_variants(QUESTION)
 
 
 def _schema_part1() -> str:
-    return (
-        "Schema A JSON:\n"
-        "{\n"
-        '  "questions": [\n'
-        "    /* exactly 5 questions following the Question schema */\n"
-        "  ]\n"
-        "}\n\n"
-        f"{_schema_question()}"
-    )
+    return f"{render_hint(PART1, 'Schema A')}\n\n{_schema_question()}"
 
 
 def _schema_part2(is_poly: bool) -> str:
-    extra = (
-        '"poly_extra_question":{"id":"poly_path","type":"mcq","prompt":"...","options":["Work","Go to uni"]}'
-        if is_poly
-        else '"poly_extra_question":null'
-    )
-    return (
-        "Schema B JSON:\n"
-        "{\n"
-        '  "inferred_fields": ["field1","field2","field3"],\n'
-        '  "questions": [\n'
-        "    /* exactly 12 questions following the Question schema */\n"
-        "  ],\n"
-        f"  {extra}\n"
-        "}\n\n"
-        f"{_schema_question()}"
-    )
+    return f"{render_hint(part2_schema(is_poly), 'Schema B')}\n\n{_schema_question()}"
 
 
 def _schema_analysis(options_kind: str) -> str:
-    return (
-        "Schema C JSON:\n"
-        "{\n"
-        '  "strength_tags": ["...","...","..."],\n'
-        '  "work_style_tags": ["...","...","..."],\n'
-        '  "feedback_lines": ["...","..."],\n'
-        '  "suggested_options": ["...","...","..."]\n'
-        "}\n"
-        "Rules:\n"
-        "- strength_tags: exactly 3 lines with meaningful reasons\n"
-        "- work_style_tags: 3 to 4 lines with meaningful insights\n"
-        "- feedback_lines: 5 lines with realistic and impactful feedbacks\n"
-        "- suggested_options: exactly 3\n"
-        f"- suggested_options must be {options_kind} (specific names, not generic categories)"
-    )
+    return render_hint(analysis_schema(options_kind), "Schema C")
 
 
 def _schema_gate(work_path: bool) -> str:
-    # When work_path=True, include salary_outlook_line + work_style_line.
-    if work_path:
-        return (
-            "Schema D JSON:\n"
-            "{\n"
-            '  "info_dialog_lines": ["..."],\n'
-            '  "work_style_line": "...",\n'
-            '  "salary_outlook_line": "...",\n'
-            '  "dragon": {\n'
-            '    "micro_quest_1_week": "...",\n'
-            '    "mini_project_1_month": "...",\n'
-            '    "resources": ["...","...","..."]\n'
-            "  }\n"
-            "}\n"
-            "Rules:\n"
-            "- info_dialog_lines must include: subjects to study with real online resources(for example, links), employment outlook in safe wording, impact on people in details\n"
-            "- work_style_line must describe typical work style in that industry in details\n"
-            "- salary_outlook_line must be a safe range or qualitative phrasing for a poly fresh graduate"
-        )
-    return (
-        "Schema D JSON:\n"
-        "{\n"
-        '  "info_dialog_lines": ["..."],\n'
-        '  "dragon": {\n'
-        '    "micro_quest_1_week": "...",\n'
-        '    "mini_project_1_month": "...",\n'
-        '    "resources": ["...","...","..."]\n'
-        "  }\n"
-        "}\n"
-        "Rules:\n"
-        "- info_dialog_lines must include: subjects to study with real online resources(for example, links), employment outlook in safe wording, impact on people"
-    )
+    return render_hint(gate_schema(work_path), "Schema D")
 
 
 # ------------------------------------------------------------
@@ -189,6 +124,125 @@ def _dist_rules(distribution: List[str], start: int = 1) -> List[str]:
     return rules
 
 
+# ------------------------------------------------------------
+# Repair (re-request only the rejected parts of a payload)
+# ------------------------------------------------------------
+# Above this share of broken questions / fields a repair is no cheaper
+# than generating the payload again.
+MAX_REPAIR_SHARE = 0.5
+# A repair is already a second request; allow one more on top.
+REPAIR_RETRIES = 1
+
+REPAIR_QUESTION_RULES = [
+    "For mcq: 4 short options.",
+    "For slider: scale min=0 max=10 and provide meaningful min_label and max_label.",
+    "For rating: scale min=1 max=5.",
+    "For text: include a short placeholder.",
+]
+
+
+def _schema_repair(schema: Node, fields: List[str], questions: int = 0) -> str:
+    """
+    Hint for just the rejected `fields` of `schema` plus `questions` questions.
+    """
+    wanted = {k: schema["fields"][k] for k in fields if k in schema["fields"]}
+    if questions:
+        wanted["questions"] = array(QUESTION, questions, questions, noun="questions with only the requested ids")
+    hint = render_hint(obj(wanted), "Repair")
+    return f"{hint}\n\n{_schema_question()}" if questions else hint
+
+
+def _split_errors(errors: Errors) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    (top-level field -> reason, question id -> reason) from a check_* result.
+    The count error on "questions" itself is dropped: missing slots are
+    reported per id once the list is normalized.
+    """
+    fields: Dict[str, str] = {}
+    questions: Dict[str, str] = {}
+    for key, why in error_keys(errors).items():
+        name, _, index = key.partition("[")
+        if name == "questions" and index:
+            questions.setdefault(f"q{int(index[:-1]) + 1}", why)
+        elif name != "questions":
+            fields.setdefault(name, why)
+    return fields, questions
+
+
+def _past_repair(fields: Dict[str, str], questions: Dict[str, str], field_total: int, question_total: int) -> Optional[str]:
+    """
+    Why a payload with these rejected fields / question ids is not worth
+    repairing (more than MAX_REPAIR_SHARE of either broken), or None.
+    """
+    if question_total and len(questions) > question_total * MAX_REPAIR_SHARE:
+        return f"{len(questions)} of {question_total} questions unusable"
+    if field_total and len(fields) > field_total * MAX_REPAIR_SHARE:
+        return f"{len(fields)} of {field_total} fields unusable"
+    return None
+
+
+def _questions_repairable(payload: Any, check: Callable[[Any], Tuple[Any, Errors]], count: int) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    _, errors = check(dict(payload, questions=normalize_questions(payload.get("questions"), count)))
+    fields, bad = _split_errors(errors)
+    return _past_repair(fields, bad, 0, count) is None
+
+
+def _gate_repairable(payload: Any, work_path: bool) -> bool:
+    if not isinstance(payload, dict):
+        return False
+    fields, _ = _split_errors(check_gate(payload, need_salary=work_path)[1])
+    return _past_repair(fields, {}, len(gate_schema(work_path)["fields"]), 0) is None
+
+
+def _repair_prompt(
+    context_lines: List[str],
+    schema_hint: str,
+    rules: List[str],
+    fields: Dict[str, str],
+    questions: Dict[str, str],
+    distribution: Optional[List[str]] = None,
+    accepted_prompts: Optional[List[str]] = None,
+) -> str:
+    """
+    Follow-up prompt asking only for the rejected parts of a payload.
+    `fields` / `questions` map a top-level key / question id to the
+    reason it was rejected.
+    """
+    wanted = [*fields, "questions"] if questions else list(fields)
+    task = (
+        f"Repair a rejected response: return a JSON object with only these keys: {', '.join(wanted)}. "
+        "Everything else was accepted; do not repeat it."
+    )
+    ctx = list(context_lines)
+    if accepted_prompts:
+        ctx.append(f"accepted_question_prompts: {_compact_json(accepted_prompts)}")
+
+    hard = ["Output JSON only."]
+    for key, why in fields.items():
+        hard.append(f'Return a corrected "{key}" (rejected: {why}).')
+    if questions:
+        hard.append(f'"questions" must contain exactly {len(questions)} question(s): {", ".join(questions)}.')
+        for qid, why in questions.items():
+            t = distribution[int(qid[1:]) - 1] if distribution else None
+            kind = f' must be type "{t}"' if t else ""
+            hard.append(f'Question id "{qid}"{kind} (rejected: {why}).')
+        hard.append("Do not repeat any accepted question prompt.")
+    hard.extend(rules)
+    return _build_prompt(task, ctx, schema_hint, hard)
+
+
+def _poly_extra_question(peq: Any) -> Dict[str, Any]:
+    prompt = peq.get("prompt") if isinstance(peq, dict) else None
+    return {
+        "id": "poly_path",
+        "type": "mcq",
+        "prompt": prompt if isinstance(prompt, str) and prompt.strip() else "After poly, what is your plan?",
+        "options": ["Work", "Go to uni"],
+    }
+
+
 def _convert_question_for_ui(q: Dict[str, Any]) -> Dict[str, Any]:
     t = q.get("type")
     prompt = q.get("prompt", "")
@@ -254,20 +308,212 @@ def _print_questions(tag: str, payload: Dict[str, Any]) -> None:
 # Content Engine
 # ------------------------------------------------------------
 class ContentEngine:
-    def __init__(self, llm: LLMClient):
+    def __init__(
+        self,
+        llm: LLMClient,
+        cache: Optional[ResponseCache] = None,
+        catalog: Optional[CatalogEngine] = None,
+        slos: Optional[Dict[str, float]] = None,
+    ):
         self.llm = llm
+        self.cache = cache
+        self.catalog = catalog
+        self.scorer = ScoringEngine(catalog) if catalog is not None else None
+        # stage -> latency SLO in seconds (part1, part2, analysis, gate)
+        self.slos: Dict[str, float] = dict(slos or {})
+
+    def _deadline(self, stage: str, deadline: Optional[Deadline]) -> Optional[Deadline]:
+        """
+        The caller's deadline, else one from the stage SLO, else none.
+        """
+        if deadline is not None:
+            return deadline
+        slo = self.slos.get(stage)
+        return Deadline(slo) if slo else None
+
+    def _invoke_json(
+        self,
+        user_prompt: str,
+        validate: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        on_text: Optional[Callable[[str], None]] = None,
+        deadline: Optional[Deadline] = None,
+        repair: Optional[Callable[[Dict[str, Any], Optional[Deadline]], Dict[str, Any]]] = None,
+        usable: Optional[Callable[[Any], bool]] = None,
+    ) -> Dict[str, Any]:
+        """
+        LLM call through the response cache. `validate` returns the coerced
+        payload; only payloads that pass are stored, and a cached entry that
+        no longer validates is ignored. Without `validate` the cache is bypassed.
+        With on_text the completion is streamed; a cache hit is replayed as one chunk.
+        Malformed JSON is salvaged (see core.json_repair); a truncated
+        response whose remains fail `usable` counts as a parse failure, so
+        it is retried instead of repaired. When `validate` raises
+        SchemaError, its coerced payload is handed to `repair`, which
+        re-requests only the broken parts.
+        Raises LLMUnavailableError when the circuit is open or `deadline` passes.
+        """
+        key = None
+        if self.cache is not None and validate is not None:
+            key = ResponseCache.key(SYSTEM_RULES, user_prompt, getattr(self.llm, "deployment_name", None))
+            hit = self.cache.get(key)
+            if hit is not None:
+                try:
+                    if validate is not None:
+                        hit = validate(hit)
+                    if on_text is not None:
+                        on_text(_compact_json(hit))
+                    return hit
+                except ValueError:
+                    pass
+
+        parse = (lambda text: salvage_json(text, usable)) if usable is not None else salvage_json
+        if on_text is not None:
+            out = self.llm.stream_json(SYSTEM_RULES, user_prompt, on_text, deadline=deadline, parse=parse)
+        else:
+            out = self.llm.invoke_json(SYSTEM_RULES, user_prompt, deadline=deadline, parse=parse)
+        if not isinstance(out, dict):
+            raise ValueError("LLM payload must be a JSON object")
+        if validate is not None:
+            try:
+                out = validate(out)
+            except SchemaError as e:
+                if repair is None:
+                    raise
+                print(f"LLM payload rejected, repairing: {e}")
+                try:
+                    out = repair(e.value, deadline)
+                except LLMUnavailableError:
+                    raise
+                except LLMCallError as repair_err:
+                    raise ValueError(f"{e} (repair failed: {repair_err})") from repair_err
+                out = validate(out)
+        if key is not None:
+            self.cache.put(key, out)
+        return out
+
+    # ---------------- Repair ----------------
+    def _request_fix(self, prompt: str, deadline: Optional[Deadline]) -> Dict[str, Any]:
+        out = self.llm.invoke_json(
+            SYSTEM_RULES, prompt, max_retries=REPAIR_RETRIES, deadline=deadline, parse=salvage_json)
+        if not isinstance(out, dict):
+            raise ValueError("repair payload must be a JSON object")
+        return out
+
+    def _repair_questions(
+        self,
+        tag: str,
+        payload: Dict[str, Any],
+        schema: Node,
+        check: Callable[[Any], Tuple[Any, Errors]],
+        distribution: List[str],
+        context_lines: List[str],
+        deadline: Optional[Deadline],
+    ) -> Dict[str, Any]:
+        """
+        Schema A / B repair: keep the valid questions, re-request only the
+        broken ones (and any broken fields) and merge them back in.
+        """
+        count = len(distribution)
+        out, errors = check(dict(payload, questions=normalize_questions(payload.get("questions"), count)))
+        if not errors:
+            return out
+        fields, bad = _split_errors(errors)
+        why = _past_repair(fields, bad, 0, count)
+        if why:
+            raise ValueError(f"{tag.lower()}: {why}")
+
+        qs = out["questions"]
+        prompt = _repair_prompt(
+            context_lines,
+            _schema_repair(schema, list(fields), len(bad)),
+            REPAIR_QUESTION_RULES if bad else [],
+            fields,
+            bad,
+            distribution,
+            question_prompts(qs, skip=list(bad)),
+        )
+        fix = self._request_fix(prompt, deadline)
+        for key in fields:
+            if key in fix:
+                out[key] = fix[key]
+        if bad:
+            out["questions"], merged = merge_questions(qs, fix.get("questions"), list(bad))
+            if len(merged) < len(bad):
+                print(f"[{tag}] repair returned {len(merged)} of {len(bad)} questions")
+        print(f"[{tag}] repaired {', '.join([*fields, *bad])} instead of regenerating")
+        return out
+
+    def _repair_part2(
+        self,
+        payload: Dict[str, Any],
+        is_poly: bool,
+        context_lines: List[str],
+        deadline: Optional[Deadline],
+    ) -> Dict[str, Any]:
+        out = dict(payload)
+        fields, _ = _split_errors(check_part2(out, is_poly)[1])
+        if "poly_extra_question" in fields:
+            # Fully determined by the schema; no need to ask the model.
+            out["poly_extra_question"] = _poly_extra_question(out.get("poly_extra_question")) if is_poly else None
+        return self._repair_questions(
+            "Part2",
+            out,
+            part2_schema(is_poly),
+            lambda p: check_part2(p, is_poly),
+            PART2_DISTRIBUTION,
+            context_lines,
+            deadline,
+        )
+
+    def _repair_gate(
+        self,
+        payload: Dict[str, Any],
+        work_path: bool,
+        context_lines: List[str],
+        hard_rules: List[str],
+        deadline: Optional[Deadline],
+        streamed: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Schema D repair. Lines in `streamed` are already on screen, so a
+        repaired info_dialog_lines only adds lines after them.
+        """
+        out, errors = check_gate(payload, need_salary=work_path)
+        if not errors:
+            return out
+        schema = gate_schema(work_path)
+        fields, _ = _split_errors(errors)
+        why = _past_repair(fields, {}, len(schema["fields"]), 0)
+        if why:
+            raise ValueError(f"gate: {why}")
+
+        prompt = _repair_prompt(context_lines, _schema_repair(schema, list(fields)), hard_rules, fields, {})
+        fix = self._request_fix(prompt, deadline)
+        for key in fields:
+            if key in fix:
+                out[key] = fix[key]
+        if streamed and "info_dialog_lines" in fields and isinstance(out.get("info_dialog_lines"), list):
+            out["info_dialog_lines"] = list(streamed) + out["info_dialog_lines"][len(streamed):]
+        print(f"[Gate] repaired {', '.join(fields)} instead of regenerating")
+        return out
 
     # ---------------- Part 1 ----------------
-    def gen_part1(self, education_status: str, poly_course: Optional[str]) -> Dict[str, Any]:
+    def gen_part1(
+        self,
+        education_status: str,
+        poly_course: Optional[str],
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
         """
         Schema A:
         - Exactly 5 questions
         - Enforced types: 2 mcq, 1 slider, 1 rating, 1 text
         - Poly vs non-Poly topic focus
+        Past the deadline (default: the part1 SLO) the fallback questions are used.
         """
         if not getattr(self.llm, "enabled", False):
             out = fallback_part1(education_status)
-            validate_part1(out)
+            out = validate_part1(out)
             return out
 
         task = "Generate Part 1: exactly 5 sequential questions for the House."
@@ -300,13 +546,30 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_part1(), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
-        validate_part1(out)
+        try:
+            out = self._invoke_json(
+                user_prompt,
+                validate_part1,
+                deadline=self._deadline("part1", deadline),
+                repair=lambda p, d: self._repair_questions(
+                    "Part1", p, PART1, check_part1, PART1_DISTRIBUTION, context_lines, d),
+                usable=lambda p: _questions_repairable(p, check_part1, len(PART1_DISTRIBUTION)),
+            )
+        except (ValueError, LLMCallError) as e:
+            print(f"[Part1] {e}; using fallback questions")
+            out = fallback_part1(education_status)
+            out = validate_part1(out)
+            return out
         p1_q = _print_questions("Part1", out)
         return out
 
     # ---------------- Part 2 ----------------
-    def gen_part2(self, education_status: str, part1_answers: List[Any]) -> Dict[str, Any]:
+    def gen_part2(
+        self,
+        education_status: str,
+        part1_answers: List[Any],
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
         """
         Schema B:
         - Infer exactly 3 fields
@@ -318,7 +581,7 @@ class ContentEngine:
 
         if not getattr(self.llm, "enabled", False):
             out = fallback_part2(education_status, part1_answers)
-            validate_part2(out, is_poly=is_poly)
+            out = validate_part2(out, is_poly=is_poly)
             return out
 
         task = "Generate Part 2: infer 3 potential fields and ask 12 sequential narrowing questions for the Wise Man."
@@ -357,17 +620,23 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_part2(is_poly=is_poly), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
         try:
-            validate_part2(out, is_poly=is_poly)
+            out = self._invoke_json(
+                user_prompt,
+                lambda p: validate_part2(p, is_poly=is_poly),
+                deadline=self._deadline("part2", deadline),
+                repair=lambda p, d: self._repair_part2(p, is_poly, context_lines, d),
+                usable=lambda p: _questions_repairable(
+                    p, lambda q: check_part2(q, is_poly), len(PART2_DISTRIBUTION)),
+            )
             fields = out.get("inferred_fields", [])
             if isinstance(fields, list):
                 print(f"[Part2] inferred_fields: {fields}")
             _print_questions("Part2", out)
             return out
-        except Exception:
+        except (ValueError, LLMCallError):
             fallback = fallback_part2(education_status, part1_answers)
-            validate_part2(fallback, is_poly=is_poly)
+            fallback = validate_part2(fallback, is_poly=is_poly)
             return fallback
 
     # ---------------- Analysis ----------------
@@ -377,6 +646,7 @@ class ContentEngine:
         poly_path_choice: Optional[str],
         inferred_fields: List[str],
         part2_answers: List[Any],
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         """
         Schema C:
@@ -390,9 +660,7 @@ class ContentEngine:
         options_kind = "careers" if (education_status == "Poly" and poly_path_choice == "Work") else "courses"
 
         if not getattr(self.llm, "enabled", False):
-            out = fallback_analysis(education_status, poly_path_choice, inferred_fields, part2_answers)
-            validate_analysis(out, options_kind=options_kind)
-            return out
+            return self.quick_analysis(education_status, poly_path_choice, inferred_fields, part2_answers)
 
         task = "Produce analysis: strength tags, work style tags, short feedback lines, and 3 suggested options."
         context_lines = [
@@ -425,8 +693,35 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_analysis(options_kind), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
-        #validate_analysis(out, options_kind=options_kind)
+        try:
+            return self._invoke_json(
+                user_prompt,
+                lambda p: validate_analysis(p, options_kind=options_kind),
+                deadline=self._deadline("analysis", deadline),
+                usable=lambda p: not check_analysis(p, options_kind)[1],
+            )
+        except (ValueError, LLMCallError) as e:
+            print(f"[Analysis] LLM payload unusable, scoring locally: {e}")
+            return self.quick_analysis(education_status, poly_path_choice, inferred_fields, part2_answers)
+
+    def quick_analysis(
+        self,
+        education_status: str,
+        poly_path_choice: Optional[str],
+        inferred_fields: List[str],
+        part2_answers: List[Any],
+    ) -> Dict[str, Any]:
+        """
+        Schema C without an LLM call: scored from the answers against the
+        options catalog, or the static fallback when no catalog is loaded.
+        Fast enough to call on the render thread.
+        """
+        options_kind = "careers" if (education_status == "Poly" and poly_path_choice == "Work") else "courses"
+        if self.scorer is not None:
+            out = self.scorer.analyze(education_status, poly_path_choice, inferred_fields, part2_answers)
+        else:
+            out = fallback_analysis(education_status, poly_path_choice, inferred_fields, part2_answers)
+        out = validate_analysis(out, options_kind=options_kind)
         return out
 
     # ---------------- Gate Scene ----------------
@@ -436,6 +731,8 @@ class ContentEngine:
         work_path: bool,
         education_status: Optional[str] = None,
         poly_path_choice: Optional[str] = None,
+        on_line: Optional[Callable[[str], None]] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         """
         Schema D:
@@ -447,11 +744,22 @@ class ContentEngine:
             - include salary_outlook_line (safe range/qualitative for poly fresh grad)
             - include work_style_line
         - dragon quests feasible for Secondary/JC/Poly
+        on_line, if given, receives each info_dialog_lines entry as soon as
+        it has streamed in; the returned payload is still fully validated.
+        Options found in the catalog are answered locally without an LLM call.
         """
+        if self.catalog is not None:
+            kind = options_kind_for(education_status, poly_path_choice) if education_status else None
+            out = self.catalog.gate_payload(option_name, work_path, kind=kind)
+            if out is not None:
+                out = validate_gate(out, need_salary=work_path)
+                if on_line is not None:
+                    for ln in out["info_dialog_lines"]:
+                        on_line(ln)
+                return out
+
         if not getattr(self.llm, "enabled", False):
-            out = fallback_gate(option_name, work_path)
-            validate_gate(out, need_salary=work_path)
-            return out
+            return self._fallback_gate(option_name, work_path, on_line)
 
         edu = education_status or ""
         poly_choice = poly_path_choice or ""
@@ -500,6 +808,60 @@ class ContentEngine:
 
         user_prompt = _build_prompt(task, context_lines, _schema_gate(work_path), hard_rules)
 
-        out = self.llm.invoke_json(SYSTEM_RULES, user_prompt)
-        validate_gate(out, need_salary=work_path)
+        on_text: Optional[Callable[[str], None]] = None
+        streamer: Optional[StringArrayStreamer] = None
+        if on_line is not None:
+            streamer = StringArrayStreamer("info_dialog_lines")
+
+            def _feed(chunk: str) -> None:
+                for ln in streamer.feed(chunk):
+                    on_line(ln)
+
+            on_text = _feed
+
+        deadline = self._deadline("gate", deadline)
+
+        def call(on_text: Optional[Callable[[str], None]]) -> Dict[str, Any]:
+            return self._invoke_json(
+                user_prompt,
+                lambda p: validate_gate(p, need_salary=work_path),
+                on_text=on_text,
+                deadline=deadline,
+                repair=lambda p, d: self._repair_gate(
+                    p, work_path, context_lines, hard_rules, d, streamer.items if streamer is not None else None),
+                usable=lambda p: _gate_repairable(p, work_path),
+            )
+
+        try:
+            try:
+                return call(on_text)
+            except (ValueError, LLMCallError) as e:
+                if on_text is None or streamer.items or isinstance(e, LLMUnavailableError):
+                    raise
+                # No line reached the screen yet, so a fresh completion is safe.
+                print(f"[Gate] {e}; retrying without streaming")
+                return call(None)
+        except (ValueError, LLMCallError) as e:
+            streamed = list(streamer.items) if streamer is not None else []
+            if not streamed and not isinstance(e, LLMUnavailableError):
+                raise
+            print(f"[Gate] {e}; using fallback scene for '{option_name}'")
+            # Lines already streamed stay on screen and in the payload.
+            return self._fallback_gate(option_name, work_path, None if streamed else on_line, keep_lines=streamed)
+
+    def _fallback_gate(
+        self,
+        option_name: str,
+        work_path: bool,
+        on_line: Optional[Callable[[str], None]] = None,
+        keep_lines: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        out = fallback_gate(option_name, work_path)
+        if keep_lines:
+            # Pad the streamed lines up to the schema minimum.
+            out["info_dialog_lines"] = list(keep_lines) + out["info_dialog_lines"][:max(0, 3 - len(keep_lines))]
+        out = validate_gate(out, need_salary=work_path)
+        if on_line is not None:
+            for ln in out["info_dialog_lines"]:
+                on_line(ln)
         return out
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+
+# ------------------------------------------------------------
+# Content jobs
+# ------------------------------------------------------------
+@dataclass
+class ContentJob:
+    """
+    Handle for one background content request.
+
+    The game loop never blocks on the future: it calls
+    ContentPipeline.poll() once per frame and the on_done / on_error
+    callbacks run on the render thread once the worker has finished.
+    A job with a timeout is failed with TimeoutError once that long has
+    passed since submit(), whether it was running or still queued behind
+    busy workers; a late result is discarded. A queued job is cancelled,
+    but a running one cannot be interrupted and keeps its worker thread
+    until the call returns.
+    """
+    label: str
+    timeout: Optional[float] = None
+    on_done: Optional[Callable[[Any], None]] = None
+    on_error: Optional[Callable[[Exception], None]] = None
+    future: Optional[Future] = field(default=None, init=False)
+    submitted_at: float = field(default_factory=time.monotonic, init=False)
+    finished: bool = field(default=False, init=False)
+
+    def done(self) -> bool:
+        return self.finished
+
+    def timed_out(self, now: float) -> bool:
+        return self.timeout is not None and now - self.submitted_at > self.timeout
+
+
+class ContentPipeline:
+    """
+    Runs ContentEngine calls (LLM round-trips) on a small worker pool so
+    the Pygame loop can keep pumping events and animating.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        # max_workers also bounds how many requests run concurrently.
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="content")
+        self._lock = threading.Lock()
+        self._jobs: List[ContentJob] = []
+
+    def submit(
+        self,
+        label: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> ContentJob:
+        job = ContentJob(label=label, timeout=timeout, on_done=on_done, on_error=on_error)
+        job.future = self._pool.submit(fn, *args, **kwargs)
+        with self._lock:
+            self._jobs.append(job)
+        return job
+
+    def poll(self) -> int:
+        """
+        Dispatch callbacks for every job whose worker has finished.
+        Must be called from the render thread. Returns the number of jobs completed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            ready = [j for j in self._jobs if j.future.done() or j.timed_out(now)]
+            self._jobs = [j for j in self._jobs if j not in ready]
+
+        for job in ready:
+            job.finished = True
+            if not job.future.done():
+                # Frees the slot if still queued. A running worker cannot be
+                # interrupted; it keeps its thread and its result is ignored.
+                job.future.cancel()
+                err = TimeoutError(f"no result after {job.timeout:g}s")
+                if job.on_error is not None:
+                    job.on_error(err)
+                else:
+                    print(f"Content job '{job.label}' failed: {err}")
+                continue
+            try:
+                result = job.future.result()
+            except Exception as e:
+                if job.on_error is not None:
+                    job.on_error(e)
+                else:
+                    print(f"Content job '{job.label}' failed: {e}")
+                continue
+            if job.on_done is not None:
+                job.on_done(result)
+        return len(ready)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+    def shutdown(self, wait: bool = False) -> None:
+        with self._lock:
+            self._jobs = []
+        self._pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    import httpx
+
+from app.config import AppConfig
+from core.catalog_engine import CatalogEngine, load_catalog
+from core.content_engine import ContentEngine
+from core.response_cache import ResponseCache
+from integrations.llm_client import LLMClient
+from integrations.retry_policy import CircuitBreaker, RetryPolicy
+
+
+# ------------------------------------------------------------
+# Process-wide engine registry
+# ------------------------------------------------------------
+# One ContentEngine (and one keep-alive HTTP pool) per AppConfig, built
+# lazily on first use. Every generate_* call and every content worker
+# thread shares it, so per-call overhead is just the model latency.
+_lock = threading.Lock()
+_engines: Dict[AppConfig, ContentEngine] = {}
+_http_clients: Dict[AppConfig, httpx.Client] = {}
+_stats: Dict[str, int] = {
+    "lookups": 0,
+    "engines_built": 0,
+    "http_clients_built": 0,
+}
+
+
+def _build_engine(cfg: AppConfig) -> ContentEngine:
+    http_client: Optional[httpx.Client] = None
+    if cfg.azure_endpoint and cfg.azure_api_key and cfg.azure_api_version and cfg.azure_deployment:
+        import httpx
+
+        http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_connections=cfg.llm_max_connections,
+                max_keepalive_connections=cfg.llm_max_connections,
+                keepalive_expiry=cfg.llm_keepalive_s,
+            ),
+        )
+        _http_clients[cfg] = http_client
+        _stats["http_clients_built"] += 1
+
+    llm = LLMClient(
+        cfg.azure_endpoint,
+        cfg.azure_api_key,
+        cfg.azure_api_version,
+        cfg.azure_deployment,
+        http_client=http_client,
+        retry_policy=RetryPolicy(
+            max_attempts=cfg.llm_retry_attempts,
+            base_delay_s=cfg.llm_retry_base_s,
+            max_delay_s=cfg.llm_retry_max_s,
+            budget_s=cfg.llm_retry_budget_s,
+        ),
+        breaker=CircuitBreaker(cfg.llm_breaker_failures, cfg.llm_breaker_cooldown_s),
+        timeout_s=cfg.llm_timeout_s,
+    )
+    cache: Optional[ResponseCache] = None
+    if llm.enabled and cfg.cache_enabled:
+        cache = ResponseCache(
+            os.path.join(cfg.save_dir, "llm_cache"),
+            ttl_s=cfg.cache_ttl_s,
+            max_bytes=cfg.cache_max_bytes,
+        )
+    catalog: Optional[CatalogEngine] = None
+    if cfg.catalog_enabled:
+        try:
+            catalog = load_catalog(cfg.catalog_path)
+        except (OSError, ValueError) as e:
+            print(f"Options catalog unavailable: {e}")
+    _stats["engines_built"] += 1
+    slos = {
+        "part1": cfg.slo_part1_s,
+        "part2": cfg.slo_part2_s,
+        "analysis": cfg.slo_analysis_s,
+        "gate": cfg.slo_gate_s,
+    }
+    return ContentEngine(llm, cache=cache, catalog=catalog, slos=slos)
+
+
+def get_engine(cfg: Optional[AppConfig] = None) -> ContentEngine:
+    """
+    Return the shared ContentEngine for `cfg` (default: AppConfig()).
+    Thread-safe; the first caller pays the construction cost.
+    """
+    cfg = cfg or AppConfig()
+    with _lock:
+        _stats["lookups"] += 1
+        engine = _engines.get(cfg)
+        if engine is None:
+            engine = _build_engine(cfg)
+            _engines[cfg] = engine
+        return engine
+
+
+def shutdown_engines() -> None:
+    """
+    Close every pooled HTTP connection and forget the engines.
+    A later get_engine() call builds a fresh one.
+    """
+    with _lock:
+        for client in _http_clients.values():
+            try:
+                client.close()
+            except Exception as e:
+                print(f"Engine shutdown error: {e}")
+        _http_clients.clear()
+        _engines.clear()
+
+
+def registry_stats() -> Dict[str, int]:
+    with _lock:
+        return dict(_stats, live_engines=len(_engines))
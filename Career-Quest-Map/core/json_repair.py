@@ -0,0 +1,183 @@
+# FILE: src/core/json_repair.py
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Truncation points tried (latest first) before giving up on a payload.
+MAX_CUTS = 16
+
+_OPENERS = {"{": "}", "[": "]"}
+# What may follow an opener (after whitespace) in real JSON; prose such
+# as "[see below]" or "{as requested}" fails this.
+_FIRST_CHARS = {"{": '"}', "[": '{["]-0123456789tfn'}
+
+
+# ------------------------------------------------------------
+# Salvage
+# ------------------------------------------------------------
+def _starts(text: str) -> List[int]:
+    """
+    Positions of { and [ that can begin a JSON value.
+    """
+    out: List[int] = []
+    for i, ch in enumerate(text):
+        if ch in _OPENERS:
+            rest = text[i + 1:i + 65].lstrip()
+            if not rest or rest[0] in _FIRST_CHARS[ch]:
+                out.append(i)
+    return out
+
+
+def _cut_points(s: str) -> List[Tuple[int, str]]:
+    """
+    (prefix length, closing brackets) for every point where `s` can be
+    cut and closed into valid JSON: after an opened or closed container,
+    and just before a comma. Positions inside strings are skipped.
+    """
+    cuts: List[Tuple[int, str]] = []
+    stack: List[str] = []
+    in_str = False
+    esc = False
+    for i, ch in enumerate(s):
+        if in_str:
+            if esc:
+                esc = False
+            elif ch == "\\":
+                esc = True
+            elif ch == '"':
+                in_str = False
+            continue
+        if ch == '"':
+            in_str = True
+        elif ch in _OPENERS:
+            stack.append(_OPENERS[ch])
+            cuts.append((i + 1, "".join(reversed(stack))))
+        elif ch in "}]":
+            if not stack:
+                break
+            stack.pop()
+            cuts.append((i + 1, "".join(reversed(stack))))
+            if not stack:
+                break
+        elif ch == ",":
+            cuts.append((i, "".join(reversed(stack))))
+    return cuts
+
+
+def salvage_json(text: str, usable: Optional[Callable[[Any], bool]] = None) -> Any:
+    """
+    json.loads for model output that is not quite JSON.
+
+    - Leading prose and ```json fences are skipped, and anything after the
+      value is ignored. Each { or [ is tried in turn and the first
+      complete object wins (a complete array only when no object
+      follows); a bracketed bit of prose that does not decode is skipped
+      as a whole.
+    - A value that runs to the end of the text without closing is taken
+      as truncated: it is cut back to its last complete member and the
+      open arrays / objects are closed, so a response that ran out of
+      tokens keeps every item before the one it was writing. `usable`
+      then decides whether what is left is worth keeping.
+
+    Raises ValueError when nothing (usable) can be recovered, so
+    LLMClient treats it like any other parse failure and retries.
+    """
+    decoder = json.JSONDecoder()
+    first_error: Optional[ValueError] = None
+    found: List[Any] = []
+    skip_to = 0
+    for start in _starts(text):
+        if start < skip_to:
+            continue
+        try:
+            out, skip_to = decoder.raw_decode(text, start)
+            if isinstance(out, dict):
+                return out
+            found.append(out)
+            continue
+        except ValueError as e:
+            first_error = first_error or e
+        cuts = _cut_points(text[start:])
+        if cuts and not cuts[-1][1]:
+            # Closed but not JSON: skip everything inside it.
+            skip_to = start + cuts[-1][0]
+            continue
+        if found:
+            break
+        return _close_truncated(text[start:], cuts, usable, first_error)
+    if found:
+        return found[0]
+    raise first_error or ValueError("no JSON value in LLM output")
+
+
+def _close_truncated(
+    s: str,
+    cuts: List[Tuple[int, str]],
+    usable: Optional[Callable[[Any], bool]],
+    error: ValueError,
+) -> Any:
+    for pos, closers in reversed(cuts[-MAX_CUTS:]):
+        try:
+            out = json.loads(s[:pos] + closers)
+        except ValueError:
+            continue
+        if usable is not None and not usable(out):
+            raise ValueError(f"truncated JSON, too little recovered: {error}")
+        return out
+    raise error
+
+
+# ------------------------------------------------------------
+# Question lists
+# ------------------------------------------------------------
+def normalize_questions(qs: Any, count: int) -> List[Any]:
+    """
+    Exactly `count` slots with ids q1..qN by position. Extra questions
+    are dropped and missing ones are None, so the schema check reports
+    each broken slot in SchemaError.errors under its own path
+    ("$.questions[11]"), which error_keys() keeps apart per index.
+    """
+    items = list(qs) if isinstance(qs, list) else []
+    out: List[Any] = []
+    for i in range(count):
+        q = items[i] if i < len(items) else None
+        if isinstance(q, dict):
+            q = dict(q)
+            q["id"] = f"q{i + 1}"
+        out.append(q)
+    return out
+
+
+def merge_questions(qs: List[Any], fixes: Any, ids: List[str]) -> Tuple[List[Any], List[str]]:
+    """
+    Replace the questions listed in `ids` with the same-id questions from
+    `fixes` (a re-requested "questions" list). Returns the merged list
+    and the ids that came back.
+    """
+    by_id: Dict[str, Any] = {}
+    if isinstance(fixes, list):
+        for q in fixes:
+            if isinstance(q, dict) and q.get("id") in ids:
+                by_id.setdefault(q["id"], q)
+    # A model asked for one question sometimes numbers it from q1 again.
+    if not by_id and isinstance(fixes, list) and len(fixes) == len(ids):
+        by_id = {qid: q for qid, q in zip(ids, fixes) if isinstance(q, dict)}
+
+    out = list(qs)
+    merged: List[str] = []
+    for qid, q in by_id.items():
+        i = int(qid[1:]) - 1
+        if 0 <= i < len(out):
+            out[i] = dict(q, id=qid)
+            merged.append(qid)
+    return out, merged
+
+
+def question_prompts(qs: List[Any], skip: Optional[List[str]] = None) -> List[str]:
+    skip = skip or []
+    return [
+        q["prompt"] for q in qs
+        if isinstance(q, dict) and q.get("id") not in skip and isinstance(q.get("prompt"), str)
+    ]
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import List
+
+
+_WS = " \t\r\n"
+
+
+class StringArrayStreamer:
+    """
+    Incremental scanner for one array of strings inside a JSON object that
+    is still being generated, e.g. "info_dialog_lines" in Schema D.
+
+    feed() takes the next text chunk and returns the array items completed
+    by it, so the UI can show line 1 while the model is still writing the
+    rest. It does not validate the document; the caller still parses and
+    validates the full text once the stream ends.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self._key_re = re.compile(r'"' + re.escape(key) + r'"\s*:\s*\[')
+        self._buf = ""
+        self._pos = 0
+        self._state = "seek"  # seek -> items -> done
+        self.items: List[str] = []
+
+    def feed(self, chunk: str) -> List[str]:
+        if self._state == "done" or not chunk:
+            return []
+        self._buf += chunk
+
+        if self._state == "seek":
+            m = self._key_re.search(self._buf)
+            if m is None:
+                return []
+            self._pos = m.end()
+            self._state = "items"
+
+        new: List[str] = []
+        buf = self._buf
+        while True:
+            while self._pos < len(buf) and (buf[self._pos] in _WS or buf[self._pos] == ","):
+                self._pos += 1
+            if self._pos >= len(buf):
+                break
+            ch = buf[self._pos]
+            if ch == "]":
+                self._state = "done"
+                break
+            if ch != '"':
+                # Not an array of strings; leave it to the final parse.
+                self._state = "done"
+                break
+            try:
+                item, end = json.decoder.scanstring(buf, self._pos + 1)
+            except ValueError:
+                # String not terminated yet; wait for more text.
+                break
+            self._pos = end
+            new.append(item)
+
+        self.items.extend(new)
+        return new
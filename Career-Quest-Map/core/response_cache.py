@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+# Bump when the cached payload format changes; old entries are then ignored.
+CACHE_VERSION = 1
+
+
+class ResponseCache:
+    """
+    On-disk cache of validated LLM JSON responses.
+
+    Entries are content-addressed: the key is a hash of everything that
+    determines the response (system rules, built prompt, deployment), so
+    gen_part1 / gen_gate_scene calls with the same inputs are served from
+    disk. Entries expire after ttl_s, and the least recently used ones are
+    evicted once the directory grows past max_bytes.
+    """
+
+    def __init__(self, root: str, ttl_s: float, max_bytes: int, version: int = CACHE_VERSION):
+        self.root = os.path.join(root, f"v{version}")
+        self.ttl_s = ttl_s
+        self.max_bytes = max_bytes
+        self.version = version
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(system_rules: str, user_prompt: str, deployment: Optional[str]) -> str:
+        h = hashlib.sha256()
+        for part in (system_rules, user_prompt, deployment or ""):
+            h.update(part.encode("utf-8"))
+            h.update(b"\x00")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        try:
+            created = float(entry.get("created", 0)) if isinstance(entry, dict) else None
+        except (TypeError, ValueError):
+            created = None
+        if (
+            created is None
+            or entry.get("version") != self.version
+            or time.time() - created > self.ttl_s
+            or not isinstance(entry.get("payload"), dict)
+        ):
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # mtime doubles as the LRU timestamp.
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry["payload"]
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        entry = {"version": self.version, "created": time.time(), "payload": payload}
+        path = self._path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError as e:
+            print(f"Response cache write failed: {e}")
+            self._remove(tmp)
+            return
+        self._evict()
+
+    def _evict(self) -> None:
+        with self._lock:
+            try:
+                names = [n for n in os.listdir(self.root) if n.endswith(".json")]
+            except OSError:
+                return
+            entries = []
+            total = 0
+            for n in names:
+                p = os.path.join(self.root, n)
+                try:
+                    st = os.stat(p)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, p))
+                total += st.st_size
+            if total <= self.max_bytes:
+                return
+            entries.sort()
+            for _, size, p in entries:
+                if total <= self.max_bytes:
+                    break
+                self._remove(p)
+                total -= size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
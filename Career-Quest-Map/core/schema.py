@@ -0,0 +1,335 @@
+# FILE: src/core/schema.py
+from __future__ import annotations
+
+import copy
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# A schema node is a plain dict built by the helpers below. Nodes are
+# compiled once into checker closures (compile_schema) and rendered into
+# the prompt hints (render_hint / render_variants), so the validator and
+# the prompt are generated from the same declaration.
+Node = Dict[str, Any]
+Errors = List[Tuple[str, str]]
+Check = Callable[[Any], Tuple[Any, Errors]]
+
+
+# ------------------------------------------------------------
+# Declarations
+# ------------------------------------------------------------
+def string(example: str = "...", rule: Optional[str] = None) -> Node:
+    """
+    A string. Whitespace runs (newlines, tabs) are collapsed to single
+    spaces and the ends trimmed, since every string ends up in the UI.
+    """
+    return {"kind": "str", "example": example, "rule": rule}
+
+
+def number(example: float = 0) -> Node:
+    """
+    An int or float. Numeric strings ("10") are converted.
+    """
+    return {"kind": "num", "example": example}
+
+
+def const(value: Any, fix: bool = False) -> Node:
+    """
+    Exactly `value`. With fix=True a wrong or missing value is replaced
+    instead of reported.
+    """
+    return {"kind": "const", "value": value, "fix": fix}
+
+
+def null() -> Node:
+    return {"kind": "null"}
+
+
+def array(
+    item: Node,
+    min_items: int = 0,
+    max_items: Optional[int] = None,
+    examples: Any = None,
+    rule: Optional[str] = None,
+    noun: str = "items",
+) -> Node:
+    """
+    A list of `item`. Items past max_items are dropped, not reported.
+    `examples` is the number of placeholder items shown in the hint (or
+    the literal example list); it defaults to min_items.
+    """
+    return {
+        "kind": "array",
+        "item": item,
+        "min": min_items,
+        "max": max_items,
+        "examples": examples,
+        "rule": rule,
+        "noun": noun,
+    }
+
+
+def obj(fields: Dict[str, Node], inline: bool = False) -> Node:
+    """
+    A dict with the given fields, all required except null() ones.
+    Extra keys are kept as they are.
+    """
+    return {"kind": "obj", "fields": fields, "inline": inline}
+
+
+def tagged(
+    tag: str,
+    variants: Dict[str, Node],
+    title: str,
+    labels: Optional[Dict[str, str]] = None,
+    notes: Optional[List[str]] = None,
+) -> Node:
+    """
+    One of several obj() variants, picked by the value of `tag`.
+    """
+    return {
+        "kind": "tagged",
+        "tag": tag,
+        "variants": variants,
+        "title": title,
+        "labels": labels or {},
+        "notes": notes or [],
+    }
+
+
+def count_phrase(lo: int, hi: Optional[int]) -> str:
+    if hi is None:
+        return f"at least {lo}"
+    if lo == hi:
+        return f"exactly {lo}"
+    return f"{lo} to {hi}"
+
+
+def _compact(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+# ------------------------------------------------------------
+# Compiled validators
+# ------------------------------------------------------------
+class SchemaError(ValueError):
+    """
+    Every violation in a payload as (JSON path, message), plus `value`:
+    the payload after coercion, so callers can keep the parts that did
+    validate.
+    """
+
+    def __init__(self, name: str, errors: Errors, value: Any):
+        self.name = name
+        self.errors = errors
+        self.value = value
+        shown = "; ".join(f"{path}: {msg}" for path, msg in errors[:3])
+        more = f" (+{len(errors) - 3} more)" if len(errors) > 3 else ""
+        super().__init__(f"{name}: {shown}{more}")
+
+
+def _compile(node: Node) -> Callable[[Any, str, Errors], Any]:
+    kind = node["kind"]
+
+    if kind == "str":
+        def check_str(v: Any, path: str, errors: Errors) -> Any:
+            if not isinstance(v, str):
+                errors.append((path, "expected string"))
+                return v
+            return " ".join(v.split())
+        return check_str
+
+    if kind == "num":
+        def check_num(v: Any, path: str, errors: Errors) -> Any:
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                return v
+            if isinstance(v, str):
+                try:
+                    f = float(v)
+                    return int(f) if f.is_integer() else f
+                except ValueError:
+                    pass
+            errors.append((path, "expected number"))
+            return v
+        return check_num
+
+    if kind == "const":
+        value = node["value"]
+        fix = node["fix"]
+        expected = f"expected {_compact(value)}"
+
+        def check_const(v: Any, path: str, errors: Errors) -> Any:
+            if v == value:
+                return v
+            if fix:
+                return copy.deepcopy(value)
+            errors.append((path, expected))
+            return v
+        return check_const
+
+    if kind == "null":
+        def check_null(v: Any, path: str, errors: Errors) -> Any:
+            if v is not None:
+                errors.append((path, "expected null"))
+            return v
+        return check_null
+
+    if kind == "array":
+        item = _compile(node["item"])
+        lo, hi = node["min"], node["max"]
+        expected = f"expected {count_phrase(lo, hi)} {node['noun']}"
+
+        def check_array(v: Any, path: str, errors: Errors) -> Any:
+            if not isinstance(v, list):
+                errors.append((path, f"{expected}, got {type(v).__name__}"))
+                return v
+            if hi is not None and len(v) > hi:
+                v = v[:hi]
+            if len(v) < lo:
+                errors.append((path, f"{expected}, got {len(v)}"))
+            return [item(x, f"{path}[{i}]", errors) for i, x in enumerate(v)]
+        return check_array
+
+    if kind == "obj":
+        fields = [(key, _compile(n), n) for key, n in node["fields"].items()]
+
+        def check_obj(v: Any, path: str, errors: Errors) -> Any:
+            if not isinstance(v, dict):
+                errors.append((path, "expected object"))
+                return v
+            out = dict(v)
+            for key, fn, n in fields:
+                if key in v:
+                    out[key] = fn(v[key], f"{path}.{key}", errors)
+                elif n["kind"] == "const" and n["fix"]:
+                    out[key] = copy.deepcopy(n["value"])
+                elif n["kind"] != "null":
+                    errors.append((f"{path}.{key}", "missing"))
+            return out
+        return check_obj
+
+    if kind == "tagged":
+        tag = node["tag"]
+        checks = {t: _compile(n) for t, n in node["variants"].items()}
+        expected = f"expected one of {', '.join(checks)}"
+
+        def check_tagged(v: Any, path: str, errors: Errors) -> Any:
+            if not isinstance(v, dict):
+                errors.append((path, "expected object"))
+                return v
+            fn = checks.get(v.get(tag))
+            if fn is None:
+                errors.append((f"{path}.{tag}", expected))
+                return v
+            return fn(v, path, errors)
+        return check_tagged
+
+    raise ValueError(f"unknown schema node kind {kind!r}")
+
+
+def compile_schema(node: Node) -> Check:
+    """
+    Compile a declaration into check(value) -> (coerced value, errors).
+    One pass over the payload collects every violation, each with its
+    JSON path ("$.questions[3].scale.min").
+    """
+    fn = _compile(node)
+
+    def check(value: Any) -> Tuple[Any, Errors]:
+        errors: Errors = []
+        out = fn(value, "$", errors)
+        return out, errors
+
+    return check
+
+
+_TOP_RE = re.compile(r"^\$\.(\w+)(\[\d+\])?")
+
+
+def error_keys(errors: Errors) -> Dict[str, str]:
+    """
+    First violation per top-level field. The list index is kept
+    ("questions[3]") so single list items can be told apart.
+    """
+    out: Dict[str, str] = {}
+    for path, msg in errors:
+        m = _TOP_RE.match(path)
+        key = m.group(1) + (m.group(2) or "") if m else "$"
+        out.setdefault(key, f"{path[2:] or '$'}: {msg}")
+    return out
+
+
+# ------------------------------------------------------------
+# Prompt hints
+# ------------------------------------------------------------
+def _render(node: Node, indent: int) -> str:
+    kind = node["kind"]
+    if kind == "str":
+        return _compact(node["example"])
+    if kind == "num":
+        return _compact(node["example"])
+    if kind == "const":
+        return _compact(node["value"])
+    if kind == "null":
+        return "null"
+    if kind == "tagged":
+        return _render(next(iter(node["variants"].values())), indent)
+
+    pad = " " * indent
+    if kind == "array":
+        item = node["item"]
+        if item["kind"] in ("str", "num", "const"):
+            examples = node["examples"]
+            if isinstance(examples, list):
+                return _compact(examples)
+            n = examples or node["min"] or 1
+            return "[" + ",".join([_render(item, 0)] * n) + "]"
+        comment = f"/* {count_phrase(node['min'], node['max'])} {node['noun']} */"
+        return f"[\n{pad}  {comment}\n{pad}]"
+
+    fields = node["fields"].items()
+    if node["inline"]:
+        return "{" + ",".join(f'"{k}":{_render(n, 0)}' for k, n in fields) + "}"
+    body = ",\n".join(f'{pad}  "{k}": {_render(n, indent + 2)}' for k, n in fields)
+    return f"{{\n{body}\n{pad}}}"
+
+
+def render_rules(node: Node) -> List[str]:
+    """
+    "- field: <count> <rule>" lines for the top-level fields that carry a rule.
+    """
+    lines: List[str] = []
+    for key, n in node.get("fields", {}).items():
+        rule = n.get("rule")
+        if not rule:
+            continue
+        if n["kind"] == "array":
+            lines.append(f"- {key}: {count_phrase(n['min'], n['max'])} {rule}")
+        else:
+            lines.append(f"- {key} {rule}")
+    return lines
+
+
+def render_hint(node: Node, title: str) -> str:
+    """
+    JSON skeleton of an obj() declaration, followed by its rules.
+    """
+    text = f"{title} JSON:\n{_render(node, 0)}"
+    rules = render_rules(node)
+    if rules:
+        text += "\nRules:\n" + "\n".join(rules)
+    return text
+
+
+def render_variants(node: Node) -> str:
+    """
+    One example per variant of a tagged() declaration, then its notes.
+    """
+    lines = [f"{node['title']}:"]
+    for t, variant in node["variants"].items():
+        lines.append(f"- {node['labels'].get(t, t)}:")
+        lines.append(f"  {_render(variant, 0)}")
+    if node["notes"]:
+        lines.append("Notes:")
+        lines.extend(f"- {n}" for n in node["notes"])
+    return "\n".join(lines)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.catalog_engine import CatalogEngine, options_kind_for
+
+
+# ------------------------------------------------------------
+# Lexicons
+# ------------------------------------------------------------
+# Answer words -> catalog fields_vocab entries.
+_FIELD_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "Technology": (
+        "technology", "tech", "software", "computer", "computers", "computing", "code", "coding",
+        "programming", "program", "programs", "app", "apps", "website", "websites", "it", "games",
+        "game", "robot", "robots", "robotics", "ai", "electronics",
+    ),
+    "Engineering": (
+        "engineering", "engineer", "build", "building", "machine", "machines", "mechanical",
+        "electrical", "circuits", "fix", "fixing", "repair", "maths", "math", "physics",
+    ),
+    "Data": (
+        "data", "numbers", "analysis", "analyse", "analyze", "analytics", "statistics", "charts",
+        "patterns", "research", "science", "spreadsheet", "spreadsheets", "logic", "puzzles",
+    ),
+    "Business": (
+        "business", "money", "finance", "marketing", "sales", "selling", "manage", "management",
+        "lead", "leading", "leader", "entrepreneur", "startup", "accounting", "economics", "plan", "planning",
+    ),
+    "Design": (
+        "design", "designing", "draw", "drawing", "art", "arts", "creative", "create", "creating",
+        "visual", "visuals", "colour", "color", "ui", "ux", "sketch", "fashion", "animation",
+    ),
+    "Healthcare": (
+        "health", "healthcare", "medical", "medicine", "nurse", "nursing", "patients", "care",
+        "caring", "biology", "hospital", "wellbeing", "psychology",
+    ),
+    "Education": (
+        "teach", "teaching", "teacher", "tutor", "tutoring", "explain", "explaining", "mentor",
+        "coaching", "education", "learning", "children", "kids",
+    ),
+    "Built Environment": (
+        "architecture", "construction", "buildings", "city", "cities", "urban", "spaces",
+        "sustainability", "environment", "housing", "interior",
+    ),
+    "Media": (
+        "media", "video", "videos", "film", "films", "writing", "write", "stories", "story",
+        "journalism", "social", "content", "communication", "communications", "photography", "music",
+    ),
+    "Security": (
+        "security", "cyber", "cybersecurity", "hacking", "privacy", "protect", "protecting",
+        "safety", "networks", "network",
+    ),
+}
+
+# Answer words -> work style tags.
+_STYLE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "Team-oriented": ("team", "teams", "group", "groups", "together", "collaborate", "collaboration", "friends"),
+    "Independent": ("alone", "independent", "independently", "own", "myself", "solo", "quiet"),
+    "Structured": ("plan", "planning", "schedule", "structured", "structure", "rules", "steps", "organised", "organized", "routine"),
+    "Flexible": ("flexible", "explore", "exploring", "freedom", "variety", "different", "change", "new"),
+    "Hands-on": ("build", "building", "make", "making", "hands", "practical", "fix", "fixing", "try", "experiment"),
+    "People-focused": ("people", "help", "helping", "customers", "community", "talk", "talking", "others", "care"),
+}
+
+# Top field -> strength tag.
+_FIELD_STRENGTHS: Dict[str, str] = {
+    "Technology": "Problem solving",
+    "Engineering": "Systems thinking",
+    "Data": "Analytical",
+    "Business": "Organized",
+    "Design": "Creative",
+    "Healthcare": "Empathetic",
+    "Education": "Clear communicator",
+    "Built Environment": "Spatial thinking",
+    "Media": "Storytelling",
+    "Security": "Detail-oriented",
+}
+
+_DEFAULT_STRENGTHS = ("Curious", "Adaptable", "Reflective")
+_DEFAULT_STYLES = ("Task-focused", "Steady learner")
+
+# Weights for the inferred fields from Part 2, in order.
+_INFERRED_PRIOR = (1.5, 1.0, 0.5)
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def _invert(lexicon: Dict[str, Tuple[str, ...]], labels: List[str]) -> Dict[str, List[int]]:
+    index: Dict[str, List[int]] = {}
+    for i, label in enumerate(labels):
+        for w in lexicon.get(label, ()):
+            index.setdefault(w, []).append(i)
+    return index
+
+
+# ------------------------------------------------------------
+# Scoring engine
+# ------------------------------------------------------------
+class ScoringEngine:
+    """
+    Offline Schema C analysis.
+
+    Answers from collect_answers_for_engine are encoded into a feature
+    vector over the catalog's fields_vocab (plus a small work-style
+    vector) and scored against a per-kind matrix of catalog entries that
+    is built once. No LLM involved, so it is cheap enough to run as a
+    pre-answer on every analysis request.
+    """
+
+    def __init__(self, catalog: CatalogEngine):
+        self.catalog = catalog
+        self.fields: List[str] = list(catalog.fields_vocab)
+        self.styles: List[str] = list(_STYLE_KEYWORDS)
+        self._field_index = _invert(_FIELD_KEYWORDS, self.fields)
+        self._style_index = _invert(_STYLE_KEYWORDS, self.styles)
+
+        # kind -> (entry names, sparse rows of (field column, weight)).
+        # The primary field of an entry counts fully, later ones less.
+        col = {f: i for i, f in enumerate(self.fields)}
+        self._matrix: Dict[str, Tuple[List[str], List[Tuple[Tuple[int, float], ...]]]] = {}
+        for e in catalog.entries:
+            names, rows = self._matrix.setdefault(e.kind, ([], []))
+            row = tuple((col[f], 1.0 / (1 + 0.5 * j)) for j, f in enumerate(e.fields) if f in col)
+            names.append(e.name)
+            rows.append(row)
+
+    # ---------------- Encoding ----------------
+    def _add_words(self, text: str, weight: float, fvec: List[float], svec: List[float]) -> None:
+        for w in _WORD_RE.findall(text.lower()):
+            for i in self._field_index.get(w, ()):
+                fvec[i] += weight
+            for i in self._style_index.get(w, ()):
+                svec[i] += weight
+
+    def encode(self, answers: List[Any], inferred_fields: Optional[List[str]] = None) -> Tuple[List[float], List[float]]:
+        """
+        Returns (field vector, style vector).
+
+        - mcq / text: words of the chosen option or typed text count +1
+        - slider / rating: words of the prompt count from -1 (lowest) to +1 (highest)
+        """
+        fvec = [0.0] * len(self.fields)
+        svec = [0.0] * len(self.styles)
+
+        for i, f in enumerate(inferred_fields or []):
+            if i >= len(_INFERRED_PRIOR):
+                break
+            mapped = self.catalog.map_field(f)
+            if mapped is not None and mapped in self.fields:
+                fvec[self.fields.index(mapped)] += _INFERRED_PRIOR[i]
+
+        for a in answers:
+            if not isinstance(a, dict):
+                continue
+            value = a.get("answer")
+            t = a.get("type")
+            if t in ("slider", "rating") and isinstance(value, (int, float)):
+                lo, hi = (0.0, 10.0) if t == "slider" else (1.0, 5.0)
+                weight = 2.0 * (min(max(float(value), lo), hi) - lo) / (hi - lo) - 1.0
+                if weight:
+                    self._add_words(str(a.get("prompt", "")), weight, fvec, svec)
+            elif isinstance(value, str) and value:
+                self._add_words(value, 1.0, fvec, svec)
+        return fvec, svec
+
+    # ---------------- Ranking ----------------
+    def rank(self, fvec: List[float], kind: str, k: int = 3) -> List[str]:
+        names, rows = self._matrix.get(kind, ([], []))
+        scored = sorted(
+            ((-sum(fvec[c] * w for c, w in row), i) for i, row in enumerate(rows)),
+        )
+        return [names[i] for _, i in scored[:k]]
+
+    # ---------------- Schema C ----------------
+    def analyze(
+        self,
+        education_status: str,
+        poly_path_choice: Optional[str],
+        inferred_fields: List[str],
+        part2_answers: List[Any],
+    ) -> Dict[str, Any]:
+        fvec, svec = self.encode(part2_answers, inferred_fields)
+
+        top_fields = [self.fields[i] for i in sorted(range(len(fvec)), key=lambda i: -fvec[i]) if fvec[i] > 0][:3]
+        strengths: List[str] = []
+        for f in top_fields:
+            tag = _FIELD_STRENGTHS.get(f)
+            if tag and tag not in strengths:
+                strengths.append(tag)
+        for tag in _DEFAULT_STRENGTHS:
+            if len(strengths) >= 3:
+                break
+            if tag not in strengths:
+                strengths.append(tag)
+
+        styles = [self.styles[i] for i in sorted(range(len(svec)), key=lambda i: -svec[i]) if svec[i] > 0][:4]
+        for tag in _DEFAULT_STYLES:
+            if len(styles) >= 2:
+                break
+            if tag not in styles:
+                styles.append(tag)
+
+        options = self.rank(fvec, options_kind_for(education_status, poly_path_choice))
+
+        feedback: List[str] = []
+        if top_fields:
+            feedback.append(f"Your answers lean most towards {', '.join(top_fields)}.")
+        if options:
+            feedback.append(f"Explore {options[0]} first with a small weekend project.")
+        feedback.append("Try short experiments before you commit, and keep notes on what you enjoyed.")
+        feedback.append("Ask someone already in the field what a normal week looks like for them.")
+
+        return {
+            "strength_tags": strengths[:3],
+            "work_style_tags": styles,
+            "feedback_lines": feedback[:5],
+            "suggested_options": options,
+        }
@@ -1,108 +1,156 @@
 from __future__ import annotations
 from typing import Any
 
+from core.schema import (
+    Errors,
+    Node,
+    SchemaError,
+    array,
+    compile_schema,
+    const,
+    null,
+    number,
+    obj,
+    string,
+    tagged,
+)
 
-def _is_str_list(x: Any) -> bool:
-    return isinstance(x, list) and all(isinstance(i, str) for i in x)
-
-
-def _validate_question(q: Any) -> None:
-    if not isinstance(q, dict):
-        raise ValueError("question: must be dict")
-    if q.get("type") not in ("mcq", "slider", "rating", "text"):
-        raise ValueError("question: invalid type")
-    if not isinstance(q.get("id"), str) or not isinstance(q.get("prompt"), str):
-        raise ValueError("question: id and prompt required")
-    t = q["type"]
-    if t == "mcq":
-        if not _is_str_list(q.get("options")) or len(q["options"]) < 2:
-            raise ValueError("question: mcq needs options")
-    if t == "slider":
-        s = q.get("scale")
-        if not isinstance(s, dict):
-            raise ValueError("question: slider needs scale dict")
-        for k in ("min", "max", "min_label", "max_label"):
-            if k not in s:
-                raise ValueError("question: slider scale missing field")
-    if t == "rating":
-        s = q.get("scale")
-        if s != {"min": 1, "max": 5}:
-            raise ValueError("question: rating scale must be 1-5")
-    if t == "text":
-        if not isinstance(q.get("placeholder"), str):
-            raise ValueError("question: text needs placeholder")
-
-
-def validate_part1(payload: dict[str, Any]) -> None:
-    if not isinstance(payload, dict):
-        raise ValueError("part1: payload must be dict")
-    qs = payload.get("questions")
-    if not isinstance(qs, list) or len(qs) != 5:
-        raise ValueError("part1: questions must be list of 5")
-    for q in qs:
-        _validate_question(q)
-
-
-def validate_part2(payload: dict[str, Any], is_poly: bool) -> None:
-    if not isinstance(payload, dict):
-        raise ValueError("part2: payload must be dict")
-    fields = payload.get("inferred_fields")
-    if not _is_str_list(fields) or len(fields) != 3:
-        raise ValueError("part2: inferred_fields must be 3 strings")
-    qs = payload.get("questions")
-    if not isinstance(qs, list) or len(qs) != 12:
-        raise ValueError("part2: questions must be list of 12")
-    for q in qs:
-        _validate_question(q)
-    if is_poly:
-        peq = payload.get("poly_extra_question")
-        if not isinstance(peq, dict):
-            raise ValueError(
-                "part2: poly_extra_question must be dict for Poly")
-        _validate_question(peq)
-        opts = peq.get("options")
-        if opts != ["Work", "Go to uni"]:
-            raise ValueError(
-                "part2: poly_extra_question options must be ['Work','Go to uni']")
-    else:
-        if payload.get("poly_extra_question") is not None:
-            raise ValueError(
-                "part2: poly_extra_question must be null for non-Poly")
-
-
-def validate_analysis(payload: dict[str, Any], options_kind: str) -> None:
-    st = payload.get("strength_tags")
-    ws = payload.get("work_style_tags")
-    fb = payload.get("feedback_lines")
-    so = payload.get("suggested_options")
-    if not _is_str_list(st) or len(st) != 3:
-        raise ValueError("analysis: strength_tags must be 3 strings")
-    if not _is_str_list(ws) or not (2 <= len(ws) <= 4):
-        raise ValueError("analysis: work_style_tags must be 2-4 strings")
-    if not _is_str_list(fb) or not (2 <= len(fb) <= 5):
-        raise ValueError("analysis: feedback_lines must be 2-5 strings")
-    if not _is_str_list(so) or len(so) != 3:
-        raise ValueError("analysis: suggested_options must be 3 strings")
-    if options_kind not in ("courses", "careers"):
+
+# ------------------------------------------------------------
+# Schemas (also rendered into the prompt hints, see content_engine)
+# ------------------------------------------------------------
+def _question(qtype: str, example_id: str, **fields: Node) -> Node:
+    return obj({"id": string(example_id), "type": const(qtype), "prompt": string(), **fields}, inline=True)
+
+
+QUESTION = tagged(
+    "type",
+    {
+        "mcq": _question("mcq", "q1", options=array(string(), 2, examples=4, noun="options")),
+        "slider": _question("slider", "q2", scale=obj(
+            {"min": number(0), "max": number(10), "min_label": string(), "max_label": string()},
+            inline=True,
+        )),
+        "rating": _question("rating", "q3", scale=const({"min": 1, "max": 5}, fix=True)),
+        "text": _question("text", "q4", placeholder=string()),
+    },
+    title="Question schema (use only one per question depending on type)",
+    labels={"mcq": "MCQ", "slider": "Slider", "rating": "Rating", "text": "Text"},
+    notes=["Do not add extra keys.", "Prompts must be sequential (q1..qN)."],
+)
+
+POLY_EXTRA_QUESTION = obj(
+    {
+        "id": string("poly_path"),
+        "type": const("mcq", fix=True),
+        "prompt": string(),
+        "options": const(["Work", "Go to uni"], fix=True),
+    },
+    inline=True,
+)
+
+
+def _questions(count: int) -> Node:
+    return array(QUESTION, count, count, noun="questions following the Question schema")
+
+
+# Schema A
+PART1 = obj({"questions": _questions(5)})
+
+
+# Schema B
+def part2_schema(is_poly: bool) -> Node:
+    return obj({
+        "inferred_fields": array(
+            string(), 3, 3, examples=["field1", "field2", "field3"], rule="distinct fields, each 1-3 words"),
+        "questions": _questions(12),
+        "poly_extra_question": POLY_EXTRA_QUESTION if is_poly else null(),
+    })
+
+
+# Schema C
+def analysis_schema(options_kind: str) -> Node:
+    return obj({
+        "strength_tags": array(string(), 3, 3, rule="lines with meaningful reasons"),
+        "work_style_tags": array(string(), 2, 4, examples=3, rule="lines with meaningful insights"),
+        "feedback_lines": array(string(), 2, 5, rule="lines with realistic and impactful feedback"),
+        "suggested_options": array(
+            string(), 3, 3, rule=f"{options_kind} (specific names, not generic categories)"),
+    })
+
+
+# Schema D
+def gate_schema(work_path: bool) -> Node:
+    impact = "impact on people in details" if work_path else "impact on people"
+    fields = {
+        "info_dialog_lines": array(
+            string(), 3, 7, examples=1,
+            rule=("lines that include: subjects to study with real online resources(for example, links), "
+                  f"employment outlook in safe wording, {impact}"),
+        ),
+    }
+    if work_path:
+        fields["work_style_line"] = string(rule="must describe typical work style in that industry in details")
+        fields["salary_outlook_line"] = string(
+            rule="must be a safe range or qualitative phrasing for a poly fresh graduate")
+    fields["dragon"] = obj({
+        "micro_quest_1_week": string(),
+        "mini_project_1_month": string(),
+        "resources": array(string(), 2, examples=3, noun="resources"),
+    })
+    return obj(fields)
+
+
+OPTIONS_KINDS = ("courses", "careers")
+
+_CHECK_PART1 = compile_schema(PART1)
+_CHECK_PART2 = {p: compile_schema(part2_schema(p)) for p in (True, False)}
+_CHECK_ANALYSIS = {k: compile_schema(analysis_schema(k)) for k in OPTIONS_KINDS}
+_CHECK_GATE = {p: compile_schema(gate_schema(p)) for p in (True, False)}
+
+
+# ------------------------------------------------------------
+# Checks: (coerced payload, every violation as (json path, message))
+# ------------------------------------------------------------
+def check_part1(payload: Any) -> tuple[Any, Errors]:
+    return _CHECK_PART1(payload)
+
+
+def check_part2(payload: Any, is_poly: bool) -> tuple[Any, Errors]:
+    return _CHECK_PART2[bool(is_poly)](payload)
+
+
+def check_analysis(payload: Any, options_kind: str) -> tuple[Any, Errors]:
+    if options_kind not in OPTIONS_KINDS:
         raise ValueError("analysis: options_kind invalid")
+    return _CHECK_ANALYSIS[options_kind](payload)
+
+
+def check_gate(payload: Any, need_salary: bool) -> tuple[Any, Errors]:
+    return _CHECK_GATE[bool(need_salary)](payload)
+
+
+# ------------------------------------------------------------
+# Validators: return the coerced payload or raise SchemaError
+# ------------------------------------------------------------
+def _ok(name: str, result: tuple[Any, Errors]) -> Any:
+    value, errors = result
+    if errors:
+        raise SchemaError(name, errors, value)
+    return value
+
+
+def validate_part1(payload: dict[str, Any]) -> dict[str, Any]:
+    return _ok("part1", check_part1(payload))
+
+
+def validate_part2(payload: dict[str, Any], is_poly: bool) -> dict[str, Any]:
+    return _ok("part2", check_part2(payload, is_poly))
+
+
+def validate_analysis(payload: dict[str, Any], options_kind: str) -> dict[str, Any]:
+    return _ok("analysis", check_analysis(payload, options_kind))
 
 
-def validate_gate(payload: dict[str, Any], need_salary: bool) -> None:
-    info = payload.get("info_dialog_lines")
-    if not _is_str_list(info) or len(info) < 3:
-        raise ValueError("gate: info_dialog_lines must be list[str] >= 3")
-    if need_salary:
-        if not isinstance(payload.get("salary_outlook_line"), str):
-            raise ValueError(
-                "gate: salary_outlook_line required for Work path")
-        if not isinstance(payload.get("work_style_line"), str):
-            raise ValueError("gate: work_style_line required for Work path")
-    dq = payload.get("dragon")
-    if not isinstance(dq, dict):
-        raise ValueError("gate: dragon must be dict")
-    for k in ("micro_quest_1_week", "mini_project_1_month"):
-        if not isinstance(dq.get(k), str):
-            raise ValueError("gate: dragon quest missing")
-    res = dq.get("resources")
-    if not _is_str_list(res) or len(res) < 2:
-        raise ValueError("gate: dragon resources must be list[str] >= 2")
+def validate_gate(payload: dict[str, Any], need_salary: bool) -> dict[str, Any]:
+    return _ok("gate", check_gate(payload, need_salary))
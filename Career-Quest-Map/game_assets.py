@@ -0,0 +1,157 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+
+class AssetManager:
+    """
+    Shared image cache.
+
+    Each file is decoded once, each (path, size) is scaled once, and the
+    result is converted to the display format (convert / convert_alpha)
+    so blits do not pay a per-pixel conversion. Callers get shared
+    Surface references; do not draw onto them.
+
+    Named groups of assets can be prefetched on a background thread:
+    decoding and scaling happen there, and the cheap display-format
+    conversion happens on the render thread on first use.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._sources = {}
+        self._images = {}
+        self._groups = {}
+        self._prepared = {}
+        self._pending = {}
+        self._pool = None
+        self.decodes = 0
+        self.requests = 0
+
+    def _source(self, path):
+        src = self._sources.get(path)
+        if src is None:
+            src = pygame.image.load(path)
+            self._sources[path] = src
+            self.decodes += 1
+        return src
+
+    @staticmethod
+    def _key(path, size, alpha):
+        return (path, tuple(size) if size is not None else None, bool(alpha))
+
+    def _scaled(self, key):
+        path, size, _ = key
+        img = self._source(path)
+        if size is not None and img.get_size() != size:
+            img = pygame.transform.scale(img, size)
+        return img
+
+    def image(self, path, size=None, alpha=False):
+        """
+        Display-format Surface for `path`, scaled to `size` (w, h) if given.
+        """
+        key = self._key(path, size, alpha)
+        with self._lock:
+            self.requests += 1
+            img = self._images.get(key)
+            if img is not None:
+                return img
+            pending = self._pending.get(key)
+        if pending is not None:
+            # Already being decoded in the background; cheaper to wait.
+            pending.result()
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                return img
+            img = self._prepared.pop(key, None)
+            if img is None:
+                img = self._scaled(key)
+            img = img.convert_alpha() if alpha else img.convert()
+            self._images[key] = img
+            return img
+
+    # ---------------- Groups ----------------
+    def define_group(self, name, specs):
+        """
+        specs: iterable of (path, size, alpha) as passed to image().
+        """
+        self._groups[name] = [self._key(*s) for s in specs]
+
+    def _prepare(self, key):
+        with self._lock:
+            if key in self._images or key in self._prepared:
+                return
+        path = key[0]
+        src = pygame.image.load(path)
+        img = src
+        if key[1] is not None and img.get_size() != key[1]:
+            img = pygame.transform.scale(img, key[1])
+        with self._lock:
+            self.decodes += 1
+            self._prepared[key] = img
+
+    def prefetch(self, name):
+        """
+        Decode and scale a group in the background. Safe to call repeatedly.
+        """
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="assets")
+            for key in self._groups.get(name, []):
+                if key in self._images or key in self._prepared or key in self._pending:
+                    continue
+                self._pending[key] = self._pool.submit(self._prepare_logged, key)
+
+    def _prepare_logged(self, key):
+        try:
+            self._prepare(key)
+        except Exception as e:
+            # image() will retry on the render thread and raise there.
+            print(f"Asset prefetch failed for {key[0]}: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    def group_ready(self, name):
+        with self._lock:
+            return all(k in self._images or k in self._prepared for k in self._groups.get(name, []))
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def drop_sources(self):
+        """
+        Free the decoded originals; the scaled display copies stay cached.
+        """
+        with self._lock:
+            self._sources.clear()
+
+    def memory_report(self):
+        def nbytes(s):
+            return s.get_width() * s.get_height() * s.get_bytesize()
+
+        with self._lock:
+            per_path = {}
+            for (path, _, _), img in self._images.items():
+                per_path[path] = per_path.get(path, 0) + nbytes(img)
+            return {
+                "images": len(self._images),
+                "image_bytes": sum(per_path.values()),
+                "prepared": len(self._prepared),
+                "sources": len(self._sources),
+                "source_bytes": sum(nbytes(s) for s in self._sources.values()),
+                "decodes": self.decodes,
+                "requests": self.requests,
+                "largest": sorted(per_path.items(), key=lambda kv: -kv[1])[:5],
+            }
+
+
+assets = AssetManager()
+
+
+def load_image(path, size=None, alpha=False):
+    return assets.image(path, size, alpha)
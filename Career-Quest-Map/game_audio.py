@@ -0,0 +1,171 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+
+# Music key -> file name, looked up in the working directory, then audio/.
+TRACKS = {
+    "opening": "openingSceneAudio.mp3",
+    "house": "houseAudio.mp3",
+    "wiseman": "wiseManAudio.mp3",
+    "chapter2": "seenPortalAudio.mp3",
+    "portal_interior": "portalInteriorAudio.mp3",
+    "chapter2_no_portal": "noPortalAudio.mp3",
+    "dw": "dwAudio.mp3",
+    "booth": "boothAudio.mp3",
+    "final_scene": "finalSceneAudio.mp3",
+}
+
+
+def resolve_track(filename):
+    for p in (filename, os.path.join("audio", filename)):
+        if os.path.exists(p):
+            return p
+    return None
+
+
+class AudioManager:
+    """
+    Background music with pre-buffered tracks and crossfades.
+
+    Track paths are resolved once. prefetch() decodes tracks into Sounds
+    on a worker thread (the decode releases the GIL), and play() then
+    crossfades between two reserved Channels, so a scene switch costs no
+    disk or decode work on the render thread. A track that was not
+    buffered in time is streamed through mixer.music for that scene and
+    buffered for next time.
+
+    Decoded tracks are a few MB per minute of audio, so only the most
+    recently used `max_buffered` are kept.
+    """
+
+    def __init__(self, tracks=TRACKS, crossfade_ms=600, max_buffered=5):
+        self.paths = {key: resolve_track(fn) for key, fn in tracks.items()}
+        self.crossfade_ms = crossfade_ms
+        self.max_buffered = max_buffered
+        self.enabled = False
+        self.current = None
+        self._lock = threading.Lock()
+        self._sounds = OrderedDict()
+        self._pending = {}
+        self._pool = None
+        self._channels = []
+        self._active = 0
+        self._streaming = False
+        self.buffered_plays = 0
+        self.streamed_plays = 0
+
+    def init(self):
+        """
+        Call after pygame.mixer.init().
+        """
+        for key, path in self.paths.items():
+            if path is None:
+                print(f"Audio file not found: {TRACKS.get(key, key)}")
+        if not any(self.paths.values()):
+            return
+        try:
+            pygame.mixer.music.set_volume(1.0)
+            pygame.mixer.set_reserved(2)
+            self._channels = [pygame.mixer.Channel(0), pygame.mixer.Channel(1)]
+            self.enabled = True
+        except Exception as audio_err:
+            print(f"Audio disabled: {audio_err}")
+
+    # ---------------- Buffering ----------------
+    def prefetch(self, *keys):
+        if not self.enabled:
+            return
+        with self._lock:
+            for key in keys:
+                if self.paths.get(key) is None or key in self._sounds or key in self._pending:
+                    continue
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio")
+                self._pending[key] = self._pool.submit(self._decode, key)
+
+    def _decode(self, key):
+        try:
+            sound = pygame.mixer.Sound(self.paths[key])
+        except Exception as e:
+            print(f"Music prebuffer failed for {key}: {e}")
+            return
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+        with self._lock:
+            self._sounds[key] = sound
+            self._evict()
+
+    def _evict(self):
+        while len(self._sounds) > self.max_buffered:
+            for key in self._sounds:
+                if key != self.current:
+                    del self._sounds[key]
+                    break
+            else:
+                return
+
+    # ---------------- Playback ----------------
+    def play(self, key):
+        if not self.enabled or key == self.current:
+            return
+        if key is not None and key in self.paths and self.paths[key] is None:
+            return
+        try:
+            self._switch(key)
+            self.current = key
+        except Exception as music_err:
+            print(f"Music playback error: {music_err}")
+            self.current = None
+
+    def _switch(self, key):
+        ms = self.crossfade_ms
+        sound = None
+        if key in self.paths:
+            with self._lock:
+                sound = self._sounds.get(key)
+                if sound is not None:
+                    self._sounds.move_to_end(key)
+
+        self._channels[self._active].fadeout(ms)
+        if self._streaming:
+            # music.load() frees the fading track and SDL_mixer waits for
+            # the fade to finish first, stalling the frame. Cut it instead
+            # when another streamed track is about to be loaded.
+            if sound is None and key in self.paths:
+                pygame.mixer.music.stop()
+            else:
+                pygame.mixer.music.fadeout(ms)
+            self._streaming = False
+        if key not in self.paths:
+            return
+
+        if sound is not None:
+            self._active ^= 1
+            self._channels[self._active].play(sound, loops=-1, fade_ms=ms)
+            self.buffered_plays += 1
+            return
+
+        # Not buffered yet: stream it rather than wait for the decode.
+        pygame.mixer.music.load(self.paths[key])
+        pygame.mixer.music.play(-1, fade_ms=ms)
+        self._streaming = True
+        self.streamed_plays += 1
+        self.prefetch(key)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "buffered": list(self._sounds),
+                "pending": len(self._pending),
+                "buffered_plays": self.buffered_plays,
+                "streamed_plays": self.streamed_plays,
+            }
@@ -1,7 +1,10 @@
 import pygame
+import json
 import os
 import re
 
+from game_assets import load_image
+
 #===============Constants===================
 GAME_WIDTH = 900
 GAME_HEIGHT = 600
@@ -32,44 +35,116 @@ PORTAL2 = "portal2"
 PORTAL3 = "portal3"
 
 #================ Player =========================
+DIRECTION_FILES = {"up": "north", "down": "south", "left": "west", "right": "east"}
+# Format of images/<character>/atlas.json written by tools/build_atlases.py.
+ATLAS_VERSION = 1
+
+
 class Player:
     def __init__(self, x, y, width, height, img_path, speed):
         self.img_path = img_path
-
-        # Load idle sprites for all directions at a fixed render size.
-        self.img_up = pygame.transform.scale(
-            pygame.image.load(img_path + "north.png").convert_alpha(), (width, height)
-        )
-        self.img_down = pygame.transform.scale(
-            pygame.image.load(img_path + "south.png").convert_alpha(), (width, height)
-        )
-        self.img_left = pygame.transform.scale(
-            pygame.image.load(img_path + "west.png").convert_alpha(), (width, height)
-        )
-        self.img_right = pygame.transform.scale(
-            pygame.image.load(img_path + "east.png").convert_alpha(), (width, height)
-        )
+        self.size = (width, height)
 
         # Player Attributes
         self.rect = pygame.Rect(x, y, width, height)
         self.speed = speed # pixel/second
-        self.img = self.img_down
+        self._img = None
         self.last_dir = "down"
         self.anim_index = 0.0
         self.anim_fps = 10.0
-
-        self.walk_frames = {
-            "up": self._build_direction_sequence("north", self.img_up, width, height),
-            "down": self._build_direction_sequence("south", self.img_down, width, height),
-            "left": self._build_direction_sequence("left", self.img_left, width, height),
-            "right": self._build_direction_sequence("right", self.img_right, width, height),
-        }
-
-    def _build_direction_sequence(self, token, idle_img, width, height):
+        self._walk_frames = None
+        self._atlas_index = None
+        self._atlas_frames = {}
+
+    # ---------------- Atlas ----------------
+    def _atlas(self):
+        """
+        Frame index from atlas.json, or None when the folder has no atlas
+        (the individual PNGs are used then).
+        """
+        if self._atlas_index is None:
+            try:
+                with open(os.path.join(self.img_path, "atlas.json"), "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                self._atlas_index = index if index.get("version") == ATLAS_VERSION else False
+            except (OSError, ValueError):
+                self._atlas_index = False
+        return self._atlas_index or None
+
+    def _atlas_spec(self, index):
+        # The whole sheet is scaled once so each cell is exactly self.size.
+        cols, rows = index["grid"]
+        w, h = self.size
+        return (os.path.join(self.img_path, "atlas.png"), (cols * w, rows * h), True)
+
+    def _atlas_frame(self, index, cell):
+        cell = tuple(cell)
+        frame = self._atlas_frames.get(cell)
+        if frame is None:
+            sheet = load_image(*self._atlas_spec(index))
+            w, h = self.size
+            frame = sheet.subsurface((cell[0] * w, cell[1] * h, w, h))
+            self._atlas_frames[cell] = frame
+        return frame
+
+    def _idle(self, direction_file):
+        index = self._atlas()
+        if index is not None:
+            return self._atlas_frame(index, index["idle"][direction_file])
+        return load_image(self.img_path + direction_file + ".png", self.size, alpha=True)
+
+    # Sprites resolve through the shared asset cache on first use, so NPCs
+    # that only appear in dialogs never load their walk frames.
+    @property
+    def img_up(self):
+        return self._idle("north")
+
+    @property
+    def img_down(self):
+        return self._idle("south")
+
+    @property
+    def img_left(self):
+        return self._idle("west")
+
+    @property
+    def img_right(self):
+        return self._idle("east")
+
+    @property
+    def img(self):
+        return self._img if self._img is not None else self.img_down
+
+    def portrait_spec(self, direction, size):
+        return (self.img_path + DIRECTION_FILES[direction] + ".png", tuple(size), True)
+
+    def portrait(self, direction, size):
+        """
+        Idle sprite facing `direction` for dialog scenes, scaled once straight
+        from the source PNG (not the map-sized sprite) and cached per
+        (direction, size) by the asset manager.
+        """
+        return load_image(*self.portrait_spec(direction, size))
+
+    @img.setter
+    def img(self, value):
+        self._img = value
+
+    @property
+    def walk_frames(self):
+        if self._walk_frames is None:
+            self._walk_frames = {
+                "up": self._build_direction_sequence("north", self.img_up),
+                "down": self._build_direction_sequence("south", self.img_down),
+                "left": self._build_direction_sequence("left", self.img_left),
+                "right": self._build_direction_sequence("right", self.img_right),
+            }
+        return self._walk_frames
+
+    def _walk_frame_paths(self, token):
         anim_dir = os.path.join(self.img_path, "animation")
-        frames = [idle_img]
         if not os.path.isdir(anim_dir):
-            return frames
+            return []
 
         pattern = re.compile(rf"^walk_{re.escape(token)}(\d+)\.png$", re.IGNORECASE)
         matches = []
@@ -79,12 +154,32 @@ class Player:
                 matches.append((int(m.group(1)), fn))
 
         matches.sort(key=lambda item: item[0])
-        for _, fn in matches:
-            p = os.path.join(anim_dir, fn)
-            frame = pygame.transform.scale(pygame.image.load(p).convert_alpha(), (width, height))
-            frames.append(frame)
+        return [os.path.join(anim_dir, fn) for _, fn in matches]
+
+    def _build_direction_sequence(self, token, idle_img):
+        frames = [idle_img]
+        index = self._atlas()
+        if index is not None:
+            frames.extend(self._atlas_frame(index, cell) for cell in index["walk"].get(token, []))
+            return frames
+        for p in self._walk_frame_paths(token):
+            frames.append(load_image(p, self.size, alpha=True))
         return frames
 
+    def asset_specs(self, directions=("north", "south", "west", "east"), walk=False):
+        """
+        (path, size, alpha) for the idle sprites in `directions`, plus walk frames.
+        With an atlas that is just the sheet.
+        """
+        index = self._atlas()
+        if index is not None:
+            return [self._atlas_spec(index)]
+        specs = [(self.img_path + d + ".png", self.size, True) for d in directions]
+        if walk:
+            for token in ("north", "south", "left", "right"):
+                specs.extend((p, self.size, True) for p in self._walk_frame_paths(token))
+        return specs
+
     def move(self, dt, game_width, game_height):
         keys = pygame.key.get_pressed()
         dx = 0.0
@@ -130,15 +225,28 @@ class Player:
 
 class Structure:
     def __init__(self, x, y, width, height, img_path, bg_img_path):
-        img = pygame.image.load(img_path).convert_alpha()
-        img = pygame.transform.scale(img, (width, height))
-
-        bg_img = pygame.image.load(bg_img_path)
-        bg_img = pygame.transform.scale(bg_img, (GAME_WIDTH, GAME_HEIGHT))
-
-        self.img = img
-        self.bg = bg_img
+        self.img_path = img_path
+        self.bg_path = bg_img_path
         self.rect = pygame.Rect(x, y, width, height)
+        self.size = (width, height)
+
+    # Shared, display-format copies loaded on first use; several structures
+    # reuse home_bg.png.
+    @property
+    def img(self):
+        return load_image(self.img_path, self.size, alpha=True)
+
+    @property
+    def bg(self):
+        return load_image(self.bg_path, (GAME_WIDTH, GAME_HEIGHT))
+
+    def asset_specs(self, sprite=True, interior=True):
+        specs = []
+        if sprite:
+            specs.append((self.img_path, self.size, True))
+        if interior:
+            specs.append((self.bg_path, (GAME_WIDTH, GAME_HEIGHT), False))
+        return specs
 
     def draw(self, surface):
         surface.blit(self.img, self.rect)
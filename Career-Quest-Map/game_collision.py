@@ -0,0 +1,85 @@
+import pygame
+
+
+class CollisionGrid:
+    """
+    Uniform-grid index over a fixed set of blocker rects.
+
+    Duplicate rects are dropped and each rect is bucketed into every
+    cell it overlaps, so a query only tests the blockers near the moving
+    rect instead of scanning the whole list. Cost stays flat as maps
+    grow to hundreds of blockers.
+    """
+
+    def __init__(self, rects, cell=64):
+        self.cell = cell
+        seen = set()
+        self.rects = []
+        for r in rects:
+            r = pygame.Rect(r)
+            key = tuple(r)
+            if key in seen or not (r.width and r.height):
+                continue
+            seen.add(key)
+            self.rects.append(r)
+
+        self._buckets = {}
+        for i, r in enumerate(self.rects):
+            for cell_key in self._cells(r):
+                self._buckets.setdefault(cell_key, []).append(i)
+
+    def _cells(self, rect):
+        c = self.cell
+        for cx in range(rect.left // c, (rect.right - 1) // c + 1):
+            for cy in range(rect.top // c, (rect.bottom - 1) // c + 1):
+                yield (cx, cy)
+
+    def collides(self, rect):
+        for cell_key in self._cells(rect):
+            for i in self._buckets.get(cell_key, ()):
+                if self.rects[i].colliderect(rect):
+                    return True
+        return False
+
+    def query(self, rect):
+        """
+        Blockers overlapping `rect`, each listed once.
+        """
+        hits = set()
+        for cell_key in self._cells(rect):
+            for i in self._buckets.get(cell_key, ()):
+                if i not in hits and self.rects[i].colliderect(rect):
+                    hits.add(i)
+        return [self.rects[i] for i in sorted(hits)]
+
+
+class CollisionIndex:
+    """
+    One CollisionGrid per key (state plus the progression flags that add
+    or remove blockers), built on first use by calling build() for the
+    blocker list. Static and dynamic blockers are baked together, so
+    movement ticks no longer rebuild a list.
+    """
+
+    def __init__(self, cell=64):
+        self.cell = cell
+        self._grids = {}
+        self.builds = 0
+
+    def get(self, key, build):
+        grid = self._grids.get(key)
+        if grid is None:
+            grid = CollisionGrid(build(), self.cell)
+            self._grids[key] = grid
+            self.builds += 1
+        return grid
+
+    def invalidate(self):
+        self._grids.clear()
+
+    def stats(self):
+        return {
+            "grids": len(self._grids),
+            "builds": self.builds,
+            "rects": sum(len(g.rects) for g in self._grids.values()),
+        }
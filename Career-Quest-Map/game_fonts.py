@@ -0,0 +1,58 @@
+import os
+
+import pygame
+
+
+# Set CQM_FONT_CACHE=0 to construct fonts on every call again (for A/B
+# frame-time comparisons with game_perf).
+FONT_CACHE_ENABLED = os.getenv("CQM_FONT_CACHE", "1") != "0"
+
+_fonts = {}
+_font_stats = {"hits": 0, "loads": 0}
+
+
+def get_font(family="Arial", size=24, bold=False, italic=False):
+    """
+    Shared pygame font keyed by (family, size, bold, italic).
+    The system lookup and TTF load happen once per key; renderers call
+    this every frame instead of pygame.font.SysFont.
+    """
+    key = (family, size, bool(bold), bool(italic))
+    font = _fonts.get(key) if FONT_CACHE_ENABLED else None
+    if font is not None:
+        _font_stats["hits"] += 1
+        return font
+    font = pygame.font.SysFont(family, size, bold=bold, italic=italic)
+    _font_stats["loads"] += 1
+    if FONT_CACHE_ENABLED:
+        _fonts[key] = font
+    return font
+
+
+def get_preferred_font(candidates, size, italic=False):
+    """
+    First installed font from `candidates`, falling back to a serif.
+    Cached under the candidate tuple like get_font.
+    """
+    key = (tuple(candidates), size, False, bool(italic))
+    font = _fonts.get(key) if FONT_CACHE_ENABLED else None
+    if font is not None:
+        _font_stats["hits"] += 1
+        return font
+    font = None
+    for name in candidates:
+        font_path = pygame.font.match_font(name, italic=italic)
+        if font_path:
+            font = pygame.font.Font(font_path, size)
+            break
+    if font is None:
+        # Serif fallback if preferred fonts are unavailable.
+        font = pygame.font.SysFont("Times New Roman", size, italic=italic)
+    _font_stats["loads"] += 1
+    if FONT_CACHE_ENABLED:
+        _fonts[key] = font
+    return font
+
+
+def font_stats():
+    return dict(_font_stats, cached=len(_fonts))
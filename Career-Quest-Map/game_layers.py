@@ -0,0 +1,228 @@
+import os
+
+import pygame
+
+
+class LayerCompositor:
+    """
+    Pre-baked static layers for the map screens.
+
+    A layer is the background plus everything drawn on top of it that
+    only changes when progression flags flip (structures and their name
+    tags). It is built once per key by calling build(surface) and
+    then reused, so the frame only pays one full-screen blit before the
+    dynamic sprites and prompts.
+    """
+
+    def __init__(self, target, max_layers=16):
+        self.target = target
+        self.max_layers = max_layers
+        self._layers = {}
+        self.builds = 0
+
+    def get(self, key, build):
+        layer = self._layers.get(key)
+        if layer is None:
+            if len(self._layers) >= self.max_layers:
+                self._layers.clear()
+            # Same pixel format as the display so the blit is a plain copy.
+            layer = pygame.Surface(self.target.get_size(), 0, self.target)
+            build(layer)
+            self._layers[key] = layer
+            self.builds += 1
+        return layer
+
+    def blit(self, key, build):
+        self.target.blit(self.get(key, build), (0, 0))
+
+    def invalidate(self):
+        self._layers.clear()
+
+    def stats(self):
+        return {"layers": len(self._layers), "builds": self.builds}
+
+
+# Set CQM_DIRTY_RECTS=1 to present map screens with display.update(rects).
+DIRTY_RECTS_ENABLED = os.getenv("CQM_DIRTY_RECTS", "0") == "1"
+
+
+class DirtyRectPresenter:
+    """
+    Pushes only the changed parts of the frame to the display.
+
+    Renderers mark() the rects of whatever moves (player, name tag, enter
+    prompt). present() then updates the union of this frame's and last
+    frame's marks, so vacated pixels are restored from the static layer.
+    A full flip happens whenever the scene key changes, after invalidate()
+    (loading screens, window expose), or for scenes that pass key=None.
+    """
+
+    def __init__(self, enabled=DIRTY_RECTS_ENABLED):
+        self.enabled = enabled
+        self._prev = []
+        self._cur = []
+        self._scene_key = None
+        self._full = True
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.partial_pixels = 0
+
+    def mark(self, rect):
+        if rect is not None:
+            self._cur.append(pygame.Rect(rect))
+
+    def invalidate(self):
+        self._full = True
+
+    def present(self, scene_key):
+        cur, self._cur = self._cur, []
+        if not self.enabled or scene_key is None or scene_key != self._scene_key or self._full:
+            self._scene_key = scene_key
+            self._full = False
+            self._prev = cur
+            pygame.display.flip()
+            self.full_frames += 1
+            return
+
+        bounds = pygame.display.get_surface().get_rect()
+        rects = [r.clip(bounds) for r in self._prev + cur]
+        rects = [r for r in rects if r.width and r.height]
+        self._prev = cur
+        if rects:
+            pygame.display.update(rects)
+        self.partial_frames += 1
+        self.partial_pixels += sum(r.width * r.height for r in rects)
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "full_frames": self.full_frames,
+            "partial_frames": self.partial_frames,
+            "avg_partial_px": self.partial_pixels // max(1, self.partial_frames),
+        }
+
+
+class SurfaceCache:
+    """
+    Pre-filled translucent surfaces for shades and dialog boxes.
+
+    Overlays and dialogs used to allocate a new SRCALPHA surface every
+    frame; these are keyed by (size, color, alpha[, radius]) and built
+    once. `allocations` counts surfaces actually created, so a steady
+    frame should leave it unchanged. Callers blit the results; do not
+    draw onto them.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._surfaces = {}
+        self.allocations = 0
+        self.hits = 0
+
+    def _get(self, key, build):
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        if len(self._surfaces) >= self.max_entries:
+            self._surfaces.clear()
+        surf = build()
+        self.allocations += 1
+        self._surfaces[key] = surf
+        return surf
+
+    def shade(self, size, color=(0, 0, 0), alpha=128):
+        """
+        Uniform shade. Uses surface alpha instead of per-pixel alpha, which
+        blits faster for a full-screen fill.
+        """
+        def build():
+            surf = pygame.Surface(size)
+            if pygame.display.get_surface() is not None:
+                surf = surf.convert()
+            surf.fill(color)
+            surf.set_alpha(alpha)
+            return surf
+
+        return self._get(("shade", tuple(size), tuple(color), alpha), build)
+
+    def box(self, size, color=(0, 0, 0), alpha=200, radius=0):
+        """
+        Translucent rounded rectangle, per-pixel alpha for the corners.
+        """
+        def build():
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.rect(surf, (*color, alpha), surf.get_rect(), border_radius=radius)
+            return surf
+
+        return self._get(("box", tuple(size), tuple(color), alpha, radius), build)
+
+    def stats(self):
+        return {"surfaces": len(self._surfaces), "allocations": self.allocations, "hits": self.hits}
+
+
+surfaces = SurfaceCache()
+
+
+# Frame rate for screens that only change on input; CQM_IDLE_FPS=0 keeps
+# every screen at the full rate.
+IDLE_FPS = int(os.getenv("CQM_IDLE_FPS", "5"))
+
+
+class FrameScheduler:
+    """
+    Paces the main loop.
+
+    Screens with movement or animation run at `fps`. Static screens
+    (dialogs, quizzes, overlays) block in pygame.event.wait instead, so
+    they wake at once on input and otherwise redraw at `idle_fps`,
+    which is enough for text-box cursor blinks. Every input event, or a
+    key being held, keeps the loop at the full rate for `linger_ms` so
+    key repeat and widget updates stay smooth.
+
+    dt is clamped to `max_dt` so the first active frame after an idle
+    wait or a hitch cannot move the player through a blocker.
+    """
+
+    def __init__(self, clock, fps=60, idle_fps=IDLE_FPS, linger_ms=500, max_dt=0.1):
+        self.clock = clock
+        self.fps = fps
+        self.idle_ms = 1000 // idle_fps if idle_fps > 0 else 0
+        self.linger_ms = linger_ms
+        self.max_dt = max_dt
+        self._busy_until = 0
+        self.active_frames = 0
+        self.idle_frames = 0
+
+    def next_frame(self, animating):
+        """
+        Wait for the next frame. Returns (dt seconds, events).
+        """
+        now = pygame.time.get_ticks()
+        idle = (
+            self.idle_ms
+            and not animating
+            and now >= self._busy_until
+            and not any(pygame.key.get_pressed())
+        )
+        if idle and pygame.display.get_driver() == "dummy":
+            # SDL's dummy driver has no real event wait and would spin.
+            ms = self.clock.tick(1000 // self.idle_ms)
+            events = pygame.event.get()
+            self.idle_frames += 1
+        elif idle:
+            first = pygame.event.wait(self.idle_ms)
+            events = [] if first.type == pygame.NOEVENT else [first]
+            events.extend(pygame.event.get())
+            ms = self.clock.tick()
+            self.idle_frames += 1
+        else:
+            ms = self.clock.tick(self.fps)
+            events = pygame.event.get()
+            self.active_frames += 1
+        if events:
+            self._busy_until = pygame.time.get_ticks() + self.linger_ms
+        return min(ms / 1000.0, self.max_dt), events
+
+    def stats(self):
+        return {"active_frames": self.active_frames, "idle_frames": self.idle_frames}
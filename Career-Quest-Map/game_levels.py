@@ -0,0 +1,142 @@
+import json
+from array import array
+
+import pygame
+
+from game_classes import Structure
+from game_collision import CollisionIndex
+
+
+LEVEL_FORMAT_VERSION = 1
+
+
+def _compile_when(spec):
+    """
+    {"flag": bool, ...} -> ((flag, bool), ...), sorted so it is stable.
+    """
+    return tuple(sorted((str(k), bool(v)) for k, v in (spec or {}).items()))
+
+
+def _matches(when, flags):
+    return all(bool(flags.get(k)) == v for k, v in when)
+
+
+class Level:
+    """
+    One scene from data/levels.json, compiled for the game loop.
+
+    - blockers: static rects packed into one array("i") of x, y, w, h
+    - solid: structures that block only while their `when` flags hold
+    - triggers: (name, inflated zone, when) entry zones, inflated once
+    - spawns: name -> (x, y), either literal or placed relative to a ref
+    - music: track key, or a first-match list of {"track", "when"}
+    - next: scenes reachable from here (names or {"scene", "when"}), used
+      to pre-buffer their music
+
+    Collision grids are built per combination of the flags this scene
+    actually reads, so a flag that matters elsewhere never splits the
+    cache here.
+    """
+
+    def __init__(self, name, spec, actors, bounds, spawn_size):
+        self.name = name
+        music = spec.get("music")
+        if isinstance(music, list):
+            music = [(m.get("track"), _compile_when(m.get("when"))) for m in music]
+        self._music = music
+        self._next = [
+            (n, ()) if isinstance(n, str) else (n["scene"], _compile_when(n.get("when")))
+            for n in spec.get("next", [])
+        ]
+
+        self.blockers = array("i")
+        for r in spec.get("blockers", []):
+            self.blockers.extend(int(v) for v in r)
+
+        self.structures = {
+            key: Structure(*s["rect"], s["img"], s["bg"])
+            for key, s in spec.get("structures", {}).items()
+        }
+        refs = dict(actors)
+        refs.update(self.structures)
+
+        def ref_rect(ref):
+            if ref not in refs:
+                raise ValueError(f"level '{name}': unknown ref '{ref}'")
+            return refs[ref].rect
+
+        self.solid = [(ref_rect(s["ref"]), _compile_when(s.get("when"))) for s in spec.get("solid", [])]
+        self.triggers = [
+            (key, ref_rect(t["ref"]).inflate(t.get("pad", 0), t.get("pad", 0)), _compile_when(t.get("when")))
+            for key, t in spec.get("triggers", {}).items()
+        ]
+
+        self.spawns = {}
+        w, h = spawn_size
+        for key, s in spec.get("spawns", {}).items():
+            if isinstance(s, dict):
+                rect = ref_rect(s["near"])
+                x = rect.centerx + s.get("dx", 0)
+                y = rect.bottom + s.get("dy", 70)
+                x = max(0, min(bounds[0] - w, x))
+                y = max(0, min(bounds[1] - h, y))
+                self.spawns[key] = (x, y)
+            else:
+                self.spawns[key] = tuple(s)
+
+        self.flags = tuple(sorted({k for _, when in self.solid for k, _ in when}))
+        self._collision = CollisionIndex()
+
+    def static_rects(self):
+        b = self.blockers
+        return [pygame.Rect(b[i], b[i + 1], b[i + 2], b[i + 3]) for i in range(0, len(b), 4)]
+
+    def blocked_rects(self, flags):
+        return self.static_rects() + [r for r, when in self.solid if _matches(when, flags)]
+
+    def collision(self, flags):
+        key = tuple(bool(flags.get(f)) for f in self.flags)
+        return self._collision.get(key, lambda: self.blocked_rects(flags))
+
+    def active_triggers(self, rect, flags):
+        """
+        Names of the triggers whose zone `rect` overlaps and whose flags hold.
+        """
+        return {key for key, zone, when in self.triggers if _matches(when, flags) and zone.colliderect(rect)}
+
+    def music(self, flags):
+        if isinstance(self._music, list):
+            for track, when in self._music:
+                if _matches(when, flags):
+                    return track
+            return None
+        return self._music
+
+    def tracks(self):
+        """
+        Every track this scene can play, whatever the flags.
+        """
+        if isinstance(self._music, list):
+            return [track for track, _ in self._music if track]
+        return [self._music] if self._music else []
+
+    def next_scenes(self, flags):
+        return [scene for scene, when in self._next if _matches(when, flags)]
+
+    def stats(self):
+        return {"blockers": len(self.blockers) // 4, "triggers": len(self.triggers), **self._collision.stats()}
+
+
+def load_levels(path, actors=None, bounds=(0, 0), spawn_size=(0, 0)):
+    """
+    Read a level file and compile every scene. `actors` maps extra ref
+    names (NPCs created in code) to objects with a .rect.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != LEVEL_FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported level format version {data.get('version')!r}")
+    return {
+        name: Level(name, spec, actors or {}, bounds, spawn_size)
+        for name, spec in data.get("scenes", {}).items()
+    }
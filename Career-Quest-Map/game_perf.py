@@ -0,0 +1,93 @@
+import os
+import time
+
+
+# Set CQM_PERF=1 to print frame-time stats per game state.
+PERF_ENABLED = os.getenv("CQM_PERF", "0") == "1"
+PERF_REPORT_EVERY_S = float(os.getenv("CQM_PERF_EVERY", "5"))
+
+
+class FrameTimer:
+    """
+    Measures the CPU work of each frame (update + render + flip, not the
+    clock.tick sleep) and reports avg / p95 / max per state.
+    Does nothing unless enabled.
+    """
+
+    def __init__(self, enabled=PERF_ENABLED, report_every_s=PERF_REPORT_EVERY_S):
+        self.enabled = enabled
+        self.report_every_s = report_every_s
+        self._t0 = None
+        self._samples = {}
+        self._last_report = time.perf_counter()
+
+    def start(self):
+        if self.enabled:
+            self._t0 = time.perf_counter()
+
+    def end(self, label):
+        if not self.enabled or self._t0 is None:
+            return
+        now = time.perf_counter()
+        self._samples.setdefault(label, []).append((now - self._t0) * 1000.0)
+        self._t0 = None
+        if now - self._last_report >= self.report_every_s:
+            self.report()
+            self._last_report = now
+
+    def summary(self):
+        out = {}
+        for label, ms in self._samples.items():
+            s = sorted(ms)
+            out[label] = {
+                "frames": len(s),
+                "avg_ms": sum(s) / len(s),
+                "p95_ms": s[min(len(s) - 1, int(len(s) * 0.95))],
+                "max_ms": s[-1],
+            }
+        return out
+
+    def report(self, extra=None):
+        if not self.enabled or not self._samples:
+            return
+        for label, st in sorted(self.summary().items()):
+            print(
+                f"[perf] {label:<14} frames={st['frames']:<5} avg={st['avg_ms']:.2f}ms "
+                f"p95={st['p95_ms']:.2f}ms max={st['max_ms']:.2f}ms"
+            )
+        if extra:
+            print(f"[perf] {extra}")
+        self._samples = {}
+
+
+class StartupTimer:
+    """
+    Time-to-first-frame breakdown. mark() records a phase boundary;
+    finish() records the last one and prints the report once (when
+    CQM_PERF=1). Later calls to finish() are no-ops.
+    """
+
+    def __init__(self, enabled=PERF_ENABLED):
+        self.enabled = enabled
+        self._t0 = time.perf_counter()
+        self._last = self._t0
+        self.phases = []
+        self.done = False
+
+    def mark(self, label):
+        if self.done:
+            return
+        now = time.perf_counter()
+        self.phases.append((label, (now - self._last) * 1000.0))
+        self._last = now
+
+    def finish(self, label):
+        if self.done:
+            return
+        self.mark(label)
+        self.done = True
+        if not self.enabled:
+            return
+        total = (self._last - self._t0) * 1000.0
+        parts = " ".join(f"{label}={ms:.0f}ms" for label, ms in self.phases)
+        print(f"[startup] total={total:.0f}ms {parts}")
@@ -2,6 +2,9 @@ import pygame
 import pygame_widgets
 from pygame_widgets.textbox import TextBox
 
+from game_fonts import get_font
+from game_layers import surfaces
+from game_text import text_cache
 from print_questions import generate_part1_ui_questions, generate_part2_ui_questions
 
 
@@ -14,26 +17,12 @@ def draw_dialog_box(
     border=3,
     radius=18,
 ):
-    box = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(box, (*fill_color, alpha), box.get_rect(), border_radius=radius)
-    surface.blit(box, (rect.x, rect.y))
+    surface.blit(surfaces.box(rect.size, fill_color, alpha, radius), (rect.x, rect.y))
     pygame.draw.rect(surface, border_color, rect, border, border_radius=radius)
 
 
 def wrap_text(text, font, max_width):
-    words = text.split(" ")
-    lines = []
-    cur = ""
-    for w in words:
-        test = (cur + " " + w).strip()
-        if font.size(test)[0] <= max_width:
-            cur = test
-        else:
-            lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-    return lines
+    return text_cache.wrap(str(text), font, max_width, keep_empty=True)
 
 
 quiz_i = 0
@@ -74,49 +63,49 @@ def draw_quiz_screen(screen, font, bg, quiz, npc_name="NPC"):
     box_rect = pygame.Rect(40, 50, 720, 330)
     draw_dialog_box(screen, box_rect, fill_color=(10, 10, 10), alpha=210, border_color=(255, 255, 255))
 
-    name_surf = font.render(npc_name + ":", True, (255, 255, 255))
+    name_surf = text_cache.render(npc_name + ":", font, (255, 255, 255))
     screen.blit(name_surf, (box_rect.x + 20, box_rect.y + 15))
 
-    prompt_font = pygame.font.SysFont("Arial", 28)
-    lines = wrap_text(quiz.get("question", ""), prompt_font, box_rect.width - 40)
+    prompt_font = get_font("Arial", 28)
+    lines = text_cache.lines(str(quiz.get("question", "")), prompt_font, box_rect.width - 40, (230, 230, 230), keep_empty=True)
     y = box_rect.y + 60
-    for line in lines[:2]:
-        screen.blit(prompt_font.render(line, True, (230, 230, 230)), (box_rect.x + 20, y))
+    for surf in lines[:2]:
+        screen.blit(surf, (box_rect.x + 20, y))
         y += 32
 
     qtype = quiz.get("type")
-    hint_font = pygame.font.SysFont("Arial", 24)
+    hint_font = get_font("Arial", 24)
 
     if qtype == "multiple_choice":
         draw_multiple_choice(screen, box_rect, quiz)
-        hint = hint_font.render("Up/Down choose | Enter confirm | 1-9 quick | Q exit", True, (180, 180, 180))
+        hint = text_cache.render("Up/Down choose | Enter confirm | 1-9 quick | Q exit", hint_font, (180, 180, 180))
         screen.blit(hint, (box_rect.x + 20, box_rect.bottom + 170))
         return
 
     if qtype == "slider":
         draw_slider(screen, box_rect, quiz)
-        hint = hint_font.render("Left/Right change | Enter confirm | Q exit", True, (180, 180, 180))
+        hint = text_cache.render("Left/Right change | Enter confirm | Q exit", hint_font, (180, 180, 180))
         screen.blit(hint, (box_rect.x + 20, box_rect.bottom + 170))
         return
 
     if qtype == "rating":
         draw_rating(screen, box_rect, quiz)
-        hint = hint_font.render("Left/Right change | 1-5 quick | Enter confirm | Q exit", True, (180, 180, 180))
+        hint = text_cache.render("Left/Right change | 1-5 quick | Enter confirm | Q exit", hint_font, (180, 180, 180))
         screen.blit(hint, (box_rect.x + 20, box_rect.bottom + 170))
         return
 
     if qtype == "textinput":
         draw_textinput(screen, box_rect, quiz)
-        hint = hint_font.render("Type answer | Enter confirm | Q exit", True, (180, 180, 180))
+        hint = text_cache.render("Type answer | Enter confirm | Q exit", hint_font, (180, 180, 180))
         screen.blit(hint, (box_rect.x + 20, box_rect.bottom + 170))
         return
 
-    err = pygame.font.SysFont("Arial", 26).render(f"Unknown quiz type: {qtype}", True, (255, 100, 100))
+    err = get_font("Arial", 26).render(f"Unknown quiz type: {qtype}", True, (255, 100, 100))
     screen.blit(err, (box_rect.x + 20, box_rect.y + 150))
 
 
 def draw_multiple_choice(screen, box_rect, quiz):
-    opt_font = pygame.font.SysFont("Arial", 26)
+    opt_font = get_font("Arial", 26)
     options = quiz.get("answers", [])
     selected_idx = int(quiz.get("user_choice_index", 0))
     opt_y = box_rect.y + 120
@@ -130,7 +119,7 @@ def draw_multiple_choice(screen, box_rect, quiz):
 
         label = f"{i + 1}. {opt}"
         color = (255, 255, 0) if is_sel else (255, 255, 255)
-        screen.blit(opt_font.render(label, True, color), (opt_rect.x + 10, opt_rect.y + 5))
+        screen.blit(text_cache.render(label, opt_font, color), (opt_rect.x + 10, opt_rect.y + 5))
         opt_y += 50
 
 
@@ -152,8 +141,8 @@ def draw_slider(screen, box_rect, quiz):
     pygame.draw.circle(screen, (255, 255, 0), (knob_x, knob_y), 12)
     pygame.draw.circle(screen, (255, 255, 255), (knob_x, knob_y), 12, 2)
 
-    num_font = pygame.font.SysFont("Arial", 28)
-    label = num_font.render(f"{val}/{max_val}", True, (230, 230, 230))
+    num_font = get_font("Arial", 28)
+    label = text_cache.render(f"{val}/{max_val}", num_font, (230, 230, 230))
     screen.blit(label, (box_rect.x + 20, box_rect.y + 230))
 
 
@@ -167,6 +156,7 @@ def draw_rating(screen, box_rect, quiz):
     start_x = box_rect.x + 170
     gap = 95
     radius = 28
+    num_font = get_font("Arial", 24)
 
     for i in range(1, max_val + 1):
         cx = start_x + (i - 1) * gap
@@ -176,12 +166,11 @@ def draw_rating(screen, box_rect, quiz):
         pygame.draw.circle(screen, fill_color, (cx, center_y), radius)
         pygame.draw.circle(screen, border_color, (cx, center_y), radius, 3)
 
-        num_font = pygame.font.SysFont("Arial", 24)
-        num = num_font.render(str(i), True, (0, 0, 0) if filled else (220, 220, 220))
+        num = text_cache.render(str(i), num_font, (0, 0, 0) if filled else (220, 220, 220))
         screen.blit(num, (cx - num.get_width() // 2, center_y - num.get_height() // 2))
 
-    label_font = pygame.font.SysFont("Arial", 28)
-    label = label_font.render(f"Rating: {val}/5", True, (230, 230, 230))
+    label_font = get_font("Arial", 28)
+    label = text_cache.render(f"Rating: {val}/5", label_font, (230, 230, 230))
     screen.blit(label, (box_rect.x + 20, box_rect.y + 255))
 
 
@@ -200,8 +189,8 @@ def draw_textinput(screen, box_rect, quiz):
     tb.draw()
 
     if (tb.getText() or "").strip() == "" and placeholder:
-        ph_font = pygame.font.SysFont("Arial", 22)
-        ph = ph_font.render(f"Example: {placeholder}", True, (180, 180, 180))
+        ph_font = get_font("Arial", 22)
+        ph = text_cache.render(f"Example: {placeholder}", ph_font, (180, 180, 180))
         screen.blit(ph, (box_rect.x + 20, box_rect.y + 160))
 
 
@@ -326,23 +315,31 @@ def collect_answers_for_engine(quizzes):
     return out
 
 
-def load_part1_dynamic_quizzes(education_status, poly_course=None):
+def apply_part1_quizzes(part1_ui, payload):
     global quiz_questions_home, last_part1_payload
+    quiz_questions_home = part1_ui
+    last_part1_payload = payload if isinstance(payload, dict) else {}
+    reset_quiz_progress()
+
+
+def apply_part2_quizzes(part2_ui, payload):
+    global quiz_questions_wiseman, last_part2_payload
+    quiz_questions_wiseman = part2_ui
+    last_part2_payload = payload if isinstance(payload, dict) else {}
+    reset_quiz_progress()
+
+
+def load_part1_dynamic_quizzes(education_status, poly_course=None):
     part1_ui, payload = generate_part1_ui_questions(
         education_status=education_status,
         poly_course=poly_course,
     )
-    quiz_questions_home = part1_ui
-    last_part1_payload = payload if isinstance(payload, dict) else {}
-    reset_quiz_progress()
+    apply_part1_quizzes(part1_ui, payload)
 
 
 def load_part2_dynamic_quizzes(education_status, part1_answers):
-    global quiz_questions_wiseman, last_part2_payload
     part2_ui, payload = generate_part2_ui_questions(
         education_status=education_status,
         part1_answers=part1_answers,
     )
-    quiz_questions_wiseman = part2_ui
-    last_part2_payload = payload if isinstance(payload, dict) else {}
-    reset_quiz_progress()
+    apply_part2_quizzes(part2_ui, payload)
@@ -0,0 +1,93 @@
+def wrap_text(text, font, max_width, keep_empty=False):
+    """
+    Greedy word wrap, measuring each candidate line as a whole so kerning
+    is counted. Runs of spaces collapse. With keep_empty=True a first word
+    wider than max_width is preceded by an empty line (the quiz screen's
+    original behaviour).
+    """
+    words = str(text).split(" ")
+    lines = []
+    cur = ""
+    for w in words:
+        test = (cur + " " + w).strip()
+        if font.size(test)[0] <= max_width:
+            cur = test
+        else:
+            if cur or keep_empty:
+                lines.append(cur)
+            cur = w
+    if cur:
+        lines.append(cur)
+    return lines
+
+
+class TextLayoutCache:
+    """
+    Wrapped lines and rendered Surfaces keyed by (text, font, max_width, color).
+
+    Dialog text only changes when the player presses a key, so render
+    functions ask the cache instead of calling font.render every frame.
+    sync() is called once per frame with the current scene indices; when
+    they change the cache is dropped and the new page is laid out once.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._entries = {}
+        self._scene_key = None
+        self.hits = 0
+        self.misses = 0
+
+    def sync(self, scene_key):
+        if scene_key != self._scene_key:
+            self._scene_key = scene_key
+            self._entries.clear()
+
+    def clear(self):
+        self._entries.clear()
+
+    def _store(self, key, value):
+        if len(self._entries) >= self.max_entries:
+            self._entries.clear()
+        self._entries[key] = value
+        return value
+
+    def wrap(self, text, font, max_width, keep_empty=False):
+        key = (text, font, max_width, keep_empty)
+        lines = self._entries.get(key)
+        if lines is not None:
+            self.hits += 1
+            return lines
+        self.misses += 1
+        return self._store(key, wrap_text(text, font, max_width, keep_empty))
+
+    def lines(self, text, font, max_width, color, keep_empty=False):
+        """
+        Rendered Surfaces for `text` wrapped to max_width.
+        """
+        key = (text, font, max_width, color, keep_empty)
+        surfs = self._entries.get(key)
+        if surfs is not None:
+            self.hits += 1
+            return surfs
+        self.misses += 1
+        surfs = [font.render(ln, True, color) for ln in self.wrap(text, font, max_width, keep_empty)]
+        return self._store(key, surfs)
+
+    def render(self, text, font, color):
+        """
+        Single-line rendered Surface.
+        """
+        key = (text, font, 0, color)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        self.misses += 1
+        return self._store(key, font.render(text, True, color))
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
+text_cache = TextLayoutCache()
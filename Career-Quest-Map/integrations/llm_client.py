@@ -2,10 +2,37 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
-from langchain_openai import AzureChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
+from integrations.retry_policy import (
+    RETRYABLE,
+    CircuitBreaker,
+    Deadline,
+    DeadlineExceeded,
+    LLMCallError,
+    RetryPolicy,
+    classify,
+)
+
+if TYPE_CHECKING:
+    import httpx
+    from langchain_openai import AzureChatOpenAI
+
+
+# Shortest request worth sending before a deadline.
+MIN_REQUEST_S = 1.0
+
+
+def _messages(system_rules: str, user_prompt: str) -> list[Any]:
+    # langchain is imported on first use: it takes over a second to load
+    # and the game should not pay for it before the first frame.
+    from langchain_core.messages import HumanMessage, SystemMessage
+
+    return [
+        SystemMessage(content=system_rules),
+        HumanMessage(content=user_prompt),
+    ]
 
 
 class LLMClient:
@@ -15,6 +42,11 @@ class LLMClient:
     Important:
     Some Azure deployments only support the default temperature (1).
     So we do NOT set temperature at all.
+
+    Retries are owned by `retry_policy` (the SDK's own retries are turned
+    off) and every attempt reports to `breaker`, which may be shared.
+    Every HTTP request gets a timeout: `timeout_s`, or less when the
+    caller's Deadline is closer.
     """
 
     def __init__(
@@ -23,37 +55,152 @@ class LLMClient:
         api_key: str | None,
         api_version: str | None,
         deployment_name: str | None,
+        http_client: httpx.Client | None = None,
+        retry_policy: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        timeout_s: float = 30.0,
     ):
         self.enabled = bool(
             azure_endpoint and api_key and api_version and deployment_name)
+        self.deployment_name = deployment_name
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.timeout_s = timeout_s
 
         self._llm: Optional[AzureChatOpenAI] = None
         if self.enabled:
+            from langchain_openai import AzureChatOpenAI
+
             self._llm = AzureChatOpenAI(
                 azure_endpoint=azure_endpoint,
                 api_key=api_key,
                 api_version=api_version,
                 deployment_name=deployment_name,
+                # Shared keep-alive pool when provided (see core.engine_registry).
+                http_client=http_client,
+                # Retries and backoff happen in invoke_json.
+                max_retries=0,
+                timeout=timeout_s,
                 # Do not set temperature here.
             )
 
-    def invoke_json(self, system_rules: str, user_prompt: str, max_retries: int = 2) -> dict[str, Any]:
+    def _request_timeout(self, deadline: Deadline | None) -> float:
+        if deadline is None:
+            return self.timeout_s
+        remaining = deadline.remaining()
+        if remaining < min(MIN_REQUEST_S, self.timeout_s):
+            # Not enough time left for a model round-trip to finish.
+            raise DeadlineExceeded(f"LLM deadline of {deadline.seconds:g}s exceeded")
+        return min(self.timeout_s, remaining)
+
+    def invoke_json(
+        self,
+        system_rules: str,
+        user_prompt: str,
+        max_retries: int | None = None,
+        deadline: Deadline | None = None,
+        parse: Callable[[str], Any] = json.loads,
+    ) -> dict[str, Any]:
+        """
+        Call the model and parse its JSON, retrying per `retry_policy`.
+        `parse` turns the completion text into the payload; a ValueError
+        from it counts as a parse failure.
+
+        Raises CircuitOpenError (without a call) while the breaker is open,
+        DeadlineExceeded once `deadline` has passed, and LLMCallError once
+        the error is not retryable, the attempts are used up, or the next
+        backoff would overrun the retry budget or the deadline.
+        """
         if not self.enabled or not self._llm:
             raise RuntimeError(
                 "LLM is not configured. Check .env / AppConfig.")
 
-        messages = [
-            SystemMessage(content=system_rules),
-            HumanMessage(content=user_prompt),
-        ]
+        messages = _messages(system_rules, user_prompt)
+        policy = self.retry_policy
+        attempts = policy.max_attempts if max_retries is None else max_retries + 1
+        give_up_at = time.monotonic() + policy.budget_s
+        if deadline is not None:
+            give_up_at = min(give_up_at, deadline.at)
 
-        last_err: Exception | None = None
-        for _ in range(max_retries + 1):
+        for attempt in range(attempts):
+            timeout = self._request_timeout(deadline)
+            self.breaker.before_call()
             try:
-                res = self._llm.invoke(messages)
+                res = self._llm.invoke(messages, timeout=timeout)
                 text = (res.content or "").strip()
-                return json.loads(text)
+                out = parse(text)
+                self.breaker.record_success()
+                return out
             except Exception as e:
-                last_err = e
+                kind = classify(e)
+                self.breaker.record_failure(kind)
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceeded(f"LLM deadline of {deadline.seconds:g}s exceeded ({kind}): {e}") from e
+                if kind not in RETRYABLE or attempt + 1 >= attempts:
+                    raise LLMCallError(f"LLM JSON invoke failed ({kind}): {e}", kind) from e
+                delay = policy.delay_s(attempt, kind, e)
+                if time.monotonic() + delay > give_up_at:
+                    if deadline is not None and give_up_at == deadline.at:
+                        raise DeadlineExceeded(f"LLM deadline of {deadline.seconds:g}s leaves no time to retry ({kind}): {e}") from e
+                    raise LLMCallError(f"LLM JSON invoke gave up ({kind}, retry budget spent): {e}", kind) from e
+                time.sleep(delay)
+
+        raise LLMCallError("LLM JSON invoke made no attempts", "unknown")
+
+    def stream_json(
+        self,
+        system_rules: str,
+        user_prompt: str,
+        on_text: Callable[[str], None],
+        max_retries: int | None = None,
+        deadline: Deadline | None = None,
+        parse: Callable[[str], Any] = json.loads,
+    ) -> dict[str, Any]:
+        """
+        Like invoke_json, but streams the completion and hands each text
+        chunk to on_text as it arrives. If the stream breaks before any text
+        arrived, falls back to a normal invoke_json call. Once text has been
+        handed out it is never regenerated (a new completion would replace
+        what the player is reading): the received prefix is parsed as far as
+        it goes, or LLMCallError is raised for the caller to repair or fall
+        back.
+        """
+        if not self.enabled or not self._llm:
+            raise RuntimeError(
+                "LLM is not configured. Check .env / AppConfig.")
+
+        messages = _messages(system_rules, user_prompt)
 
-        raise RuntimeError(f"LLM JSON invoke failed: {last_err}")
+        timeout = self._request_timeout(deadline)
+        self.breaker.before_call()
+        parts: list[str] = []
+        try:
+            for chunk in self._llm.stream(messages, timeout=timeout):
+                text = chunk.content if isinstance(chunk.content, str) else ""
+                if text:
+                    parts.append(text)
+                    on_text(text)
+                if deadline is not None:
+                    # The HTTP timeout is per read, not for the whole stream.
+                    deadline.check()
+            out = parse("".join(parts).strip())
+            self.breaker.record_success()
+            return out
+        except DeadlineExceeded:
+            # A stream that outlives the deadline is a slow deployment.
+            self.breaker.record_failure("timeout")
+            raise
+        except Exception as e:
+            kind = classify(e)
+            self.breaker.record_failure(kind)
+            if parts:
+                if kind != "parse":
+                    try:
+                        return parse("".join(parts).strip())
+                    except ValueError:
+                        pass
+                raise LLMCallError(f"LLM stream failed after output began ({kind}): {e}", kind) from e
+            if kind not in RETRYABLE:
+                raise LLMCallError(f"LLM stream failed ({kind}): {e}", kind) from e
+            print(f"LLM stream failed ({kind}), retrying without streaming: {e}")
+        return self.invoke_json(system_rules, user_prompt, max_retries=max_retries, deadline=deadline, parse=parse)
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import email.utils
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+# ------------------------------------------------------------
+# Errors
+# ------------------------------------------------------------
+class LLMCallError(RuntimeError):
+    """
+    An LLM call that gave up. `kind` is the classify() result of the
+    last failure.
+    """
+
+    def __init__(self, message: str, kind: str):
+        super().__init__(message)
+        self.kind = kind
+
+
+class LLMUnavailableError(LLMCallError):
+    """
+    The model cannot answer in time. ContentEngine answers these from
+    the fallback / cached tier instead of failing the request.
+    """
+
+
+class CircuitOpenError(LLMUnavailableError):
+    """
+    Raised without calling the model while the circuit breaker is open.
+    """
+
+    def __init__(self, retry_in_s: float):
+        super().__init__(f"LLM circuit open, retry in {retry_in_s:.0f}s", "circuit_open")
+        self.retry_in_s = retry_in_s
+
+
+class DeadlineExceeded(LLMUnavailableError):
+    def __init__(self, message: str = "LLM deadline exceeded"):
+        super().__init__(message, "deadline")
+
+
+# ------------------------------------------------------------
+# Deadlines
+# ------------------------------------------------------------
+class Deadline:
+    """
+    Absolute point in time by which a generate_* call must return.
+
+    Created once per request and passed down, so retries, streaming and
+    the HTTP timeout of every attempt all share the same budget.
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.at
+
+    def check(self) -> None:
+        if self.expired():
+            raise DeadlineExceeded(f"LLM deadline of {self.seconds:g}s exceeded")
+
+
+# ------------------------------------------------------------
+# Classification
+# ------------------------------------------------------------
+# Kinds worth another attempt. "parse" is retried without a delay: the
+# service answered, the model just did not return clean JSON.
+RETRYABLE = frozenset({"rate_limit", "timeout", "server", "network", "parse", "unknown"})
+# Kinds that say the deployment is unusable right now; these trip the
+# breaker. Auth is not retried, but every following call would fail too.
+BREAKER_FAILURES = frozenset({"rate_limit", "timeout", "server", "network", "auth"})
+
+
+def _type_names(exc: BaseException) -> set:
+    return {t.__name__ for t in type(exc).__mro__}
+
+
+def classify(exc: BaseException) -> str:
+    """
+    One of: parse, rate_limit, timeout, auth, server, client, network, unknown.
+
+    Works on openai / httpx exceptions by duck typing so that neither has
+    to be imported before the first LLM call.
+    """
+    if isinstance(exc, (json.JSONDecodeError, ValueError)) and not hasattr(exc, "status_code"):
+        return "parse"
+    names = _type_names(exc)
+    if isinstance(exc, TimeoutError) or names & {"APITimeoutError", "TimeoutException"}:
+        return "timeout"
+
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        if status == 429:
+            return "rate_limit"
+        if status in (401, 403):
+            return "auth"
+        if status == 408:
+            return "timeout"
+        if status >= 500:
+            return "server"
+        return "client"
+
+    if names & {"APIConnectionError", "ConnectError", "NetworkError", "RemoteProtocolError"} or isinstance(exc, ConnectionError):
+        return "network"
+    return "unknown"
+
+
+def retry_after_s(exc: BaseException) -> Optional[float]:
+    """
+    Server-requested delay from Retry-After / retry-after-ms, if any.
+    """
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        ms = headers.get("retry-after-ms")
+        if ms is not None:
+            return max(0.0, float(ms) / 1000.0)
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            when = email.utils.parsedate_to_datetime(value)
+            return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+# ------------------------------------------------------------
+# Retry policy
+# ------------------------------------------------------------
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Jittered exponential backoff with a total time budget.
+
+    Attempt n (0-based) waits a random time in [0, base_delay_s * 2**n],
+    capped at max_delay_s ("full jitter", so concurrent gate workers do
+    not retry in lockstep). A Retry-After from the server replaces the
+    computed delay. If the next wait would overrun budget_s (or the
+    caller's Deadline, whichever is sooner) the call gives up at once,
+    which bounds the tail latency of any one call.
+    """
+
+    max_attempts: int = 3
+    base_delay_s: float = 0.5
+    max_delay_s: float = 8.0
+    budget_s: float = 20.0
+
+    def delay_s(self, attempt: int, kind: str, exc: Optional[BaseException] = None) -> float:
+        if kind == "parse":
+            return 0.0
+        server_delay = retry_after_s(exc) if exc is not None else None
+        if server_delay is not None:
+            return server_delay
+        return random.uniform(0.0, min(self.max_delay_s, self.base_delay_s * (2 ** attempt)))
+
+
+# ------------------------------------------------------------
+# Circuit breaker
+# ------------------------------------------------------------
+class CircuitBreaker:
+    """
+    Stops calling a failing deployment for a while.
+
+    After `failure_threshold` consecutive failures of a BREAKER_FAILURES
+    kind the circuit opens for `cooldown_s`; callers get
+    CircuitOpenError immediately. Once the cooldown has passed a single
+    probe call is let through: success closes the circuit, failure opens
+    it for another cooldown. Shared by all content worker threads.
+    """
+
+    def __init__(self, failure_threshold: int = 4, cooldown_s: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self.opens = 0
+        self.rejected = 0
+
+    def before_call(self) -> None:
+        """
+        Raise CircuitOpenError unless a call may go out now.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            wait = self._opened_at + self.cooldown_s - time.monotonic()
+            if wait <= 0 and not self._probing:
+                self._probing = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(max(0.0, wait))
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self, kind: str) -> None:
+        if kind in ("parse", "client"):
+            # The deployment answered (bad JSON, bad request): it is healthy.
+            self.record_success()
+            return
+        with self._lock:
+            if kind not in BREAKER_FAILURES and not self._probing:
+                return
+            # A failed probe always re-opens, whatever the kind, so the
+            # half-open state cannot outlive its one call.
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probing:
+                    self.opens += 1
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "open": self._opened_at is not None,
+                "consecutive_failures": self._failures,
+                "opens": self.opens,
+                "rejected": self.rejected,
+            }
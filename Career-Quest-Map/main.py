@@ -1,11 +1,31 @@
+from game_perf import FrameTimer, StartupTimer
+
+# Started before the heavy imports so the report covers them.
+startup_timer = StartupTimer()
+
 import pygame
 import pygame_widgets
 from pygame_widgets.textbox import TextBox
-import os
 
 from game_classes import *
 import game_quizes as gq
-from print_questions import generate_analysis, generate_gate_scene
+from game_assets import assets, load_image
+from game_audio import AudioManager
+from game_fonts import font_stats, get_font, get_preferred_font
+from game_layers import DirtyRectPresenter, FrameScheduler, LayerCompositor, surfaces
+from game_levels import load_levels
+from game_text import text_cache
+from core.content_pipeline import ContentPipeline
+from core.engine_registry import shutdown_engines
+from print_questions import (
+    generate_analysis,
+    generate_gate_scene,
+    generate_part1_ui_questions,
+    generate_part2_ui_questions,
+    generate_quick_analysis,
+)
+
+startup_timer.mark("imports")
 
 
 GATE_SCENE_STATE = "gate_scene"
@@ -37,6 +57,8 @@ show_analysis_overlay = False
 analysis_overlay_seen = False
 
 analysis_payload = {}
+# Locally scored analysis, used if the LLM analysis request fails.
+analysis_preanswer = None
 suggested_options = []
 gate_payload_cache = {}
 selected_gate_option = None
@@ -46,6 +68,10 @@ gate_yes_no_idx = 0
 gate_dragon_saved = {}
 active_portal_bg = None
 gates_prefetched = False
+gate_jobs = {}
+gate_partial_lines = {}
+gate_scene_streaming = False
+gate_generation = 0
 path_committed = False
 committed_path_option = None
 dragon_scene_lines = []
@@ -57,17 +83,20 @@ info_hub_exited_once = False
 
 DIALOG_PLAYER_POS = (130, 400)
 DIALOG_PLAYER_SIZE = (150, 150)
-audio_enabled = False
-opening_audio_path = None
-house_audio_path = None
-wiseman_audio_path = None
-chapter2_audio_path = None
-portal_interior_audio_path = None
-no_portal_audio_path = None
-dw_audio_path = None
-booth_audio_path = None
-final_scene_audio_path = None
-active_music_key = None
+NPC_PORTRAIT_SIZE = (200, 200)
+DRAGON_PORTRAIT_SIZE = (300, 300)
+
+# Background LLM work. The render loop polls these every frame.
+# Gate scenes get their own bounded pool so the three portals load side by side.
+GATE_PREFETCH_WORKERS = 3
+GATE_REQUEST_TIMEOUT_S = 45
+content_jobs = ContentPipeline(max_workers=2)
+gate_pipeline = ContentPipeline(max_workers=GATE_PREFETCH_WORKERS)
+loading_job = None
+loading_title = ""
+loading_bg = None
+loading_then = None
+loading_ready = None
 
 pygame.init()
 try:
@@ -77,234 +106,36 @@ except Exception as audio_init_err:
 
 screen = pygame.display.set_mode((GAME_WIDTH, GAME_HEIGHT))
 pygame.display.set_caption("Career Quest Map")
-font = pygame.font.SysFont("Arial", 32)
-
-bg_img = pygame.image.load("images/background.png")
-bg_img = pygame.transform.scale(bg_img, (GAME_WIDTH, GAME_HEIGHT))
-chapter2_bg = pygame.image.load("images/chapter2_bg.png")
-chapter2_bg = pygame.transform.scale(chapter2_bg, (GAME_WIDTH, GAME_HEIGHT))
-chapter2_bg_removed_portal = pygame.image.load("images/chapter2_bg_removed_portal.png")
-chapter2_bg_removed_portal = pygame.transform.scale(chapter2_bg_removed_portal, (GAME_WIDTH, GAME_HEIGHT))
-first_scene_bg = pygame.image.load("images/FirstScene.png")
-first_scene_bg = pygame.transform.scale(first_scene_bg, (GAME_WIDTH, GAME_HEIGHT))
-dw_scene_bg = pygame.image.load("images/dwScene.png")
-dw_scene_bg = pygame.transform.scale(dw_scene_bg, (GAME_WIDTH, GAME_HEIGHT))
-quest_booth_interior_bg = pygame.image.load("images/questBoothInterior.png")
-quest_booth_interior_bg = pygame.transform.scale(quest_booth_interior_bg, (GAME_WIDTH, GAME_HEIGHT))
-final_scene_bg = pygame.image.load("images/FinalScene.png")
-final_scene_bg = pygame.transform.scale(final_scene_bg, (GAME_WIDTH, GAME_HEIGHT))
-
-
-def _resolve_opening_audio():
-    candidates = [
-        "openingSceneAudio.mp3",
-        os.path.join("audio", "openingSceneAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_house_audio():
-    candidates = [
-        "houseAudio.mp3",
-        os.path.join("audio", "houseAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_wiseman_audio():
-    candidates = [
-        "wiseManAudio.mp3",
-        os.path.join("audio", "wiseManAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_chapter2_audio():
-    candidates = [
-        "seenPortalAudio.mp3",
-        os.path.join("audio", "seenPortalAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_portal_interior_audio():
-    candidates = [
-        "portalInteriorAudio.mp3",
-        os.path.join("audio", "portalInteriorAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_no_portal_audio():
-    candidates = [
-        "noPortalAudio.mp3",
-        os.path.join("audio", "noPortalAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_dw_audio():
-    candidates = [
-        "dwAudio.mp3",
-        os.path.join("audio", "dwAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_booth_audio():
-    candidates = [
-        "boothAudio.mp3",
-        os.path.join("audio", "boothAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
-
-
-def _resolve_final_scene_audio():
-    candidates = [
-        "finalSceneAudio.mp3",
-        os.path.join("audio", "finalSceneAudio.mp3"),
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
+font = get_font("Arial", 32)
+static_layers = LayerCompositor(screen)
+audio = AudioManager()
+presenter = DirtyRectPresenter()
+
+startup_timer.mark("display")
+
+# Full-screen backgrounds, loaded on first use (see the asset groups below).
+SCENE_BACKGROUNDS = {
+    "profile": "images/FirstScene.png",
+    "outside": "images/background.png",
+    "chapter2": "images/chapter2_bg.png",
+    "chapter2_no_portal": "images/chapter2_bg_removed_portal.png",
+    "dragon": "images/dwScene.png",
+    "booth": "images/questBoothInterior.png",
+    "final": "images/FinalScene.png",
+}
 
 
-def init_audio():
-    global audio_enabled, opening_audio_path, house_audio_path, wiseman_audio_path, chapter2_audio_path, portal_interior_audio_path, no_portal_audio_path, dw_audio_path, booth_audio_path, final_scene_audio_path
-    opening_audio_path = _resolve_opening_audio()
-    house_audio_path = _resolve_house_audio()
-    wiseman_audio_path = _resolve_wiseman_audio()
-    chapter2_audio_path = _resolve_chapter2_audio()
-    portal_interior_audio_path = _resolve_portal_interior_audio()
-    no_portal_audio_path = _resolve_no_portal_audio()
-    dw_audio_path = _resolve_dw_audio()
-    booth_audio_path = _resolve_booth_audio()
-    final_scene_audio_path = _resolve_final_scene_audio()
-    if opening_audio_path is None:
-        print("Audio file not found: openingSceneAudio.mp3")
-    if house_audio_path is None:
-        print("Audio file not found: houseAudio.mp3")
-    if wiseman_audio_path is None:
-        print("Audio file not found: wiseManAudio.mp3")
-    if chapter2_audio_path is None:
-        print("Audio file not found: seenPortalAudio.mp3")
-    if portal_interior_audio_path is None:
-        print("Audio file not found: portalInteriorAudio.mp3")
-    if no_portal_audio_path is None:
-        print("Audio file not found: noPortalAudio.mp3")
-    if dw_audio_path is None:
-        print("Audio file not found: dwAudio.mp3")
-    if booth_audio_path is None:
-        print("Audio file not found: boothAudio.mp3")
-    if final_scene_audio_path is None:
-        print("Audio file not found: finalSceneAudio.mp3")
-    if opening_audio_path is None and house_audio_path is None and wiseman_audio_path is None and chapter2_audio_path is None and portal_interior_audio_path is None and no_portal_audio_path is None and dw_audio_path is None and booth_audio_path is None and final_scene_audio_path is None:
-        audio_enabled = False
-        return
-    try:
-        pygame.mixer.music.set_volume(1.0)
-        audio_enabled = True
-    except Exception as audio_err:
-        print(f"Audio disabled: {audio_err}")
-        audio_enabled = False
+def scene_bg(name):
+    return load_image(SCENE_BACKGROUNDS[name], (GAME_WIDTH, GAME_HEIGHT))
 
 
-def set_background_music(music_key):
-    global active_music_key
-    if not audio_enabled:
-        return
-    if music_key == active_music_key:
-        return
-    try:
-        if music_key == "opening":
-            if opening_audio_path is None:
-                return
-            pygame.mixer.music.load(opening_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "house":
-            if house_audio_path is None:
-                return
-            pygame.mixer.music.load(house_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "wiseman":
-            if wiseman_audio_path is None:
-                return
-            pygame.mixer.music.load(wiseman_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "chapter2":
-            if chapter2_audio_path is None:
-                return
-            pygame.mixer.music.load(chapter2_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "portal_interior":
-            if portal_interior_audio_path is None:
-                return
-            pygame.mixer.music.load(portal_interior_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "chapter2_no_portal":
-            if no_portal_audio_path is None:
-                return
-            pygame.mixer.music.load(no_portal_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "dw":
-            if dw_audio_path is None:
-                return
-            pygame.mixer.music.load(dw_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "booth":
-            if booth_audio_path is None:
-                return
-            pygame.mixer.music.load(booth_audio_path)
-            pygame.mixer.music.play(-1)
-        elif music_key == "final_scene":
-            if final_scene_audio_path is None:
-                return
-            pygame.mixer.music.load(final_scene_audio_path)
-            pygame.mixer.music.play(-1)
-        else:
-            pygame.mixer.music.stop()
-        active_music_key = music_key
-    except Exception as music_err:
-        print(f"Music playback error: {music_err}")
-        active_music_key = None
-
+def _bg_spec(name):
+    return (SCENE_BACKGROUNDS[name], (GAME_WIDTH, GAME_HEIGHT), False)
 
-init_audio()
 
+audio.init()
+audio.prefetch("opening")
 
-def _load_preferred_font(candidates, size, italic=False):
-    for name in candidates:
-        font_path = pygame.font.match_font(name, italic=italic)
-        if font_path:
-            return pygame.font.Font(font_path, size)
-    # Serif fallback if preferred fonts are unavailable.
-    fallback = "Times New Roman"
-    return pygame.font.SysFont(fallback, size, italic=italic)
 
 profile_name_box = TextBox(
     screen,
@@ -347,6 +178,8 @@ education_rects = [
 ]
 
 clock = pygame.time.Clock()
+frame_timer = FrameTimer()
+frame_scheduler = FrameScheduler(clock)
 
 main_player = Player(x=GAME_WIDTH // 2, y=GAME_HEIGHT // 2, width=50, height=50, img_path="images/warrior/", speed=100)
 fedora = Player(x=GAME_WIDTH - 400, y=GAME_HEIGHT - 200, width=100, height=100, img_path="images/fedora/", speed=80)
@@ -354,99 +187,100 @@ wiseman = Player(x=GAME_WIDTH - 400, y=GAME_HEIGHT - 200, width=100, height=100,
 dragon_warrior = Player(x=GAME_WIDTH - 500, y=GAME_HEIGHT - 280, width=150, height=150, img_path="images/dragonWarrior/", speed=0)
 aung_gyi = Player(x=GAME_WIDTH - 500, y=GAME_HEIGHT - 280, width=100, height=100, img_path="images/aungGyi/", speed=0)
 
-home = Structure(GAME_WIDTH - 300, GAME_HEIGHT - 585, 150, 150, "images/house.png", "images/home_bg.png")
-wiseman_tent = Structure(GAME_WIDTH - 220, GAME_HEIGHT - 210, 65, 65, "images/wiseman/west.png", "images/TreeScene.png")
-exit_gate1 = Structure(GAME_WIDTH - 388, GAME_HEIGHT - 115, 60, 60, "images/gate.png", "images/home_bg.png")
-portal1 = Structure(GAME_WIDTH - 572, GAME_HEIGHT - 480, 65, 80, "images/1stGate.png", "images/innerG1.png")
-portal2 = Structure(GAME_WIDTH - 472, GAME_HEIGHT - 480, 30, 80, "images/2ndGate.png", "images/innerG2.png")
-portal3 = Structure(GAME_WIDTH - 410, GAME_HEIGHT - 480, 30, 80, "images/3rdGate.png", "images/innerG3.png")
-info_hub = Structure(GAME_WIDTH - 220, GAME_HEIGHT - 350, 100, 100, "images/questBooth.png", "images/home_bg.png")
-post_info_exit_gate = Structure(GAME_WIDTH - 470, GAME_HEIGHT - 80, 70, 70, "images/gate.png", "images/home_bg.png")
-
-WISEMAN_RETURN_SPAWN = (620, 390)
-
-# Static map blockers (manual rectangles). Add/adjust these over time.
-# Example: pygame.Rect(x, y, width, height)
-OUTSIDE_BLOCKED_RECTS = [
-    pygame.Rect(0, 0, 480, 150),
-    pygame.Rect(0, 150, 150, 100),
-    pygame.Rect(150, 150, 130, 50),
-    pygame.Rect(250, 200, 140, 40),
-    pygame.Rect(440, 150, 50, 50),
-    pygame.Rect(500, 200, 30, 20),
-    pygame.Rect(600, 220, 250, 100),
-    pygame.Rect(570, 320, 250, 10),
-
-    pygame.Rect(0, 320, 150, 100),
-    pygame.Rect(150, 350, 80, 100),
-    pygame.Rect(230, 320, 50, 200),
-
-    pygame.Rect(280, 320, 100, 50),
-    #pygame.Rect(375, 300, 30, 10),
-    pygame.Rect(410, 340, 10, 20),
-    pygame.Rect(280, 460, 220, 200),
-    pygame.Rect(480, 320, 5, 5),
-
-    pygame.Rect(280, 460, 220, 200),
-    pygame.Rect(600, 480, 50, 100),
-    pygame.Rect(650, 510, 180, 50),
-    pygame.Rect(750, 310, 80, 200),
-]
+# Scenes, blockers, structures, entry triggers, spawns and music live in
+# data/levels.json and are compiled once here.
+LEVELS_PATH = "data/levels.json"
+LEVELS = load_levels(
+    LEVELS_PATH,
+    actors={"dragon_warrior": dragon_warrior},
+    bounds=(GAME_WIDTH, GAME_HEIGHT),
+    spawn_size=main_player.rect.size,
+)
 
-CHAPTER2_BLOCKED_RECTS = [
-    pygame.Rect(0, 0, GAME_WIDTH, 180),
-    pygame.Rect(0, 150, 300, 100),
-    pygame.Rect(300, 150, 100, 120),
-    pygame.Rect(530, 210, 100, 50),
-    
-    pygame.Rect(0, 330, 410, 300),
-    pygame.Rect(490, 330, 380, 250),
+home = LEVELS[OUTSIDE].structures["home"]
+wiseman_tent = LEVELS[OUTSIDE].structures["wiseman_tent"]
+exit_gate1 = LEVELS[OUTSIDE].structures["exit_gate"]
+portal1 = LEVELS[CHAPTER2].structures["portal1"]
+portal2 = LEVELS[CHAPTER2].structures["portal2"]
+portal3 = LEVELS[CHAPTER2].structures["portal3"]
+info_hub = LEVELS[CHAPTER2].structures["info_hub"]
+post_info_exit_gate = LEVELS[CHAPTER2].structures["post_info_gate"]
+
+# Per-chapter asset groups. Nothing is decoded at import time except what
+# the profile screen needs; each group is prefetched in the background
+# one transition ahead of where it is first drawn.
+assets.define_group("chapter1", [
+    _bg_spec("outside"),
+    *home.asset_specs(),
+    *wiseman_tent.asset_specs(),
+    *exit_gate1.asset_specs(interior=False),
+    *main_player.asset_specs(walk=True),
+    main_player.portrait_spec("right", DIALOG_PLAYER_SIZE),
+    fedora.portrait_spec("left", NPC_PORTRAIT_SIZE),
+    wiseman.portrait_spec("left", NPC_PORTRAIT_SIZE),
+])
+assets.define_group("chapter2", [
+    _bg_spec("chapter2"),
+    _bg_spec("chapter2_no_portal"),
+    *portal1.asset_specs(interior=False),
+    *portal2.asset_specs(interior=False),
+    *portal3.asset_specs(interior=False),
+    *dragon_warrior.asset_specs(directions=("south",)),
+    *info_hub.asset_specs(interior=False),
+    *post_info_exit_gate.asset_specs(interior=False),
+])
+assets.define_group("interiors", [
+    *portal1.asset_specs(sprite=False),
+    *portal2.asset_specs(sprite=False),
+    *portal3.asset_specs(sprite=False),
+    aung_gyi.portrait_spec("left", NPC_PORTRAIT_SIZE),
+    dragon_warrior.portrait_spec("left", DRAGON_PORTRAIT_SIZE),
+    _bg_spec("dragon"),
+    _bg_spec("booth"),
+])
+assets.define_group("finale", [_bg_spec("final")])
+
+
+def preload_assets(*groups):
+    # Transitions are also a good moment to let go of decoded originals.
+    assets.drop_sources()
+    for name in groups:
+        assets.prefetch(name)
+
+
+preload_assets("chapter1")
+startup_timer.mark("sprites")
 
-    pygame.Rect(780, 180, 50, 150)
-]
-blocked_rects_by_state = {
-    OUTSIDE: OUTSIDE_BLOCKED_RECTS,
-    CHAPTER2: CHAPTER2_BLOCKED_RECTS,
-}
 SHOW_COLLISION_DEBUG = False
 
-def _spawn_near(rect, dx=0, dy=70):
-    x = rect.centerx + dx
-    y = rect.bottom + dy
-    x = max(0, min(GAME_WIDTH - main_player.rect.width, x))
-    y = max(0, min(GAME_HEIGHT - main_player.rect.height, y))
-    return (x, y)
-
-
-HOME_EXIT_SPAWN = _spawn_near(home.rect, dx=-180, dy=-50)
-WISEMAN_EXIT_SPAWN = _spawn_near(wiseman_tent.rect, dx=-110, dy=-40)
-CH1_GATE_EXIT_SPAWN = _spawn_near(exit_gate1.rect, dx=-40, dy=10)
+HOME_EXIT_SPAWN = LEVELS[OUTSIDE].spawns["home_exit"]
+WISEMAN_EXIT_SPAWN = LEVELS[OUTSIDE].spawns["wiseman_exit"]
+WISEMAN_RETURN_SPAWN = LEVELS[OUTSIDE].spawns["wiseman_return"]
+CH1_GATE_EXIT_SPAWN = LEVELS[OUTSIDE].spawns["gate_exit"]
 PORTAL_EXIT_SPAWNS = {
-    0: _spawn_near(portal1.rect, dx=60, dy=60),
-    1: _spawn_near(portal2.rect, dx=-15, dy=60),
-    2: _spawn_near(portal3.rect, dx=-70, dy=60),
+    0: LEVELS[CHAPTER2].spawns["portal1_exit"],
+    1: LEVELS[CHAPTER2].spawns["portal2_exit"],
+    2: LEVELS[CHAPTER2].spawns["portal3_exit"],
 }
-DRAGON_EXIT_SPAWN = _spawn_near(dragon_warrior.rect, dx=-60, dy=20)
-INFO_HUB_EXIT_SPAWN = _spawn_near(info_hub.rect, dx=-100, dy=-85)
+DRAGON_EXIT_SPAWN = LEVELS[CHAPTER2].spawns["dragon_exit"]
+INFO_HUB_EXIT_SPAWN = LEVELS[CHAPTER2].spawns["info_hub_exit"]
 
 
-def loading_screen(title, bg=None):
+def loading_screen(title, bg=None, animate=False):
     if bg is not None:
         screen.blit(bg, (0, 0))
     else:
         screen.fill(BLACK)
 
-    overlay = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 110))
-    screen.blit(overlay, (0, 0))
+    screen.blit(surfaces.shade((GAME_WIDTH, GAME_HEIGHT), BLACK, 110), (0, 0))
 
     # Chapters use a decorative serif; story quotes use italic serif.
     is_chapter_title = str(title).strip().lower().startswith("chapter")
-    loading_font = _load_preferred_font(
+    loading_font = get_preferred_font(
         candidates=["Mantinia Regular", "Mantinia", "Cinzel", "Garamond", "Georgia"],
         size=32,
         italic=False,
-    ) if is_chapter_title else _load_preferred_font(
+    ) if is_chapter_title else get_preferred_font(
         candidates=["Agmena", "Alegreya", "Palatino Linotype", "Georgia", "Garamond"],
         size=32,
         italic=True,
@@ -462,9 +296,28 @@ def loading_screen(title, bg=None):
     for i, line in enumerate(text_lines):
         txt = loading_font.render(line, True, WHITE)
         screen.blit(txt, (start_x, start_y + i * line_gap))
+    if animate:
+        # Cycle 1-3 dots while a background request is in flight.
+        dots = "." * (1 + (pygame.time.get_ticks() // 400) % 3)
+        screen.blit(loading_font.render(dots, True, WHITE), (start_x, start_y + len(text_lines) * line_gap))
+    presenter.invalidate()
     pygame.display.flip()
 
 
+def wait_for_job(title, bg, job, then=None, ready=None):
+    """
+    Show an animated loading screen until `job` finishes (or `ready()` is
+    true, if given), then run `then`. The job's own callbacks run first.
+    """
+    global loading_job, loading_title, loading_bg, loading_then, loading_ready
+    loading_job = job
+    loading_title = title
+    loading_bg = bg
+    loading_then = then
+    loading_ready = ready if ready is not None else job.done
+    loading_screen(title, bg=bg, animate=True)
+
+
 def map_education_for_engine(choice):
     if choice == "Secondary":
         return "Secondary School"
@@ -474,20 +327,7 @@ def map_education_for_engine(choice):
 
 
 def wrap_text(text, max_width, local_font):
-    words = str(text).split(" ")
-    lines = []
-    cur = ""
-    for w in words:
-        test = (cur + " " + w).strip()
-        if local_font.size(test)[0] <= max_width:
-            cur = test
-        else:
-            if cur:
-                lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-    return lines
+    return text_cache.wrap(str(text), local_font, max_width)
 
 
 def set_state(new_state, spawn_pos=None, title=None, facing=None, loading_ms=0):
@@ -508,13 +348,13 @@ def set_state(new_state, spawn_pos=None, title=None, facing=None, loading_ms=0):
     if title:
         bg = None
         if new_state == OUTSIDE:
-            bg = bg_img
+            bg = scene_bg("outside")
         elif new_state == HOME:
             bg = home.bg
         elif new_state == WISEMAN:
             bg = wiseman_tent.bg
         elif new_state == CHAPTER2:
-            bg = chapter2_bg_removed_portal if path_committed else chapter2_bg
+            bg = scene_bg("chapter2_no_portal") if path_committed else scene_bg("chapter2")
         elif new_state in (GATE_SCENE_STATE, DRAGON_SCENE_STATE, INFO_SCENE_STATE):
             bg = active_portal_bg if active_portal_bg is not None else home.bg
         loading_screen(title, bg=bg)
@@ -534,7 +374,7 @@ def _get_player_label():
 
 
 def draw_name_tag(surface, text, center_x, top_y, max_width=None, font_size=20):
-    tag_font = pygame.font.SysFont("Arial", font_size, bold=True)
+    tag_font = get_font("Arial", font_size, bold=True)
     raw_text = str(text)
     lines = wrap_text(raw_text, max_width, tag_font) if max_width else [raw_text]
     if not lines:
@@ -554,15 +394,17 @@ def draw_name_tag(surface, text, center_x, top_y, max_width=None, font_size=20):
     for txt in rendered:
         surface.blit(txt, (panel.x + (box_w - txt.get_width()) // 2, ty))
         ty += txt.get_height() + 4
+    return panel
 
 
 def draw_main_player(surface):
     main_player.draw(surface)
-    draw_name_tag(surface, _get_player_label(), main_player.rect.centerx, main_player.rect.y)
+    tag = draw_name_tag(surface, _get_player_label(), main_player.rect.centerx, main_player.rect.y)
+    return main_player.rect.union(tag)
 
 
 def draw_main_player_dialog(surface, pos=DIALOG_PLAYER_POS, size=DIALOG_PLAYER_SIZE):
-    sprite = pygame.transform.scale(main_player.img_right, size)
+    sprite = main_player.portrait("right", size)
     surface.blit(sprite, pos)
 
 
@@ -586,7 +428,7 @@ def draw_structure_label(surface, structure, text):
 
 
 def draw_enter_prompt(surface, target_rect, text="Press E to Enter"):
-    prompt_font = pygame.font.SysFont("Arial", 20, bold=True)
+    prompt_font = get_font("Arial", 20, bold=True)
     label = prompt_font.render(text, True, WHITE)
     pad_x, pad_y = 10, 6
     box_w = label.get_width() + pad_x * 2
@@ -599,38 +441,37 @@ def draw_enter_prompt(surface, target_rect, text="Press E to Enter"):
     pygame.draw.rect(surface, (0, 0, 0, 185), panel, border_radius=10)
     pygame.draw.rect(surface, WHITE, panel, 2, border_radius=10)
     surface.blit(label, (panel.x + pad_x, panel.y + pad_y))
+    return panel
 
 
-def draw_chapter2_labels():
-    label_font = pygame.font.SysFont("Arial", 20)
+def draw_chapter2_labels(surface):
+    label_font = get_font("Arial", 20)
     if path_committed:
-        t1 = label_font.render(f"Chosen Path: {committed_path_option or 'Unknown'}", True, WHITE)
-        t2 = label_font.render("Dragon Warrior has appeared.", True, WHITE)
-        t3 = label_font.render("Approach Dragon Warrior and press E for your quest.", True, WHITE)
-        screen.blit(t1, (40, 24))
-        screen.blit(t2, (40, 48))
-        screen.blit(t3, (40, 72))
+        t1 = text_cache.render(f"Chosen Path: {committed_path_option or 'Unknown'}", label_font, WHITE)
+        t2 = text_cache.render("Dragon Warrior has appeared.", label_font, WHITE)
+        t3 = text_cache.render("Approach Dragon Warrior and press E for your quest.", label_font, WHITE)
+        surface.blit(t1, (40, 24))
+        surface.blit(t2, (40, 48))
+        surface.blit(t3, (40, 72))
         if dragon_met:
-            t4 = label_font.render("Enter the house icon to review your path.", True, WHITE)
-            screen.blit(t4, (40, 96))
+            t4 = text_cache.render("Enter the house icon to review your path.", label_font, WHITE)
+            surface.blit(t4, (40, 96))
         return
 
-    hint_font = pygame.font.SysFont("Arial", 22)
-    hint = hint_font.render("Move to a portal and press E to enter | Q to return outside", True, WHITE)
-    screen.blit(hint, (40, 560))
+    hint_font = get_font("Arial", 22)
+    hint = text_cache.render("Move to a portal and press E to enter | Q to return outside", hint_font, WHITE)
+    surface.blit(hint, (40, 560))
 
 
 def render_analysis_overlay():
     panel = pygame.Rect(55, 45, 790, 510)
-    shade = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-    shade.fill((0, 0, 0, 140))
-    screen.blit(shade, (0, 0))
+    screen.blit(surfaces.shade((GAME_WIDTH, GAME_HEIGHT), BLACK, 140), (0, 0))
     pygame.draw.rect(screen, (15, 15, 30), panel, border_radius=16)
     pygame.draw.rect(screen, WHITE, panel, 3, border_radius=16)
 
-    title_font = pygame.font.SysFont("Arial", 30)
-    body_font = pygame.font.SysFont("Arial", 22)
-    screen.blit(title_font.render("Wise Man Analysis", True, (255, 220, 120)), (panel.x + 20, panel.y + 18))
+    title_font = get_font("Arial", 30)
+    body_font = get_font("Arial", 22)
+    screen.blit(text_cache.render("Wise Man Analysis", title_font, (255, 220, 120)), (panel.x + 20, panel.y + 18))
 
     y = panel.y + 70
     max_width = panel.width - 40
@@ -639,13 +480,13 @@ def render_analysis_overlay():
         nonlocal y
         if y > panel.bottom - 70:
             return
-        screen.blit(body_font.render(label, True, (180, 220, 255)), (panel.x + 20, y))
+        screen.blit(text_cache.render(label, body_font, (180, 220, 255)), (panel.x + 20, y))
         y += 28
         for item in values:
-            for ln in wrap_text(f"- {item}", max_width, body_font):
+            for surf in text_cache.lines(f"- {item}", body_font, max_width, WHITE):
                 if y > panel.bottom - 70:
                     return
-                screen.blit(body_font.render(ln, True, WHITE), (panel.x + 26, y))
+                screen.blit(surf, (panel.x + 26, y))
                 y += 24
         y += 6
 
@@ -653,7 +494,7 @@ def render_analysis_overlay():
     draw_section("Work Style Tags", [str(x) for x in analysis_payload.get("work_style_tags", [])] if isinstance(analysis_payload.get("work_style_tags"), list) else [])
     draw_section("Feedback", [str(x) for x in analysis_payload.get("feedback_lines", [])] if isinstance(analysis_payload.get("feedback_lines"), list) else [])
 
-    hint = body_font.render("Press Enter or Space to continue", True, (210, 210, 210))
+    hint = text_cache.render("Press Enter or Space to continue", body_font, (210, 210, 210))
     screen.blit(hint, (panel.x + 20, panel.bottom - 36))
 
 def build_gate_scene_lines(option_name, payload):
@@ -743,18 +584,18 @@ def render_gate_scene():
     box_rect = pygame.Rect(40, 50, 720, 330)
     gq.draw_dialog_box(screen, box_rect, fill_color=(10, 10, 10), alpha=210, border_color=(255, 255, 255))
 
-    title_font = pygame.font.SysFont("Arial", 28)
-    prompt_font = pygame.font.SysFont("Arial", 28)
-    hint_font = pygame.font.SysFont("Arial", 24)
-    screen.blit(title_font.render("The Sage:", True, WHITE), (box_rect.x + 20, box_rect.y + 15))
+    title_font = get_font("Arial", 28)
+    prompt_font = get_font("Arial", 28)
+    hint_font = get_font("Arial", 24)
+    screen.blit(text_cache.render("The Sage:", title_font, WHITE), (box_rect.x + 20, box_rect.y + 15))
 
     y = box_rect.y + 60
-    at_last = gate_scene_i >= max(0, len(gate_scene_lines) - 1)
+    at_last = not gate_scene_streaming and gate_scene_i >= max(0, len(gate_scene_lines) - 1)
     if at_last:
         current = gate_scene_lines[min(gate_scene_i, len(gate_scene_lines) - 1)] if gate_scene_lines else "Proceed?"
         current = _strip_speaker_prefix(current)
-        for ln in wrap_text(current, box_rect.width - 40, prompt_font)[:3]:
-            screen.blit(prompt_font.render(ln, True, (230, 230, 230)), (box_rect.x + 20, y))
+        for surf in text_cache.lines(current, prompt_font, box_rect.width - 40, (230, 230, 230))[:3]:
+            screen.blit(surf, (box_rect.x + 20, y))
             y += 36
         yes_rect = pygame.Rect(box_rect.x + 20, y + 8, 140, 48)
         no_rect = pygame.Rect(box_rect.x + 190, y + 8, 140, 48)
@@ -762,66 +603,68 @@ def render_gate_scene():
         pygame.draw.rect(screen, WHITE, yes_rect, 2, border_radius=10)
         pygame.draw.rect(screen, (90, 65, 65) if gate_yes_no_idx == 1 else (45, 45, 45), no_rect, border_radius=10)
         pygame.draw.rect(screen, WHITE, no_rect, 2, border_radius=10)
-        yes_txt = prompt_font.render("Yes", True, WHITE)
-        no_txt = prompt_font.render("No", True, WHITE)
+        yes_txt = text_cache.render("Yes", prompt_font, WHITE)
+        no_txt = text_cache.render("No", prompt_font, WHITE)
         screen.blit(yes_txt, (yes_rect.centerx - yes_txt.get_width() // 2, yes_rect.y + 8))
         screen.blit(no_txt, (no_rect.centerx - no_txt.get_width() // 2, no_rect.y + 8))
     else:
         current = gate_scene_lines[min(gate_scene_i, len(gate_scene_lines) - 1)] if gate_scene_lines else "I have no guidance for this gate yet."
         current = _strip_speaker_prefix(current)
-        for ln in wrap_text(current, box_rect.width - 40, prompt_font)[:6]:
-            screen.blit(prompt_font.render(ln, True, (230, 230, 230)), (box_rect.x + 20, y))
+        for surf in text_cache.lines(current, prompt_font, box_rect.width - 40, (230, 230, 230))[:6]:
+            screen.blit(surf, (box_rect.x + 20, y))
             y += 32
 
     draw_main_player_dialog(screen)
-    screen.blit(pygame.transform.scale(aung_gyi.img_left, (200, 200)), (500, 380))
+    screen.blit(aung_gyi.portrait("left", NPC_PORTRAIT_SIZE), (500, 380))
 
     if at_last:
         hint_text = "Left/Right choose Yes/No | Enter confirm | Q back to gates"
+    elif gate_scene_streaming and gate_scene_i >= len(gate_scene_lines) - 1:
+        hint_text = "The Sage is still speaking... | Q back to gates"
     elif gate_scene_i < max(0, len(gate_scene_lines) - 1):
         hint_text = "Left/Right back/next line | Q back to gates"
     else:
         hint_text = "Left/Right review lines | Q back to gates"
-    screen.blit(hint_font.render(hint_text, True, (180, 180, 180)), (box_rect.x + 20, box_rect.bottom + 170))
+    screen.blit(text_cache.render(hint_text, hint_font, (180, 180, 180)), (box_rect.x + 20, box_rect.bottom + 170))
 
 
 def render_dragon_scene():
-    bg = dw_scene_bg
+    bg = scene_bg("dragon")
     screen.blit(bg, (0, 0))
     box_rect = pygame.Rect(40, 50, 720, 330)
     gq.draw_dialog_box(screen, box_rect, fill_color=(10, 10, 10), alpha=210, border_color=(255, 255, 255))
 
-    title_font = pygame.font.SysFont("Arial", 28)
-    prompt_font = pygame.font.SysFont("Arial", 28)
-    hint_font = pygame.font.SysFont("Arial", 24)
-    screen.blit(title_font.render("Dragon Warrior:", True, WHITE), (box_rect.x + 20, box_rect.y + 15))
+    title_font = get_font("Arial", 28)
+    prompt_font = get_font("Arial", 28)
+    hint_font = get_font("Arial", 24)
+    screen.blit(text_cache.render("Dragon Warrior:", title_font, WHITE), (box_rect.x + 20, box_rect.y + 15))
 
     current = dragon_scene_lines[min(dragon_scene_i, len(dragon_scene_lines) - 1)] if dragon_scene_lines else "I await your chosen path."
     current = _strip_speaker_prefix(current)
     y = box_rect.y + 60
-    for ln in wrap_text(current, box_rect.width - 40, prompt_font)[:6]:
-        screen.blit(prompt_font.render(ln, True, (230, 230, 230)), (box_rect.x + 20, y))
+    for surf in text_cache.lines(current, prompt_font, box_rect.width - 40, (230, 230, 230))[:6]:
+        screen.blit(surf, (box_rect.x + 20, y))
         y += 32
 
     draw_main_player_dialog(screen)
-    screen.blit(pygame.transform.scale(dragon_warrior.img_left, (300, 300)), (500, 280))
+    screen.blit(dragon_warrior.portrait("left", DRAGON_PORTRAIT_SIZE), (500, 280))
 
     hint_text = "Left/Right back/next line | Q back to map" if dragon_scene_i < max(0, len(dragon_scene_lines) - 1) else "Left/Right review lines | Q back to map"
-    screen.blit(hint_font.render(hint_text, True, (180, 180, 180)), (box_rect.x + 20, box_rect.bottom + 170))
+    screen.blit(text_cache.render(hint_text, hint_font, (180, 180, 180)), (box_rect.x + 20, box_rect.bottom + 170))
 
 
 def render_info_scene():
-    bg = quest_booth_interior_bg
+    bg = scene_bg("booth")
     screen.blit(bg, (0, 0))
     box_rect = pygame.Rect(40, 50, 720, 330)
     gq.draw_dialog_box(screen, box_rect, fill_color=(10, 10, 10), alpha=210, border_color=(255, 255, 255))
 
-    title_font = pygame.font.SysFont("Arial", 30)
-    body_font = pygame.font.SysFont("Arial", 26)
-    hint_font = pygame.font.SysFont("Arial", 24)
+    title_font = get_font("Arial", 30)
+    body_font = get_font("Arial", 26)
+    hint_font = get_font("Arial", 24)
 
     page_title, page_lines = info_pages[min(info_page_i, len(info_pages) - 1)]
-    screen.blit(title_font.render(page_title, True, (255, 220, 120)), (box_rect.x + 20, box_rect.y + 18))
+    screen.blit(text_cache.render(page_title, title_font, (255, 220, 120)), (box_rect.x + 20, box_rect.y + 18))
 
     y = box_rect.y + 70
     for line in page_lines:
@@ -830,101 +673,126 @@ def render_info_scene():
             if y > box_rect.bottom - 25:
                 break
             text = f"- {ln}" if idx == 0 else ln
-            screen.blit(body_font.render(text, True, (230, 230, 230)), (box_rect.x + 20, y))
+            screen.blit(text_cache.render(text, body_font, (230, 230, 230)), (box_rect.x + 20, y))
             y += 30
         if y > box_rect.bottom - 25:
             break
 
     draw_main_player_dialog(screen)
 
-    screen.blit(hint_font.render(f"Page {info_page_i + 1}/{len(info_pages)}", True, (200, 200, 200)), (box_rect.x + 20, box_rect.bottom + 140))
-    screen.blit(hint_font.render("Left/Right change section | Q back to map", True, (180, 180, 180)), (box_rect.x + 20, box_rect.bottom + 170))
+    screen.blit(text_cache.render(f"Page {info_page_i + 1}/{len(info_pages)}", hint_font, (200, 200, 200)), (box_rect.x + 20, box_rect.bottom + 140))
+    screen.blit(text_cache.render("Left/Right change section | Q back to map", hint_font, (180, 180, 180)), (box_rect.x + 20, box_rect.bottom + 170))
 
-def render_outside_quest_hint():
-    hint_font = pygame.font.SysFont("Arial", 24)
+def render_outside_quest_hint(surface):
+    hint_font = get_font("Arial", 24)
     if not part1_done:
         msg = "Quest: Find the House on the Map"
     elif not chapter2_unlocked:
         msg = "Quest: Meet the Wise Man"
     else:
         msg = "Quest: Exit to Chapter II"
-    screen.blit(hint_font.render(msg, True, (255, 245, 170)), (24, 24))
+    surface.blit(text_cache.render(msg, hint_font, (255, 245, 170)), (24, 24))
+
+
+def build_outside_layer(surface):
+    surface.blit(scene_bg("outside"), (0, 0))
+    home.draw(surface)
+    draw_structure_label(surface, home, "The House")
+    if part1_done:
+        wiseman_tent.draw(surface)
+        draw_structure_label(surface, wiseman_tent, "The Wise Man")
+    if chapter2_unlocked:
+        exit_gate1.draw(surface)
+        draw_structure_label(surface, exit_gate1, "Exit Gate")
+
+
+def build_chapter2_layer(surface):
+    surface.blit(scene_bg("chapter2_no_portal") if path_committed else scene_bg("chapter2"), (0, 0))
+    if not path_committed:
+        portal1.draw(surface)
+        portal2.draw(surface)
+        portal3.draw(surface)
+        draw_structure_label(surface, portal1, get_portal_option(0))
+        draw_structure_label(surface, portal2, get_portal_option(1))
+        draw_structure_label(surface, portal3, get_portal_option(2))
+    else:
+        dragon_warrior.draw(surface)
+        draw_structure_label(surface, dragon_warrior, "Dragon Warrior")
+        if dragon_met:
+            info_hub.draw(surface)
+            draw_structure_label(surface, info_hub, "Info Hub")
+        if info_hub_exited_once:
+            post_info_exit_gate.draw(surface)
+            draw_structure_label(surface, post_info_exit_gate, "Exit Gate")
 
 
 def render_state():
+    """
+    Draw the current state to the back buffer. For map screens that can be
+    presented with dirty rects, returns the scene key; otherwise None.
+    """
     if state == OUTSIDE:
-        screen.blit(bg_img, (0, 0))
-        home.draw(screen)
-        draw_structure_label(screen, home, "The House")
-        if part1_done:
-            wiseman_tent.draw(screen)
-            draw_structure_label(screen, wiseman_tent, "The Wise Man")
-        if chapter2_unlocked:
-            exit_gate1.draw(screen)
-            draw_structure_label(screen, exit_gate1, "Exit Gate")
+        # The art that only changes with progression flags is baked; the
+        # quest hint stays above the prompts, as it always has.
+        layer_key = ("outside", part1_done, chapter2_unlocked)
+        static_layers.blit(layer_key, build_outside_layer)
         if can_enter_home:
-            draw_enter_prompt(screen, home.rect)
+            presenter.mark(draw_enter_prompt(screen, home.rect))
         elif can_enter_wiseman:
-            draw_enter_prompt(screen, wiseman_tent.rect)
+            presenter.mark(draw_enter_prompt(screen, wiseman_tent.rect))
         elif can_enter_exit_gate:
-            draw_enter_prompt(screen, exit_gate1.rect)
+            presenter.mark(draw_enter_prompt(screen, exit_gate1.rect))
         if SHOW_COLLISION_DEBUG:
             draw_blocked_rects_debug()
-        render_outside_quest_hint()
-        draw_main_player(screen)
-        return
+        render_outside_quest_hint(screen)
+        presenter.mark(draw_main_player(screen))
+        return layer_key
 
     if state == HOME:
         if gq.quiz_i < len(gq.quiz_questions_home):
             gq.draw_quiz_screen(screen, font, home.bg, gq.quiz_questions_home[gq.quiz_i], npc_name="Fedora")
             draw_main_player_dialog(screen)
-            screen.blit(pygame.transform.scale(fedora.img_left, (200, 200)), (500, 380))
+            screen.blit(fedora.portrait("left", NPC_PORTRAIT_SIZE), (500, 380))
         return
 
     if state == WISEMAN:
         if gq.quiz_i < len(gq.quiz_questions_wiseman):
             gq.draw_quiz_screen(screen, font, wiseman_tent.bg, gq.quiz_questions_wiseman[gq.quiz_i], npc_name="The Wise Man")
             draw_main_player_dialog(screen)
-            screen.blit(pygame.transform.scale(wiseman.img_left, (200, 200)), (500, 380))
+            screen.blit(wiseman.portrait("left", NPC_PORTRAIT_SIZE), (500, 380))
         return
 
     if state == CHAPTER2:
-        screen.blit(chapter2_bg_removed_portal if path_committed else chapter2_bg, (0, 0))
+        layer_key = (
+            "chapter2",
+            path_committed,
+            dragon_met,
+            info_hub_exited_once,
+            tuple(suggested_options),
+        )
+        static_layers.blit(layer_key, build_chapter2_layer)
         if not path_committed:
-            portal1.draw(screen)
-            portal2.draw(screen)
-            portal3.draw(screen)
-            draw_structure_label(screen, portal1, get_portal_option(0))
-            draw_structure_label(screen, portal2, get_portal_option(1))
-            draw_structure_label(screen, portal3, get_portal_option(2))
             if can_enter_portal1:
-                draw_enter_prompt(screen, portal1.rect)
+                presenter.mark(draw_enter_prompt(screen, portal1.rect))
             elif can_enter_portal2:
-                draw_enter_prompt(screen, portal2.rect)
+                presenter.mark(draw_enter_prompt(screen, portal2.rect))
             elif can_enter_portal3:
-                draw_enter_prompt(screen, portal3.rect)
+                presenter.mark(draw_enter_prompt(screen, portal3.rect))
         else:
-            dragon_warrior.draw(screen)
-            draw_structure_label(screen, dragon_warrior, "Dragon Warrior")
-            if dragon_met:
-                info_hub.draw(screen)
-                draw_structure_label(screen, info_hub, "Info Hub")
-            if info_hub_exited_once:
-                post_info_exit_gate.draw(screen)
-                draw_structure_label(screen, post_info_exit_gate, "Exit Gate")
             if can_enter_post_info_gate:
-                draw_enter_prompt(screen, post_info_exit_gate.rect)
+                presenter.mark(draw_enter_prompt(screen, post_info_exit_gate.rect))
             elif can_enter_info_hub:
-                draw_enter_prompt(screen, info_hub.rect)
+                presenter.mark(draw_enter_prompt(screen, info_hub.rect))
             elif can_enter_dragon_warrior:
-                draw_enter_prompt(screen, dragon_warrior.rect)
+                presenter.mark(draw_enter_prompt(screen, dragon_warrior.rect))
         if SHOW_COLLISION_DEBUG:
             draw_blocked_rects_debug()
-        draw_chapter2_labels()
-        draw_main_player(screen)
+        draw_chapter2_labels(screen)
+        presenter.mark(draw_main_player(screen))
         if show_analysis_overlay:
             render_analysis_overlay()
-        return
+            return None
+        return layer_key
 
     if state == GATE_SCENE_STATE:
         render_gate_scene()
@@ -939,12 +807,10 @@ def render_state():
         return
 
     if state == FINAL_SCENE_STATE:
-        screen.blit(final_scene_bg, (0, 0))
-        shade = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-        shade.fill((0, 0, 0, 70))
-        screen.blit(shade, (0, 0))
-        end_font = pygame.font.SysFont("Arial", 30, bold=True)
-        hint_font = pygame.font.SysFont("Arial", 24)
+        screen.blit(scene_bg("final"), (0, 0))
+        screen.blit(surfaces.shade((GAME_WIDTH, GAME_HEIGHT), BLACK, 70), (0, 0))
+        end_font = get_font("Arial", 30, bold=True)
+        hint_font = get_font("Arial", 24)
         msg = end_font.render("Victory! Your journey is complete.", True, WHITE)
         hint = hint_font.render("Press Q or ESC to quit.", True, WHITE)
         screen.blit(msg, (GAME_WIDTH // 2 - msg.get_width() // 2, 40))
@@ -952,16 +818,14 @@ def render_state():
         return
 
     if state == PROFILE:
-        screen.blit(first_scene_bg, (0, 0))
-        shade = pygame.Surface((GAME_WIDTH, GAME_HEIGHT), pygame.SRCALPHA)
-        shade.fill((0, 0, 0, 120))
-        screen.blit(shade, (0, 0))
+        screen.blit(scene_bg("profile"), (0, 0))
+        screen.blit(surfaces.shade((GAME_WIDTH, GAME_HEIGHT), BLACK, 120), (0, 0))
         screen.blit(font.render("Create Your Profile", True, WHITE), (240, 70))
         screen.blit(font.render("Name:", True, WHITE), (140, 170))
         profile_name_box.draw()
         screen.blit(font.render("Education:", True, WHITE), (140, 240))
 
-        small_font = pygame.font.SysFont("Arial", 24)
+        small_font = get_font("Arial", 24)
         for i, opt in enumerate(education_options):
             r = education_rects[i]
             pygame.draw.rect(screen, WHITE, r, 2)
@@ -977,101 +841,119 @@ def render_state():
         screen.blit(hint, (90, 540))
 
 
+def progress_flags():
+    # Flags the level file's `when` conditions can refer to.
+    return {
+        "part1_done": part1_done,
+        "chapter2_unlocked": chapter2_unlocked,
+        "path_committed": path_committed,
+        "dragon_met": dragon_met,
+        "info_hub_exited_once": info_hub_exited_once,
+    }
+
+
 def update_outside_interactions():
     global can_enter_home, can_enter_wiseman, can_enter_exit_gate
-    can_enter_home = main_player.rect.colliderect(home.rect.inflate(40, 40))
-    can_enter_wiseman = part1_done and main_player.rect.colliderect(wiseman_tent.rect.inflate(40, 40))
-    can_enter_exit_gate = chapter2_unlocked and main_player.rect.colliderect(exit_gate1.rect.inflate(40, 40))
+    hits = LEVELS[OUTSIDE].active_triggers(main_player.rect, progress_flags())
+    can_enter_home = "home" in hits
+    can_enter_wiseman = "wiseman" in hits
+    can_enter_exit_gate = "exit_gate" in hits
 
 
 def update_chapter2_interactions():
     global can_enter_portal1, can_enter_portal2, can_enter_portal3, can_enter_dragon_warrior, can_enter_info_hub, can_enter_post_info_gate
-    if path_committed:
-        can_enter_portal1 = False
-        can_enter_portal2 = False
-        can_enter_portal3 = False
-        can_enter_dragon_warrior = main_player.rect.colliderect(dragon_warrior.rect.inflate(30, 30))
-        can_enter_info_hub = dragon_met and main_player.rect.colliderect(info_hub.rect.inflate(40, 40))
-        can_enter_post_info_gate = info_hub_exited_once and main_player.rect.colliderect(post_info_exit_gate.rect.inflate(50, 50))
-        return
-    can_enter_portal1 = main_player.rect.colliderect(portal1.rect.inflate(40, 40))
-    can_enter_portal2 = main_player.rect.colliderect(portal2.rect.inflate(40, 40))
-    can_enter_portal3 = main_player.rect.colliderect(portal3.rect.inflate(40, 40))
-    can_enter_dragon_warrior = False
-    can_enter_info_hub = False
-    can_enter_post_info_gate = False
+    hits = LEVELS[CHAPTER2].active_triggers(main_player.rect, progress_flags())
+    can_enter_portal1 = "portal1" in hits
+    can_enter_portal2 = "portal2" in hits
+    can_enter_portal3 = "portal3" in hits
+    can_enter_dragon_warrior = "dragon_warrior" in hits
+    can_enter_info_hub = "info_hub" in hits
+    can_enter_post_info_gate = "post_info_gate" in hits
+
+
+def frame_is_animated():
+    # Everything else only changes on input (see FrameScheduler).
+    if loading_job is not None:
+        return True
+    if state == OUTSIDE:
+        return True
+    if state == CHAPTER2:
+        return not show_analysis_overlay
+    return state == GATE_SCENE_STATE and gate_scene_streaming
 
 
 def get_blocked_rects_for_state():
-    blocked = list(blocked_rects_by_state.get(state, []))
-
-    # Dynamic blockers based on progression/scene.
-    if state == OUTSIDE:
-        blocked.append(home.rect)
-        if part1_done:
-            blocked.append(wiseman_tent.rect)
-    elif state == CHAPTER2:
-        if not path_committed:
-            blocked.extend([portal1.rect, portal2.rect, portal3.rect])
-        else:
-            if dragon_met:
-                blocked.append(info_hub.rect)
-            if info_hub_exited_once:
-                blocked.append(post_info_exit_gate.rect)
-    return blocked
+    level = LEVELS.get(state)
+    return level.blocked_rects(progress_flags()) if level is not None else []
 
 
 def resolve_world_collision(prev_pos):
-    for rect in get_blocked_rects_for_state():
-        if main_player.rect.colliderect(rect):
-            main_player.rect.topleft = prev_pos
-            break
+    level = LEVELS.get(state)
+    if level is not None and level.collision(progress_flags()).collides(main_player.rect):
+        main_player.rect.topleft = prev_pos
 
 
 def draw_blocked_rects_debug():
-    # Static blockers from manual state lists
-    for r in blocked_rects_by_state.get(state, []):
-        pygame.draw.rect(screen, (255, 80, 80), r, 2)  # red
+    level = LEVELS.get(state)
+    if level is None:
+        return
+    # Static blockers red, progression-dependent ones blue.
+    for r in level.static_rects():
+        pygame.draw.rect(screen, (255, 80, 80), r, 2)
+    static = len(level.blockers) // 4
+    for r in get_blocked_rects_for_state()[static:]:
+        pygame.draw.rect(screen, (80, 180, 255), r, 2)
 
-    # Dynamic blockers added by progression/state
-    if state == OUTSIDE:
-        pygame.draw.rect(screen, (80, 180, 255), home.rect, 2)  # blue
-        if part1_done:
-            pygame.draw.rect(screen, (80, 180, 255), wiseman_tent.rect, 2)
-        if chapter2_unlocked:
-            pygame.draw.rect(screen, (80, 180, 255), exit_gate1.rect, 2)
-    elif state == CHAPTER2:
-        if not path_committed:
-            pygame.draw.rect(screen, (80, 180, 255), portal1.rect, 2)
-            pygame.draw.rect(screen, (80, 180, 255), portal2.rect, 2)
-            pygame.draw.rect(screen, (80, 180, 255), portal3.rect, 2)
-        elif dragon_met:
-            pygame.draw.rect(screen, (80, 180, 255), info_hub.rect, 2)
-            if info_hub_exited_once:
-                pygame.draw.rect(screen, (80, 180, 255), post_info_exit_gate.rect, 2)
+
+def _on_gate_generated(generation, key, payload):
+    if generation != gate_generation:
+        return
+    gate_payload_cache[key] = payload if isinstance(payload, dict) else {}
+
+
+def _on_gate_failed(generation, key, err):
+    if generation != gate_generation:
+        return
+    print(f"Gate scene failed for '{key}': {err}")
+
+
+def submit_gate_job(option_name):
+    """
+    Start generating one gate payload. Each option is its own job, so a slow
+    or failing gate never holds up the others; results land in
+    gate_payload_cache as soon as they arrive.
+    """
+    key = str(option_name)
+    generation = gate_generation
+    work_path = bool(player_education_status == "Poly" and player_poly_path_choice == "Work")
+    # Filled from the worker thread as info_dialog_lines stream in.
+    partial = []
+    gate_partial_lines[key] = partial
+    job = gate_pipeline.submit(
+        f"gate:{key}",
+        generate_gate_scene,
+        option_name=key,
+        work_path=work_path,
+        education_status=player_education_status,
+        poly_path_choice=player_poly_path_choice,
+        on_line=partial.append,
+        timeout=GATE_REQUEST_TIMEOUT_S,
+        on_done=lambda payload: _on_gate_generated(generation, key, payload),
+        on_error=lambda e: _on_gate_failed(generation, key, e),
+    )
+    gate_jobs[key] = job
+    return job
 
 
 def prefetch_all_gate_scenes():
-    global gate_payload_cache, gates_prefetched
+    global gates_prefetched
     if gates_prefetched:
         return
-    loading_screen("Chapter II : The Sacred Portals", bg=chapter2_bg)
-    work_path = bool(player_education_status == "Poly" and player_poly_path_choice == "Work")
     for option in suggested_options:
         key = str(option)
-        if key in gate_payload_cache:
+        if key in gate_payload_cache or key in gate_jobs:
             continue
-        try:
-            payload = generate_gate_scene(
-                option_name=key,
-                work_path=work_path,
-                education_status=player_education_status,
-                poly_path_choice=player_poly_path_choice,
-            )
-            if isinstance(payload, dict):
-                gate_payload_cache[key] = payload
-        except Exception as gate_err:
-            print(f"Prefetch gate scene failed for '{key}': {gate_err}")
+        submit_gate_job(key)
     gates_prefetched = True
 
 
@@ -1097,11 +979,13 @@ def handle_keydown_ch1(event):
         if not chapter2_unlocked:
             print("Finish Wise Man path first.")
             return
+        # Normally already started when the analysis arrived; no-op then.
+        prefetch_all_gate_scenes()
         set_state(CHAPTER2, (20, 260), "Chapter 2: The Portals", facing="right", loading_ms=3000)
 
 
 def handle_chapter2_enter():
-    global selected_gate_option, gate_scene_lines, gate_scene_i, gate_yes_no_idx, active_portal_bg
+    global selected_gate_option, active_portal_bg
     if can_enter_portal1:
         selected_gate_option = get_portal_option(0)
         active_portal_bg = portal1.bg
@@ -1114,26 +998,64 @@ def handle_chapter2_enter():
     else:
         return
 
-    if selected_gate_option not in gate_payload_cache:
-        loading_screen("A delayed gate awakens...", bg=active_portal_bg if active_portal_bg is not None else chapter2_bg)
-        work_path = bool(player_education_status == "Poly" and player_poly_path_choice == "Work")
-        try:
-            payload = generate_gate_scene(
-                option_name=selected_gate_option,
-                work_path=work_path,
-                education_status=player_education_status,
-                poly_path_choice=player_poly_path_choice,
-            )
-            gate_payload_cache[selected_gate_option] = payload if isinstance(payload, dict) else {}
-        except Exception as e:
-            print(f"Failed to generate gate scene: {e}")
+    enter_selected_gate()
+
+
+def enter_selected_gate(allow_fetch=True):
+    global gate_scene_lines, gate_scene_i, gate_yes_no_idx, gate_scene_streaming
+    key = selected_gate_option
+    job = gate_jobs.get(key)
+    streaming = key not in gate_payload_cache and job is not None and not job.done()
+    if key in gate_payload_cache or (streaming and gate_partial_lines.get(key)):
+        # Enter as soon as the first line is in; the rest keeps streaming.
+        gate_scene_streaming = streaming
+        gate_scene_lines = []
+        gate_scene_i = 0
+        gate_yes_no_idx = 0
+        refresh_gate_scene_lines()
+        set_state(GATE_SCENE_STATE)
+        return
+
+    bg = active_portal_bg if active_portal_bg is not None else scene_bg("chapter2")
+    if job is None or job.done():
+        if not allow_fetch:
             return
+        job = submit_gate_job(key)
+    wait_for_job(
+        "A delayed gate awakens...",
+        bg,
+        job,
+        then=lambda: enter_selected_gate(allow_fetch=False),
+        ready=lambda: job.done() or bool(gate_partial_lines.get(key)),
+    )
 
-    payload = gate_payload_cache.get(selected_gate_option, {})
-    gate_scene_lines = build_gate_scene_lines(selected_gate_option, payload if isinstance(payload, dict) else {})
-    gate_scene_i = 0
-    gate_yes_no_idx = 0
-    set_state(GATE_SCENE_STATE)
+
+def refresh_gate_scene_lines():
+    """
+    Rebuild gate_scene_lines while the selected gate is still streaming.
+    Once the full payload is cached the final lines (with salary, work style
+    and the Yes/No prompt) replace the streamed preview.
+    """
+    global gate_scene_lines, gate_scene_streaming
+    key = selected_gate_option
+    if key in gate_payload_cache:
+        payload = gate_payload_cache.get(key, {})
+        gate_scene_lines = build_gate_scene_lines(key, payload if isinstance(payload, dict) else {})
+        gate_scene_streaming = False
+        return
+    job = gate_jobs.get(key)
+    if job is None or job.done():
+        # Stream failed part-way; the error was already reported by the job.
+        gate_scene_streaming = False
+        streamed = list(gate_partial_lines.get(key, []))
+        if streamed:
+            # The player is reading these; finish the scene with them.
+            gate_payload_cache[key] = {"info_dialog_lines": streamed}
+            gate_scene_lines = build_gate_scene_lines(key, gate_payload_cache[key])
+            return
+        set_state(CHAPTER2, get_selected_portal_exit_spawn(), facing="down")
+        return
+    gate_scene_lines = build_gate_scene_lines(key, {"info_dialog_lines": list(gate_partial_lines.get(key, []))})[:-1]
 
 
 def handle_dragon_warrior_enter():
@@ -1168,7 +1090,6 @@ def get_selected_portal_exit_spawn():
 def handle_profile_events(event):
     global education_selected_idx
     global player_name, player_education_status, player_poly_course
-    global part1_ready
 
     if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
         mx, my = event.pos
@@ -1205,13 +1126,78 @@ def handle_profile_events(event):
         player_education_status = mapped_edu
         player_poly_course = poly_course
 
-        loading_screen("Chapter I : The Training Ground", bg=bg_img)
-        try:
-            gq.load_part1_dynamic_quizzes(education_status=player_education_status, poly_course=player_poly_course)
-            part1_ready = True
-            set_state(OUTSIDE, OUTSIDE_SPAWN, "Chapter I : Finding Yourself")
-        except Exception as e:
-            print(f"Failed to generate Part 1: {e}")
+        job = content_jobs.submit(
+            "part1",
+            generate_part1_ui_questions,
+            education_status=player_education_status,
+            poly_course=player_poly_course,
+            on_done=on_part1_generated,
+            on_error=lambda e: print(f"Failed to generate Part 1: {e}"),
+        )
+        preload_assets("chapter1")
+        wait_for_job("Chapter I : The Training Ground", scene_bg("outside"), job)
+
+
+def on_part1_generated(result):
+    global part1_ready
+    part1_ui, payload = result
+    gq.apply_part1_quizzes(part1_ui, payload)
+    part1_ready = True
+    set_state(OUTSIDE, OUTSIDE_SPAWN, "Chapter I : Finding Yourself")
+
+
+def on_part2_generated(result):
+    global part1_done, part2_ready
+    part2_ui, payload = result
+    gq.apply_part2_quizzes(part2_ui, payload)
+    part1_done = True
+    part2_ready = True
+    set_state(OUTSIDE, HOME_EXIT_SPAWN, facing="down")
+    gq.reset_quiz_progress()
+
+
+def on_part2_failed(e):
+    print(f"Failed to generate Part 2: {e}")
+    set_state(OUTSIDE, HOME_EXIT_SPAWN, facing="down")
+    gq.reset_quiz_progress()
+
+
+def on_analysis_generated(payload):
+    global analysis_payload, suggested_options, gate_payload_cache, gates_prefetched, gate_jobs, gate_partial_lines, gate_generation
+    global gate_dragon_saved, path_committed, committed_path_option, dragon_met, info_hub_exited_once
+    global chapter2_unlocked, analysis_overlay_seen, show_analysis_overlay
+    if not isinstance(payload, dict):
+        on_analysis_failed(ValueError("analysis payload must be dict"))
+        return
+    analysis_payload = payload
+    suggested_options = normalize_suggested_options(analysis_payload.get("suggested_options", []))
+    gate_payload_cache = {}
+    gates_prefetched = False
+    gate_jobs = {}
+    gate_partial_lines = {}
+    gate_generation += 1
+    gate_dragon_saved = {}
+    path_committed = False
+    committed_path_option = None
+    dragon_met = False
+    info_hub_exited_once = False
+    chapter2_unlocked = True
+    analysis_overlay_seen = False
+    show_analysis_overlay = False
+    # Speculative prefetch: the portals are known now, so warm them while
+    # the player is still walking to the Chapter I exit gate.
+    prefetch_all_gate_scenes()
+    set_state(OUTSIDE, WISEMAN_RETURN_SPAWN, "Return to Training Ground", facing="left")
+    gq.reset_quiz_progress()
+
+
+def on_analysis_failed(e):
+    print(f"Failed to generate analysis: {e}")
+    if analysis_preanswer is not None:
+        on_analysis_generated(analysis_preanswer)
+        return
+    set_state(OUTSIDE, WISEMAN_EXIT_SPAWN, facing="left")
+    gq.reset_quiz_progress()
 
 
 def get_active_quizzes():
@@ -1244,32 +1230,42 @@ def normalize_suggested_options(values):
 
 running = True
 while running:
-    dt = clock.tick(60) / 1000.0
-    events = pygame.event.get()
-
-    if state in (PROFILE, OUTSIDE):
-        set_background_music("opening")
-    elif state == HOME:
-        set_background_music("house")
-    elif state == WISEMAN:
-        set_background_music("wiseman")
-    elif state == CHAPTER2:
-        set_background_music("chapter2_no_portal" if path_committed else "chapter2")
-    elif state == GATE_SCENE_STATE:
-        set_background_music("portal_interior")
-    elif state == DRAGON_SCENE_STATE:
-        set_background_music("dw")
-    elif state == INFO_SCENE_STATE:
-        set_background_music("booth")
-    elif state == FINAL_SCENE_STATE:
-        set_background_music("final_scene")
-    else:
-        set_background_music(None)
+    dt, events = frame_scheduler.next_frame(frame_is_animated())
+    frame_timer.start()
+
+    # Music follows the level file; tracks of the scenes reachable from
+    # here are decoded in the background so the next switch is a crossfade.
+    level = LEVELS.get(state)
+    flags = progress_flags()
+    audio.play(level.music(flags) if level is not None else None)
+    if level is not None:
+        audio.prefetch(*(t for scene in level.next_scenes(flags) if scene in LEVELS for t in LEVELS[scene].tracks()))
+
+    content_jobs.poll()
+    gate_pipeline.poll()
+    if loading_job is not None and loading_ready():
+        then = loading_then
+        loading_job = None
+        loading_then = None
+        loading_ready = None
+        if then is not None:
+            then()
+    if loading_job is not None:
+        # Keep the window responsive while the LLM works in the background.
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+        loading_screen(loading_title, bg=loading_bg, animate=True)
+        continue
 
     for event in events:
         if event.type == pygame.QUIT:
             running = False
             continue
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED):
+            presenter.invalidate()
+        if loading_job is not None:
+            continue
 
         if state == PROFILE:
             pygame_widgets.update([event])
@@ -1299,46 +1295,44 @@ while running:
                         if gq.quiz_done:
                             if state == HOME:
                                 part1_answers = gq.collect_answers_for_engine(gq.quiz_questions_home)
-                                loading_screen("Fedora drew a quiet breath, and the next gate of questions slowly opened...", bg=bg_img)
-                                try:
-                                    gq.load_part2_dynamic_quizzes(education_status=player_education_status, part1_answers=part1_answers)
-                                    part1_done = True
-                                    part2_ready = True
-                                except Exception as e:
-                                    print(f"Failed to generate Part 2: {e}")
-                                set_state(OUTSIDE, HOME_EXIT_SPAWN, facing="down")
-                                gq.reset_quiz_progress()
+                                job = content_jobs.submit(
+                                    "part2",
+                                    generate_part2_ui_questions,
+                                    education_status=player_education_status,
+                                    part1_answers=part1_answers,
+                                    on_done=on_part2_generated,
+                                    on_error=on_part2_failed,
+                                )
+                                wait_for_job("Fedora drew a quiet breath, and the next gate of questions slowly opened...", scene_bg("outside"), job)
                             else:
                                 part2_answers = gq.collect_answers_for_engine(gq.quiz_questions_wiseman)
                                 inferred_fields = gq.last_part2_payload.get("inferred_fields", [])
                                 if not isinstance(inferred_fields, list):
                                     inferred_fields = []
                                 player_poly_path_choice = get_poly_path_choice(part2_answers)
-
-                                loading_screen("Beneath the magical tree, the Wise Man weighed your strengths in silence...", bg=wiseman_tent.bg)
                                 try:
-                                    analysis_payload = generate_analysis(
+                                    analysis_preanswer = generate_quick_analysis(
                                         education_status=player_education_status,
                                         poly_path_choice=player_poly_path_choice,
                                         inferred_fields=[str(x) for x in inferred_fields],
                                         part2_answers=part2_answers,
                                     )
-                                    suggested_options = normalize_suggested_options(analysis_payload.get("suggested_options", []))
-                                    gate_payload_cache = {}
-                                    gates_prefetched = False
-                                    gate_dragon_saved = {}
-                                    path_committed = False
-                                    committed_path_option = None
-                                    dragon_met = False
-                                    info_hub_exited_once = False
-                                    chapter2_unlocked = True
-                                    analysis_overlay_seen = False
-                                    show_analysis_overlay = False
-                                    set_state(OUTSIDE, WISEMAN_RETURN_SPAWN, "Return to Training Ground", facing="left")
-                                except Exception as e:
-                                    print(f"Failed to generate analysis: {e}")
-                                    set_state(OUTSIDE, WISEMAN_EXIT_SPAWN, facing="left")
-                                gq.reset_quiz_progress()
+                                except ValueError as e:
+                                    print(f"Local analysis unavailable: {e}")
+                                    analysis_preanswer = None
+
+                                job = content_jobs.submit(
+                                    "analysis",
+                                    generate_analysis,
+                                    education_status=player_education_status,
+                                    poly_path_choice=player_poly_path_choice,
+                                    inferred_fields=[str(x) for x in inferred_fields],
+                                    part2_answers=part2_answers,
+                                    on_done=on_analysis_generated,
+                                    on_error=on_analysis_failed,
+                                )
+                                preload_assets("chapter2", "interiors")
+                                wait_for_job("Beneath the magical tree, the Wise Man weighed your strengths in silence...", wiseman_tent.bg, job)
             else:
                 if state == HOME:
                     set_state(OUTSIDE, HOME_EXIT_SPAWN, facing="down")
@@ -1370,7 +1364,7 @@ while running:
                 if event.key == pygame.K_q:
                     set_state(CHAPTER2, get_selected_portal_exit_spawn(), facing="down")
                 else:
-                    is_guide_last = gate_scene_i >= max(0, len(gate_scene_lines) - 1)
+                    is_guide_last = not gate_scene_streaming and gate_scene_i >= max(0, len(gate_scene_lines) - 1)
                     if is_guide_last:
                         if event.key == pygame.K_LEFT:
                             gate_yes_no_idx = 0
@@ -1385,6 +1379,7 @@ while running:
                                         gate_dragon_saved[selected_gate_option] = dragon_payload
                                 path_committed = True
                                 committed_path_option = selected_gate_option
+                                preload_assets("finale")
                                 set_state(CHAPTER2, DRAGON_EXIT_SPAWN, "Path Chosen: Meet Dragon Warrior", facing="right")
                             else:
                                 set_state(CHAPTER2, get_selected_portal_exit_spawn(), facing="down")
@@ -1415,9 +1410,16 @@ while running:
                 if event.key in (pygame.K_q, pygame.K_ESCAPE):
                     running = False
 
+    if loading_job is not None:
+        # A job was started by this frame's input; the loading screen owns the display.
+        continue
+
     if state != PROFILE and state not in (HOME, WISEMAN):
         pygame_widgets.update(events)
 
+    if state == GATE_SCENE_STATE and gate_scene_streaming:
+        refresh_gate_scene_lines()
+
     if state == OUTSIDE:
         prev_pos = main_player.rect.topleft
         main_player.move(dt, GAME_WIDTH, GAME_HEIGHT)
@@ -1430,7 +1432,16 @@ while running:
             resolve_world_collision(prev_pos)
             update_chapter2_interactions()
 
-    render_state()
-    pygame.display.flip()
-
+    text_cache.sync((state, gate_scene_i, dragon_scene_i, info_page_i, gq.quiz_i))
+    scene_key = render_state()
+    presenter.present(scene_key)
+    frame_timer.end(state)
+    startup_timer.finish("first frame")
+
+frame_timer.report(extra=f"fonts {font_stats()} text {text_cache.stats()} layers {static_layers.stats()} present {presenter.stats()} surfaces {surfaces.stats()} frames {frame_scheduler.stats()} audio {audio.stats()} levels {dict((k, v.stats()) for k, v in LEVELS.items() if v.blockers)} assets {assets.memory_report()}")
+content_jobs.shutdown()
+gate_pipeline.shutdown()
+assets.shutdown()
+audio.shutdown()
+shutdown_engines()
 pygame.quit()
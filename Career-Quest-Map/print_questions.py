@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List
 
-from app.config import AppConfig
 from core.content_engine import ContentEngine
-from integrations.llm_client import LLMClient
+from core.engine_registry import get_engine
+from integrations.retry_policy import Deadline
 
 
 def _convert_question_for_ui(q: Dict[str, Any]) -> Dict[str, Any]:
@@ -79,31 +79,32 @@ def _convert_payload_for_ui(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 
 def _create_engine() -> ContentEngine:
-    cfg = AppConfig()
-    llm = LLMClient(
-        cfg.azure_endpoint,
-        cfg.azure_api_key,
-        cfg.azure_api_version,
-        cfg.azure_deployment,
-    )
-    return ContentEngine(llm)
+    # Process-wide engine; built lazily on first use and reused afterwards.
+    return get_engine()
+
+
+def _deadline(deadline_s: float | None) -> Deadline | None:
+    # None means the stage SLO from AppConfig applies.
+    return Deadline(deadline_s) if deadline_s is not None else None
 
 
 def generate_part1_ui_questions(
     education_status: str,
     poly_course: str | None = None,
+    deadline_s: float | None = None,
 ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
     engine = _create_engine()
-    payload = engine.gen_part1(education_status, poly_course)
+    payload = engine.gen_part1(education_status, poly_course, deadline=_deadline(deadline_s))
     return _convert_payload_for_ui(payload), payload
 
 
 def generate_part2_ui_questions(
     education_status: str,
     part1_answers: List[Dict[str, Any]],
+    deadline_s: float | None = None,
 ) -> tuple[List[Dict[str, Any]], Dict[str, Any]]:
     engine = _create_engine()
-    payload = engine.gen_part2(education_status, part1_answers)
+    payload = engine.gen_part2(education_status, part1_answers, deadline=_deadline(deadline_s))
     return _convert_payload_for_ui(payload), payload
 
 
@@ -112,6 +113,7 @@ def generate_analysis(
     poly_path_choice: str | None,
     inferred_fields: List[str],
     part2_answers: List[Dict[str, Any]],
+    deadline_s: float | None = None,
 ) -> Dict[str, Any]:
     engine = _create_engine()
     return engine.gen_analysis(
@@ -119,6 +121,22 @@ def generate_analysis(
         poly_path_choice=poly_path_choice,
         inferred_fields=inferred_fields,
         part2_answers=part2_answers,
+        deadline=_deadline(deadline_s),
+    )
+
+
+def generate_quick_analysis(
+    education_status: str,
+    poly_path_choice: str | None,
+    inferred_fields: List[str],
+    part2_answers: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    engine = _create_engine()
+    return engine.quick_analysis(
+        education_status=education_status,
+        poly_path_choice=poly_path_choice,
+        inferred_fields=inferred_fields,
+        part2_answers=part2_answers,
     )
 
 
@@ -127,6 +145,8 @@ def generate_gate_scene(
     work_path: bool,
     education_status: str | None = None,
     poly_path_choice: str | None = None,
+    on_line: Callable[[str], None] | None = None,
+    deadline_s: float | None = None,
 ) -> Dict[str, Any]:
     engine = _create_engine()
     return engine.gen_gate_scene(
@@ -134,6 +154,8 @@ def generate_gate_scene(
         work_path=work_path,
         education_status=education_status,
         poly_path_choice=poly_path_choice,
+        on_line=on_line,
+        deadline=_deadline(deadline_s),
     )
 
 
@@ -0,0 +1,115 @@
+"""
+Offline sprite-atlas builder for character folders under images/.
+
+For every folder with idle sprites (north/south/west/east.png) it packs
+the idle frames and any animation/walk_<dir>N.png frames into one sheet,
+atlas.png, on a uniform grid, and writes atlas.json with each frame's
+cell. Player loads the sheet with a single decode and cuts frames out as
+subsurfaces. Re-run after adding or changing frames.
+
+Usage (from the Career-Quest-Map directory):
+    python -m tools.build_atlases [--max-cell 128] [images/warrior ...]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from game_classes import ATLAS_VERSION
+
+
+IDLE_DIRECTIONS = ("north", "south", "west", "east")
+WALK_TOKENS = ("north", "south", "left", "right")
+
+
+def _walk_frames(char_dir: str, token: str) -> List[str]:
+    anim_dir = os.path.join(char_dir, "animation")
+    if not os.path.isdir(anim_dir):
+        return []
+    pattern = re.compile(rf"^walk_{re.escape(token)}(\d+)\.png$", re.IGNORECASE)
+    matches = []
+    for fn in os.listdir(anim_dir):
+        m = pattern.match(fn)
+        if m:
+            matches.append((int(m.group(1)), fn))
+    matches.sort(key=lambda item: item[0])
+    return [os.path.join(anim_dir, fn) for _, fn in matches]
+
+
+def build_atlas(char_dir: str, max_cell: int) -> Optional[Tuple[str, int]]:
+    idle = [os.path.join(char_dir, f"{d}.png") for d in IDLE_DIRECTIONS]
+    if not all(os.path.isfile(p) for p in idle):
+        return None
+
+    # One grid row for the idle frames, then one row per walk direction
+    # that has frames.
+    walk = {t: _walk_frames(char_dir, t) for t in WALK_TOKENS}
+    rows: List[List[str]] = [idle] + [walk[t] for t in WALK_TOKENS if walk[t]]
+    images: Dict[str, pygame.Surface] = {p: pygame.image.load(p) for row in rows for p in row}
+
+    # Player scales every frame to its square render size anyway, so frames
+    # are normalized to one square cell no larger than max_cell.
+    largest = max(max(img.get_size()) for img in images.values())
+    cell = min(max_cell, largest)
+    cols = max(len(r) for r in rows)
+
+    sheet = pygame.Surface((cols * cell, len(rows) * cell), pygame.SRCALPHA)
+    sheet.fill((0, 0, 0, 0))
+    for r, row in enumerate(rows):
+        for c, path in enumerate(row):
+            img = images[path]
+            if img.get_size() != (cell, cell):
+                img = pygame.transform.smoothscale(img.convert_alpha(), (cell, cell))
+            sheet.blit(img, (c * cell, r * cell))
+
+    index = {
+        "version": ATLAS_VERSION,
+        "cell": cell,
+        "grid": [cols, len(rows)],
+        "idle": {d: [c, 0] for c, d in enumerate(IDLE_DIRECTIONS)},
+        "walk": {},
+    }
+    row = 1
+    for t in WALK_TOKENS:
+        index["walk"][t] = [[c, row] for c in range(len(walk[t]))]
+        if walk[t]:
+            row += 1
+    sheet_path = os.path.join(char_dir, "atlas.png")
+    pygame.image.save(sheet, sheet_path)
+    with open(os.path.join(char_dir, "atlas.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+        f.write("\n")
+    return sheet_path, len(images)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("dirs", nargs="*", help="character folders (default: every folder under images/)")
+    parser.add_argument("--max-cell", type=int, default=128, help="largest cell edge in pixels")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    dirs = args.dirs or sorted(
+        os.path.join("images", d) for d in os.listdir("images") if os.path.isdir(os.path.join("images", d))
+    )
+    for d in dirs:
+        result = build_atlas(d, args.max_cell)
+        if result is None:
+            print(f"skip   {d} (no idle sprites)")
+            continue
+        sheet_path, frames = result
+        print(f"built  {sheet_path}: {frames} frames, {os.path.getsize(sheet_path) // 1024} KB")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()